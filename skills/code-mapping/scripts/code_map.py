@@ -22,8 +22,7 @@ def cmd_validate(args: list[str]) -> int:
         return 1
 
     from validate import (
-        check_code_links,
-        check_file_links,
+        check_links_with_counts,
         check_size_limits,
         check_structure,
     )
@@ -49,38 +48,27 @@ def cmd_validate(args: list[str]) -> int:
     else:
         print("Structure: OK")
 
+    # File and code links are checked in a single pass over the map
+    link_errors, link_count, code_link_count = check_links_with_counts(map_dir)
+
     # File links check
-    file_link_errors = check_file_links(map_dir)
+    file_link_errors = [e for e in link_errors if e.error_type == "broken_link"]
     if file_link_errors:
         print("File links: FAIL")
         for err in file_link_errors:
             print(f"  {err.file}:{err.line} - {err.message}")
         all_errors.extend(file_link_errors)
     else:
-        import re
-
-        link_count = 0
-        for md_file in map_dir.rglob("*.md"):
-            content = md_file.read_text()
-            link_count += len(re.findall(r"\[[^\]]+\]\([^)]+\)", content))
         print(f"File links: OK ({link_count} checked)")
 
     # Code links check
-    code_link_errors = check_code_links(map_dir)
+    code_link_errors = [e for e in link_errors if e.error_type == "broken_symbol"]
     if code_link_errors:
         print("Code links: FAIL")
         for err in code_link_errors:
             print(f"  {err.file}:{err.line} - {err.message}")
         all_errors.extend(code_link_errors)
     else:
-        import re
-
-        code_link_count = 0
-        for md_file in map_dir.rglob("*.md"):
-            content = md_file.read_text()
-            # Count symbol links [`sym`](path#L42) and [Source](path#L42)
-            code_link_count += len(re.findall(r"\[`[^`]+`\]\([^)]+#L\d+\)", content))
-            code_link_count += len(re.findall(r"\[Source\]\([^)]+#L\d+\)", content))
         print(f"Code links: OK ({code_link_count} checked, AST)")
 
     # Size limits check
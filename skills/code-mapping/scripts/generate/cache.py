@@ -0,0 +1,118 @@
+"""Persistent content-hash cache of parsed source modules.
+
+Entries live under ``<map_dir>/.cache/symbols/`` and are keyed by a hash of
+the source bytes, so an unchanged file is never re-parsed on later runs.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from .models import ExtractedSymbol, SymbolKind
+from .parser import extract_module_source
+
+CACHE_DIR = Path(".cache") / "symbols"
+
+# Bump when the parser output or entry format changes to invalidate old entries
+_CACHE_VERSION = b"1"
+
+
+class ParseCache:
+    """Cache of (symbols, module docstring) keyed by source content hash."""
+
+    def __init__(self, map_dir: Path):
+        """Initialize the cache for a map directory.
+
+        Args:
+            map_dir: Map directory; entries are stored under map_dir/.cache/.
+        """
+        self.cache_dir = map_dir / CACHE_DIR
+        self._used: set[str] = set()
+
+    def extract_module(
+        self, source_path: Path
+    ) -> tuple[list[ExtractedSymbol], str | None]:
+        """Extract symbols and module docstring, reusing a cached parse if any.
+
+        Args:
+            source_path: Path to the Python file.
+
+        Returns:
+            Tuple of (symbols, module docstring or None).
+        """
+        try:
+            source = source_path.read_bytes()
+        except OSError:
+            return [], None
+
+        digest = hashlib.blake2b(_CACHE_VERSION, digest_size=16)
+        digest.update(source)
+        key = digest.hexdigest()
+        self._used.add(key)
+
+        entry = self.cache_dir / f"{key}.json"
+        cached = _read_entry(entry)
+        if cached is not None:
+            return cached
+
+        symbols, docstring = extract_module_source(source, str(source_path))
+        _write_entry(entry, symbols, docstring)
+        return symbols, docstring
+
+    def prune(self) -> None:
+        """Delete entries that were not used during this run."""
+        if not self.cache_dir.exists():
+            return
+        for entry in self.cache_dir.glob("*.json"):
+            if entry.stem not in self._used:
+                entry.unlink(missing_ok=True)
+
+
+def _read_entry(entry: Path) -> tuple[list[ExtractedSymbol], str | None] | None:
+    """Load a cache entry, or None if it is missing or unreadable."""
+    try:
+        data = json.loads(entry.read_text())
+        symbols = [
+            ExtractedSymbol(
+                name=s["name"],
+                kind=SymbolKind(s["kind"]),
+                line=s["line"],
+                parent=s["parent"],
+                docstring=s["docstring"],
+                signature=s["signature"],
+            )
+            for s in data["symbols"]
+        ]
+        return symbols, data["docstring"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_entry(
+    entry: Path, symbols: list[ExtractedSymbol], docstring: str | None
+) -> None:
+    """Write a cache entry atomically; failures only cost a re-parse later."""
+    data = {
+        "docstring": docstring,
+        "symbols": [
+            {
+                "name": s.name,
+                "kind": s.kind.value,
+                "line": s.line,
+                "parent": s.parent,
+                "docstring": s.docstring,
+                "signature": s.signature,
+            }
+            for s in symbols
+        ],
+    }
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        gitignore = entry.parent.parent / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("# Generated by code_map.py\n*\n")
+        tmp = entry.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data))
+        tmp.replace(entry)
+    except OSError:
+        pass
@@ -1,16 +1,24 @@
 """Main orchestrator for code map generation."""
 
+import io
+import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
+from typing import IO
 
+from .cache import ParseCache
 from .differ import parse_existing_map
 from .models import ChangeReport, MapFile, MissingDocstring, Section, SymbolKind
-from .parser import extract_symbols
+from .parser import extract_module
 from .renderer import compute_relative_path, is_placeholder, make_placeholder
-from .templates import render_template
+from .templates import load_template, render_template
 
+# Docstring item line inside Args/Returns/Raises: "    name (type): description"
+_DOC_ITEM_PATTERN = re.compile(r"^\s{4}(\w+)(?:\s*\([^)]+\))?:\s*(.*)$")
 
-@dataclass
+
+@dataclass(slots=True)
 class GeneratorConfig:
     """Configuration for map generation."""
 
@@ -20,14 +28,16 @@ class GeneratorConfig:
     project_description: str = "<!-- TODO: Describe this project -->"
     src_glob: str = "**/*.py"
     dry_run: bool = False
+    use_cache: bool = True  # Reuse parsed symbols from map_dir/.cache/
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceModule:
     """Represents a source file and its extracted symbols."""
 
     source_path: Path  # Relative to src_dir
     symbols: list  # List of ExtractedSymbol
+    docstring: str | None = None  # Module docstring
 
 
 def generate_maps(config: GeneratorConfig) -> tuple[ChangeReport, list[MapFile]]:
@@ -65,13 +75,21 @@ def generate_maps(config: GeneratorConfig) -> tuple[ChangeReport, list[MapFile]]
         if f.name != "__init__.py" and "__pycache__" not in str(f)
     ]
 
-    # Extract symbols from all source files
+    # Extract symbols from all source files (cached by content hash)
+    cache = ParseCache(map_dir) if config.use_cache and not config.dry_run else None
     modules: list[SourceModule] = []
     for source_path in source_files:
         rel_src = source_path.relative_to(src_dir)
-        symbols = extract_symbols(source_path)
+        if cache:
+            symbols, module_doc = cache.extract_module(source_path)
+        else:
+            symbols, module_doc = extract_module(source_path)
         if symbols:
-            modules.append(SourceModule(source_path=rel_src, symbols=symbols))
+            modules.append(
+                SourceModule(source_path=rel_src, symbols=symbols, docstring=module_doc)
+            )
+    if cache:
+        cache.prune()
 
     # Use source directory as temporary grouping for module file paths
     # Domains are NOT auto-generated - agent should create them semantically
@@ -120,13 +138,24 @@ def generate_maps(config: GeneratorConfig) -> tuple[ChangeReport, list[MapFile]]
         # Parse existing module file for description preservation
         existing_module = parse_existing_map(map_dir / module_path)
 
-        module_content, sections = _render_module_md(
-            module, domain_id, src_dir, map_dir, existing_module
-        )
-
-        if not config.dry_run:
-            (map_dir / module_path).parent.mkdir(parents=True, exist_ok=True)
-            (map_dir / module_path).write_text(module_content)
+        if config.dry_run:
+            sections = _render_module_md(
+                module, domain_id, src_dir, map_dir, io.StringIO(), existing_module
+            )
+        else:
+            target = map_dir / module_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Render beside the map and swap it in, so a failed render never
+            # leaves the existing map (parsed above) truncated
+            tmp = target.with_name(f".{target.name}.tmp")
+            try:
+                with tmp.open("w") as out:
+                    sections = _render_module_md(
+                        module, domain_id, src_dir, map_dir, out, existing_module
+                    )
+                os.replace(tmp, target)
+            finally:
+                tmp.unlink(missing_ok=True)
 
         if module_path not in existing_files:
             report.created_files.append(module_path)
@@ -220,8 +249,6 @@ def _parse_docstring_sections(
     if not docstring:
         return result
 
-    import re
-
     lines = docstring.split("\n")
     current_section = None
     current_item = None
@@ -264,7 +291,7 @@ def _parse_docstring_sections(
 
         if current_section:
             # Parse item lines like "param_name: Description"
-            item_match = re.match(r"^\s{4}(\w+)(?:\s*\([^)]+\))?:\s*(.*)$", line)
+            item_match = _DOC_ITEM_PATTERN.match(line)
             if item_match:
                 flush_item()
                 current_item = item_match.group(1)
@@ -284,24 +311,41 @@ def _render_module_md(
     domain_id: str,
     src_dir: Path,
     map_dir: Path,
+    out: IO[str],
     existing=None,
-) -> tuple[str, list[Section]]:
+) -> list[Section]:
     """Render a module file (L2) with detailed symbol documentation.
 
+    The template is rendered in two halves around ``$components``, and the
+    components body is written line by line between them to ``out``, so the
+    full document is never held in memory.
+
     Args:
         module: Source module to render.
         domain_id: Parent domain identifier.
         src_dir: Source directory.
         map_dir: Map directory.
+        out: Text stream the rendered markdown is written to.
         existing: Parsed existing map file for description preservation.
 
     Returns:
-        Tuple of (rendered content, list of Section objects for tracking)
+        List of Section objects for tracking.
     """
-    from .parser import extract_module_docstring
-
     sections: list[Section] = []
-    components_parts = []
+    started = False
+    pending_blanks = 0
+
+    def emit(line: str) -> None:
+        # Blank lines are deferred so trailing ones are dropped, matching
+        # the rstrip() applied to rendered templates.
+        nonlocal started, pending_blanks
+        if not line:
+            pending_blanks += 1
+            return
+        out.write("\n" * (pending_blanks + 1) if started else head)
+        out.write(line)
+        started = True
+        pending_blanks = 0
 
     src_full = src_dir / module.source_path
     # Preserve directory structure: advanced/scientific.py -> advanced/scientific.md
@@ -312,7 +356,10 @@ def _render_module_md(
     # Group symbols by type
     classes = [s for s in module.symbols if s.kind == SymbolKind.CLASS]
     functions = [s for s in module.symbols if s.kind == SymbolKind.FUNCTION]
-    methods = [s for s in module.symbols if s.kind == SymbolKind.METHOD]
+    methods_by_parent: dict[str | None, list] = {}
+    for s in module.symbols:
+        if s.kind == SymbolKind.METHOD:
+            methods_by_parent.setdefault(s.parent, []).append(s)
 
     module_name = module.source_path.stem
     # Build dotted module ID: advanced/scientific.py -> advanced.scientific
@@ -320,160 +367,163 @@ def _render_module_md(
     module_dotted = ".".join(module_id_parts)
 
     # Module docstring for description
-    module_doc = extract_module_docstring(src_full)
+    module_doc = module.docstring
     module_description = (
         module_doc.split("\n")[0].strip()
         if module_doc
         else make_placeholder(f"Add module docstring to {module_name}.py")
     )
 
+    # The components body is streamed between these two halves
+    head, tail = load_template("module.md").render_around(
+        "components",
+        module_id=f"{domain_id}.{module_dotted}",
+        module_name=module_name,
+        module_description=module_description,
+    )
+
     # Render classes
     if classes:
-        components_parts.append("## Classes")
-        components_parts.append("")
+        emit("## Classes")
+        emit("")
 
         for cls in classes:
             # Class heading
-            components_parts.append(f"### {cls.name}")
-            components_parts.append("")
+            emit(f"### {cls.name}")
+            emit("")
 
             # Class docstring
-            if cls.docstring:
-                components_parts.append(cls.docstring.split("\n")[0])
+            doc = cls.docstring
+            first_line = doc.partition("\n")[0] if doc else ""
+            if doc:
+                emit(first_line)
             else:
-                components_parts.append(
+                emit(
                     make_placeholder(f"Add docstring to class {cls.name}")  # noqa: E501
                 )
-            components_parts.append("")
+            emit("")
 
             sections.append(
                 Section(
                     symbol_name=cls.name,
                     symbol_kind=SymbolKind.CLASS,
                     line_number=cls.line,
-                    description=cls.docstring.split("\n")[0] if cls.docstring else "",
-                    is_placeholder=not cls.docstring,
+                    description=first_line,
+                    is_placeholder=not doc,
                 )
             )
 
             # Find methods for this class
-            class_methods = [m for m in methods if m.parent == cls.name]
-            for method in class_methods:
+            for method in methods_by_parent.get(cls.name, []):
                 sig = method.signature or "()"
-                components_parts.append(f"#### `{method.name}{sig}`")
-                components_parts.append("")
+                emit(f"#### `{method.name}{sig}`")
+                emit("")
 
                 # Method docstring (first line)
-                if method.docstring:
-                    first_line = method.docstring.split("\n")[0]
-                    components_parts.append(first_line)
+                method_doc = method.docstring
+                method_first = method_doc.partition("\n")[0] if method_doc else ""
+                if method_doc:
+                    emit(method_first)
                 else:
-                    components_parts.append(
-                        make_placeholder(f"Add docstring to {cls.name}.{method.name}")
-                    )
-                components_parts.append("")
+                    emit(make_placeholder(f"Add docstring to {cls.name}.{method.name}"))
+                emit("")
 
                 # Parse and render parameters
-                parsed = _parse_docstring_sections(method.docstring)
+                parsed = _parse_docstring_sections(method_doc)
                 if parsed["args"]:
-                    components_parts.append("**Parameters:**")
-                    components_parts.append("")
-                    components_parts.append("| Name | Description |")
-                    components_parts.append("|------|-------------|")
+                    emit("**Parameters:**")
+                    emit("")
+                    emit("| Name | Description |")
+                    emit("|------|-------------|")
                     for param_name, param_desc in parsed["args"]:
                         if param_name != "self":
-                            components_parts.append(f"| {param_name} | {param_desc} |")
-                    components_parts.append("")
+                            emit(f"| {param_name} | {param_desc} |")
+                    emit("")
 
                 # Parse and render raises
                 if parsed["raises"]:
-                    components_parts.append("**Raises:**")
-                    components_parts.append("")
-                    components_parts.append("| Exception | Description |")
-                    components_parts.append("|-----------|-------------|")
+                    emit("**Raises:**")
+                    emit("")
+                    emit("| Exception | Description |")
+                    emit("|-----------|-------------|")
                     for exc_name, exc_desc in parsed["raises"]:
-                        components_parts.append(f"| {exc_name} | {exc_desc} |")
-                    components_parts.append("")
+                        emit(f"| {exc_name} | {exc_desc} |")
+                    emit("")
 
                 # Source link
-                components_parts.append(f"[Source]({rel_src}#L{method.line})")
-                components_parts.append("")
+                emit(f"[Source]({rel_src}#L{method.line})")
+                emit("")
 
                 sections.append(
                     Section(
                         symbol_name=method.name,
                         symbol_kind=SymbolKind.METHOD,
                         line_number=method.line,
-                        description=method.docstring.split("\n")[0]
-                        if method.docstring
-                        else "",
-                        is_placeholder=not method.docstring,
+                        description=method_first,
+                        is_placeholder=not method_doc,
                     )
                 )
 
     # Render functions
     if functions:
-        components_parts.append("## Functions")
-        components_parts.append("")
+        emit("## Functions")
+        emit("")
 
         for func in functions:
             sig = func.signature or "()"
-            components_parts.append(f"### `{func.name}{sig}`")
-            components_parts.append("")
+            emit(f"### `{func.name}{sig}`")
+            emit("")
 
             # Function docstring (first line)
-            if func.docstring:
-                first_line = func.docstring.split("\n")[0]
-                components_parts.append(first_line)
+            doc = func.docstring
+            first_line = doc.partition("\n")[0] if doc else ""
+            if doc:
+                emit(first_line)
             else:
-                components_parts.append(
-                    make_placeholder(f"Add docstring to {func.name}")
-                )
-            components_parts.append("")
+                emit(make_placeholder(f"Add docstring to {func.name}"))
+            emit("")
 
             # Parse and render parameters
-            parsed = _parse_docstring_sections(func.docstring)
+            parsed = _parse_docstring_sections(doc)
             if parsed["args"]:
-                components_parts.append("**Parameters:**")
-                components_parts.append("")
-                components_parts.append("| Name | Description |")
-                components_parts.append("|------|-------------|")
+                emit("**Parameters:**")
+                emit("")
+                emit("| Name | Description |")
+                emit("|------|-------------|")
                 for param_name, param_desc in parsed["args"]:
-                    components_parts.append(f"| {param_name} | {param_desc} |")
-                components_parts.append("")
+                    emit(f"| {param_name} | {param_desc} |")
+                emit("")
 
             # Parse and render raises
             if parsed["raises"]:
-                components_parts.append("**Raises:**")
-                components_parts.append("")
-                components_parts.append("| Exception | Description |")
-                components_parts.append("|-----------|-------------|")
+                emit("**Raises:**")
+                emit("")
+                emit("| Exception | Description |")
+                emit("|-----------|-------------|")
                 for exc_name, exc_desc in parsed["raises"]:
-                    components_parts.append(f"| {exc_name} | {exc_desc} |")
-                components_parts.append("")
+                    emit(f"| {exc_name} | {exc_desc} |")
+                emit("")
 
             # Source link
-            components_parts.append(f"[Source]({rel_src}#L{func.line})")
-            components_parts.append("")
+            emit(f"[Source]({rel_src}#L{func.line})")
+            emit("")
 
             sections.append(
                 Section(
                     symbol_name=func.name,
                     symbol_kind=SymbolKind.FUNCTION,
                     line_number=func.line,
-                    description=func.docstring.split("\n")[0] if func.docstring else "",
-                    is_placeholder=not func.docstring,
+                    description=first_line,
+                    is_placeholder=not doc,
                 )
             )
 
-    components = "\n".join(components_parts)
-
-    content = render_template(
-        "module.md",
-        module_id=f"{domain_id}.{module_dotted}",
-        module_name=module_name,
-        module_description=module_description,
-        components=components,
-    )
+    tail = tail.rstrip()
+    if not started:
+        out.write((head + tail).rstrip() + "\n")
+    elif tail:
+        out.write("\n" * pending_blanks + tail + "\n")
+    else:
+        out.write("\n")
 
-    return content, sections
+    return sections
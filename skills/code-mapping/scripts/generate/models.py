@@ -13,7 +13,7 @@ class SymbolKind(Enum):
     METHOD = "method"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedSymbol:
     """Symbol extracted from source code via AST."""
 
@@ -27,7 +27,7 @@ class ExtractedSymbol:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A section in a map file documenting a symbol."""
 
@@ -38,7 +38,7 @@ class Section:
     is_placeholder: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class MapFile:
     """Represents a single map markdown file."""
 
@@ -49,7 +49,7 @@ class MapFile:
     sections: list[Section] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MissingDocstring:
     """A symbol missing a docstring in source code."""
 
@@ -58,7 +58,7 @@ class MissingDocstring:
     symbol_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangeReport:
     """Report of changes made during map generation."""
 
@@ -95,24 +95,32 @@ def _format_signature(node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
     return sig
 
 
-def extract_symbols(source_path: Path) -> list[ExtractedSymbol]:
-    """Extract all classes, functions, and methods from a Python file.
-
-    Args:
-        source_path: Path to the Python file.
+def _parse_file(source_path: Path) -> ast.Module | None:
+    """Read and parse a Python file.
 
     Returns:
-        List of ExtractedSymbol objects with docstrings and signatures.
+        The parsed module, or None if the file is missing or unparseable.
     """
     if not source_path.exists():
-        return []
+        return None
 
     try:
         source = source_path.read_text()
-        tree = ast.parse(source)
+    except UnicodeDecodeError:
+        return None
+    return _parse_source(source, str(source_path))
+
+
+def _parse_source(source: str | bytes, filename: str) -> ast.Module | None:
+    """Parse Python source, returning None on syntax or encoding errors."""
+    try:
+        return ast.parse(source, filename=filename, type_comments=False)
     except (SyntaxError, UnicodeDecodeError):
-        return []
+        return None
+
 
+def _collect_symbols(tree: ast.Module) -> list[ExtractedSymbol]:
+    """Collect top-level classes, functions, and their methods from a tree."""
     symbols = []
 
     for node in ast.iter_child_nodes(tree):
@@ -155,6 +163,54 @@ def extract_symbols(source_path: Path) -> list[ExtractedSymbol]:
     return symbols
 
 
+def extract_module(source_path: Path) -> tuple[list[ExtractedSymbol], str | None]:
+    """Extract symbols and the module docstring from a single parse.
+
+    Args:
+        source_path: Path to the Python file.
+
+    Returns:
+        Tuple of (symbols, module docstring or None).
+    """
+    tree = _parse_file(source_path)
+    if tree is None:
+        return [], None
+    return _collect_symbols(tree), ast.get_docstring(tree)
+
+
+def extract_module_source(
+    source: str | bytes, filename: str
+) -> tuple[list[ExtractedSymbol], str | None]:
+    """Extract symbols and the module docstring from already-read source.
+
+    Args:
+        source: Python source text or raw bytes.
+        filename: Filename used in parse error messages.
+
+    Returns:
+        Tuple of (symbols, module docstring or None).
+    """
+    tree = _parse_source(source, filename)
+    if tree is None:
+        return [], None
+    return _collect_symbols(tree), ast.get_docstring(tree)
+
+
+def extract_symbols(source_path: Path) -> list[ExtractedSymbol]:
+    """Extract all classes, functions, and methods from a Python file.
+
+    Args:
+        source_path: Path to the Python file.
+
+    Returns:
+        List of ExtractedSymbol objects with docstrings and signatures.
+    """
+    tree = _parse_file(source_path)
+    if tree is None:
+        return []
+    return _collect_symbols(tree)
+
+
 def extract_module_docstring(source_path: Path) -> str | None:
     """Extract module-level docstring if present.
 
@@ -164,12 +220,7 @@ def extract_module_docstring(source_path: Path) -> str | None:
     Returns:
         The module docstring, or None if not present.
     """
-    if not source_path.exists():
-        return None
-
-    try:
-        source = source_path.read_text()
-        tree = ast.parse(source)
-        return ast.get_docstring(tree)
-    except (SyntaxError, UnicodeDecodeError):
+    tree = _parse_file(source_path)
+    if tree is None:
         return None
+    return ast.get_docstring(tree)
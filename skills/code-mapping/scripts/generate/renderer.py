@@ -1,5 +1,7 @@
 """Markdown generation from MapFile structures."""
 
+import io
+import os
 from pathlib import Path
 
 from .models import MapFile, Section, SymbolKind
@@ -45,30 +47,12 @@ def compute_relative_path(from_map: Path, to_src: Path) -> str:
     Returns:
         Relative path string with forward slashes.
     """
-    # Resolve to absolute paths for consistent comparison
-    from_abs = from_map.resolve()
-    to_abs = to_src.resolve()
-
-    try:
-        rel = to_abs.relative_to(from_abs.parent)
-        return str(rel).replace("\\", "/")
-    except ValueError:
-        # Not a subpath, compute relative path via common ancestor
-        from_parts = from_abs.parent.parts
-        to_parts = to_abs.parts
-
-        # Find common prefix length
-        common_len = 0
-        for a, b in zip(from_parts, to_parts):
-            if a == b:
-                common_len += 1
-            else:
-                break
-
-        # Build relative path: go up from 'from', then down to 'to'
-        ups = len(from_parts) - common_len
-        rel_parts = [".."] * ups + list(to_parts[common_len:])
-        return "/".join(rel_parts)
+    # Callers pass already-resolved base directories, so plain abspath is
+    # enough and symlinks need not be followed again here
+    rel = os.path.relpath(
+        os.path.abspath(to_src), start=os.path.abspath(from_map.parent)
+    )
+    return rel.replace(os.sep, "/")
 
 
 def render_map_file(map_file: MapFile, src_base: Path, map_base: Path) -> str:
@@ -82,97 +66,56 @@ def render_map_file(map_file: MapFile, src_base: Path, map_base: Path) -> str:
     Returns:
         Markdown string for the map file.
     """
-    lines = []
-
-    # Title
-    lines.append(f"# {map_file.source_path.name}")
-    lines.append("")
-
-    # File description
-    lines.append(map_file.file_description)
-    lines.append("")
-
     # Compute relative path from map to source
     src_full = src_base / map_file.source_path
     map_full = map_base / map_file.map_path
     rel_src = compute_relative_path(map_full, src_full)
 
-    # Group sections by kind
+    # Group sections by kind; methods belong to the closest preceding class
     classes = [s for s in map_file.sections if s.symbol_kind == SymbolKind.CLASS]
     functions = [s for s in map_file.sections if s.symbol_kind == SymbolKind.FUNCTION]
     methods_by_class: dict[str, list[Section]] = {}
 
+    current_class: Section | None = None
     for s in map_file.sections:
-        if s.symbol_kind == SymbolKind.METHOD:
-            # Find parent class from symbol name pattern or section list
-            for cls in classes:
-                # Methods follow their parent class in the list
-                methods_by_class.setdefault(cls.symbol_name, []).append(s)
-                break
+        if s.symbol_kind == SymbolKind.CLASS:
+            current_class = s
+            methods_by_class[s.symbol_name] = []
+        elif s.symbol_kind == SymbolKind.METHOD and current_class is not None:
+            methods_by_class[current_class.symbol_name].append(s)
+
+    buf = io.StringIO()
 
-    # Actually, we need to track parent properly. Let me rebuild this logic.
-    # Methods are associated with classes based on the order they appear.
+    # Title and file description
+    buf.write(f"# {map_file.source_path.name}\n\n{map_file.file_description}\n\n")
 
     # Render classes with their methods
     if classes:
-        lines.append("## Classes")
-        lines.append("")
+        buf.write("## Classes\n\n")
 
         for cls in classes:
-            lines.append(f"### [`{cls.symbol_name}`]({rel_src}#L{cls.line_number})")
-            lines.append("")
-            lines.append(cls.description)
-            lines.append("")
-
-            # Find methods for this class
-            class_methods = [
-                s
-                for s in map_file.sections
-                if s.symbol_kind == SymbolKind.METHOD
-                and _is_method_of_class(s, cls, map_file.sections)
-            ]
+            buf.write(
+                f"### [`{cls.symbol_name}`]({rel_src}#L{cls.line_number})\n\n"
+                f"{cls.description}\n\n"
+            )
 
+            class_methods = methods_by_class.get(cls.symbol_name, [])
             if class_methods:
-                lines.append("**Methods:**")
-                lines.append("")
-                for method in class_methods:
-                    line = (
-                        f"- [`{method.symbol_name}`]({rel_src}#L{method.line_number}): "
-                        f"{method.description}"
-                    )
-                    lines.append(line)
-                lines.append("")
+                items = "\n".join(
+                    f"- [`{m.symbol_name}`]({rel_src}#L{m.line_number}): "
+                    f"{m.description}"
+                    for m in class_methods
+                )
+                buf.write(f"**Methods:**\n\n{items}\n\n")
 
     # Render standalone functions
     if functions:
-        lines.append("## Functions")
-        lines.append("")
+        buf.write("## Functions\n\n")
 
         for func in functions:
-            lines.append(f"### [`{func.symbol_name}`]({rel_src}#L{func.line_number})")
-            lines.append("")
-            lines.append(func.description)
-            lines.append("")
-
-    return "\n".join(lines).rstrip() + "\n"
-
-
-def _is_method_of_class(
-    method: Section, cls: Section, all_sections: list[Section]
-) -> bool:
-    """Determine if a method belongs to a class based on line ordering.
-
-    Methods appear after their class and before the next class in the list.
-    """
-    cls_idx = all_sections.index(cls)
-    method_idx = all_sections.index(method)
-
-    if method_idx <= cls_idx:
-        return False
-
-    # Check if there's another class between cls and method
-    for i in range(cls_idx + 1, method_idx):
-        if all_sections[i].symbol_kind == SymbolKind.CLASS:
-            return False
+            buf.write(
+                f"### [`{func.symbol_name}`]({rel_src}#L{func.line_number})\n\n"
+                f"{func.description}\n\n"
+            )
 
-    return True
+    return buf.getvalue().rstrip() + "\n"
@@ -1,5 +1,6 @@
 """Template rendering for code map generation using stdlib string.Template."""
 
+from functools import cache
 from pathlib import Path
 from string import Template
 
@@ -7,17 +8,108 @@ from string import Template
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
 
-def load_template(name: str) -> Template:
+class CompiledTemplate:
+    """A string.Template pre-split into literal text and placeholder names.
+
+    The placeholder regex runs once when the template is compiled; render()
+    only stitches strings together.
+    """
+
+    def __init__(self, text: str):
+        """Split template text using string.Template placeholder syntax.
+
+        Args:
+            text: Template source with $name / ${name} placeholders.
+
+        Raises:
+            ValueError: If the text contains an invalid placeholder.
+        """
+        literals: list[str] = []
+        var_names: list[str] = []
+        current = ""
+        start = 0
+        for match in Template.pattern.finditer(text):
+            current += text[start : match.start()]
+            start = match.end()
+            if match.group("escaped") is not None:
+                current += "$"
+            elif match.group("invalid") is not None:
+                raise ValueError(f"Invalid placeholder in template: {match.group()!r}")
+            else:
+                literals.append(current)
+                var_names.append(match.group("named") or match.group("braced"))
+                current = ""
+        literals.append(current + text[start:])
+
+        # literals[i] precedes var_names[i]; literals[-1] is the tail
+        self.literals = tuple(literals)
+        self.var_names = tuple(var_names)
+
+    def render(self, **kwargs: str) -> str:
+        """Substitute placeholders.
+
+        Args:
+            **kwargs: Variables to substitute
+
+        Returns:
+            Rendered text.
+
+        Raises:
+            KeyError: If a placeholder has no value.
+        """
+        return _stitch(self.literals, self.var_names, kwargs)
+
+    def render_around(self, placeholder: str, **kwargs: str) -> tuple[str, str]:
+        """Render the text before and after a placeholder, leaving it out.
+
+        Lets a caller stream a large value between the two halves instead of
+        building it as one string.
+
+        Args:
+            placeholder: Name of the placeholder to split at.
+            **kwargs: Variables to substitute in the rest of the template.
+
+        Returns:
+            Tuple of (text before, text after) the placeholder.
+
+        Raises:
+            ValueError: If the placeholder does not occur exactly once.
+            KeyError: If another placeholder has no value.
+        """
+        if self.var_names.count(placeholder) != 1:
+            raise ValueError(f"Template needs exactly one ${placeholder}")
+        split = self.var_names.index(placeholder)
+        head = _stitch(self.literals[: split + 1], self.var_names[:split], kwargs)
+        tail = _stitch(self.literals[split + 1 :], self.var_names[split + 1 :], kwargs)
+        return head, tail
+
+
+def _stitch(
+    literals: tuple[str, ...], var_names: tuple[str, ...], kwargs: dict[str, str]
+) -> str:
+    """Join literals with substituted values (one more literal than names)."""
+    parts = []
+    for literal, name in zip(literals, var_names):
+        parts.append(literal)
+        parts.append(str(kwargs[name]))
+    parts.append(literals[-1])
+    return "".join(parts)
+
+
+@cache
+def load_template(name: str) -> CompiledTemplate:
     """Load a template file by name.
 
+    Templates are read and compiled once per process and shared afterwards.
+
     Args:
         name: Template filename (e.g., "MAP.md", "ARCHITECTURE.md", "domain.md")
 
     Returns:
-        string.Template object
+        CompiledTemplate object
     """
     template_path = TEMPLATES_DIR / name
-    return Template(template_path.read_text())
+    return CompiledTemplate(template_path.read_text())
 
 
 def render_template(name: str, **kwargs: str) -> str:
@@ -31,4 +123,4 @@ def render_template(name: str, **kwargs: str) -> str:
         Rendered template string with exactly one trailing newline.
     """
     template = load_template(name)
-    return template.substitute(**kwargs).rstrip() + "\n"
+    return template.render(**kwargs).rstrip() + "\n"
@@ -1,10 +1,12 @@
 """Map validation package."""
 
-from .lsp_client import get_symbols, symbol_at_line, symbol_exists
+from .lsp_client import get_all_symbols, get_symbols, symbol_at_line, symbol_exists
 from .validate_map import (
     ValidationError,
     check_code_links,
     check_file_links,
+    check_links,
+    check_links_with_counts,
     check_size_limits,
     check_structure,
     validate_map,
@@ -14,8 +16,11 @@ __all__ = [
     "ValidationError",
     "check_code_links",
     "check_file_links",
+    "check_links",
+    "check_links_with_counts",
     "check_size_limits",
     "check_structure",
+    "get_all_symbols",
     "get_symbols",
     "symbol_at_line",
     "symbol_exists",
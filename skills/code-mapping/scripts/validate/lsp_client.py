@@ -50,6 +50,21 @@ def get_symbols(file_path: Path) -> list[Symbol]:
     return symbols
 
 
+def get_all_symbols(file_path: Path) -> dict[str, list[int]]:
+    """Index the symbols of a Python file by name.
+
+    Args:
+        file_path: Path to the Python file.
+
+    Returns:
+        Mapping of symbol name to the line numbers it is defined on.
+    """
+    table: dict[str, list[int]] = {}
+    for s in get_symbols(file_path):
+        table.setdefault(s.name, []).append(s.line)
+    return table
+
+
 def symbol_exists(file_path: Path, symbol_name: str) -> bool:
     """Check if a symbol exists in a Python file.
 
@@ -60,8 +75,7 @@ def symbol_exists(file_path: Path, symbol_name: str) -> bool:
     Returns:
         True if the symbol exists, False otherwise.
     """
-    symbols = get_symbols(file_path)
-    return any(s.name == symbol_name for s in symbols)
+    return symbol_name in get_all_symbols(file_path)
 
 
 def symbol_at_line(
@@ -78,11 +92,5 @@ def symbol_at_line(
     Returns:
         True if the symbol exists within tolerance of the specified line.
     """
-    symbols = get_symbols(file_path)
-
-    for s in symbols:
-        if s.name == symbol_name:
-            if abs(s.line - line) <= tolerance:
-                return True
-
-    return False
+    lines = get_all_symbols(file_path).get(symbol_name, [])
+    return any(abs(found - line) <= tolerance for found in lines)
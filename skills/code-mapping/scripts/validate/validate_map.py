@@ -3,14 +3,18 @@
 Validates code maps for structural integrity, link validity, and size limits.
 """
 
+import math
+import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 try:
-    from .lsp_client import symbol_at_line, symbol_exists
+    from .lsp_client import get_all_symbols
 except ImportError:
-    from lsp_client import symbol_at_line, symbol_exists
+    from lsp_client import get_all_symbols
 
 
 @dataclass
@@ -42,8 +46,7 @@ def validate_map(map_dir: Path) -> list[ValidationError]:
     """
     errors = []
     errors.extend(check_structure(map_dir))
-    errors.extend(check_file_links(map_dir))
-    errors.extend(check_code_links(map_dir))
+    errors.extend(check_links(map_dir))
     errors.extend(check_size_limits(map_dir))
     return errors
 
@@ -95,45 +98,152 @@ def check_structure(map_dir: Path) -> list[ValidationError]:
     return errors
 
 
-# Regex patterns for markdown links
-# Standard link: [text](path.md) or [text](path.md#anchor)
-FILE_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)#]+)(?:#[^)]+)?\)")
-# Code link: [`symbol`](path.py#L42)
-CODE_LINK_PATTERN = re.compile(r"\[`([^`]+)`\]\(([^)#]+)#L(\d+)\)")
-# Source link: [Source](path.py#L42) - links to a file line without symbol name
-SOURCE_LINK_PATTERN = re.compile(r"\[Source\]\(([^)#]+)#L(\d+)\)")
+# Regex for markdown links, one alternative per link kind. Alternatives are
+# tried in order at each position, so code and source links win over the
+# generic file link that would also match them. Patterns run over whole
+# documents, so no part of a link may span a newline.
+LINK_PATTERN = re.compile(
+    # Code link: [`symbol`](path.py#L42)
+    r"(?P<code>\[`(?P<code_sym>[^`\n]+)`\]\((?P<code_path>[^)#\n]+)#L(?P<code_line>\d+)\))"
+    # Source link: [Source](path.py#L42) - links to a file line without symbol name
+    r"|(?P<src>\[Source\]\((?P<src_path>[^)#\n]+)#L(?P<src_line>\d+)\))"
+    # Standard link: [text](path.md) or [text](path.md#anchor)
+    r"|(?P<file>\[(?P<file_text>[^\[\]\n]+)\]\((?P<file_path>[^)#\n]+)(?:#[^)\n]+)?\))"
+)
+# Opening or closing line of a fenced code block
+FENCE_PATTERN = re.compile(r"^[^\S\n]*```", re.MULTILINE)
 
 
-def _is_in_code_context(line: str, match_start: int) -> bool:
-    """Check if a match position is within inline code backticks.
+def _backtick_spans(line: str) -> list[tuple[int, int]]:
+    """Find the inline code spans of a line in a single scan.
 
-    Handles both single backtick and double backtick inline code.
+    Double backticks (``) and single backticks are tracked independently: a
+    position is inside code when an odd number of either precedes it.
 
     Args:
         line: The line of text.
+
+    Returns:
+        Sorted, non-overlapping (start, end) ranges; positions in
+        [start, end) are inside inline code.
+    """
+    spans = []
+    doubles = singles = 0
+    span_start = None
+    i = 0
+    n = len(line)
+    while True:
+        i = line.find("`", i)
+        if i == -1:
+            break
+        if line.startswith("``", i):
+            doubles += 1
+            i += 2
+        else:
+            singles += 1
+            i += 1
+        inside = doubles % 2 == 1 or singles % 2 == 1
+        if inside and span_start is None:
+            span_start = i
+        elif not inside and span_start is not None:
+            spans.append((span_start, i))
+            span_start = None
+    if span_start is not None:
+        spans.append((span_start, n + 1))
+    return spans
+
+
+def _is_in_code_context(spans: list[tuple[int, int]], match_start: int) -> bool:
+    """Check if a match position is within inline code backticks.
+
+    Args:
+        spans: Inline code spans of the line, from _backtick_spans().
         match_start: Starting position of the match in the line.
 
     Returns:
         True if the match is inside backticks.
     """
-    prefix = line[:match_start]
+    idx = bisect_right(spans, (match_start, math.inf)) - 1
+    return idx >= 0 and match_start < spans[idx][1]
 
-    # Handle double backtick (`` code ``) - count pairs
-    double_backtick_count = prefix.count("``")
-    if double_backtick_count % 2 == 1:
-        return True
 
-    # Handle single backtick - count singles (excluding doubles)
-    # Remove double backticks first to count only single ones
-    single_only = prefix.replace("``", "")
-    if single_only.count("`") % 2 == 1:
-        return True
+def _link_target(md_file: Path, link_path: str) -> Path:
+    """Resolve a link relative to the markdown file that contains it.
 
-    return False
+    Only ".." segments are collapsed; symlinks are not followed, which saves
+    an lstat per path component compared to Path.resolve().
+    """
+    return Path(os.path.normpath(md_file.parent / link_path))
 
 
-def check_file_links(map_dir: Path) -> list[ValidationError]:
-    """Validate all file links in map documents.
+def _scan_file_for_links(content: str) -> list[tuple[int, re.Match[str]]]:
+    """Find the links of a map document that are outside of code.
+
+    Links in fenced code blocks and inside inline code are skipped. The link
+    pattern runs once over the whole document; line numbers come from a
+    bisect over the newline offsets.
+
+    Args:
+        content: Markdown document text.
+
+    Returns:
+        (line number, LINK_PATTERN match) pairs in document order.
+    """
+    # Every link kind contains "](", so documents without it have no links
+    if "](" not in content:
+        return []
+
+    newlines = []
+    idx = content.find("\n")
+    while idx != -1:
+        newlines.append(idx)
+        idx = content.find("\n", idx + 1)
+
+    # Fence lines toggle code blocks; a line is inside one when an odd number
+    # of fences precede it. Most documents have none, and a substring test
+    # is far cheaper than the multiline regex scan.
+    fence_lines = (
+        [bisect_right(newlines, m.start()) + 1 for m in FENCE_PATTERN.finditer(content)]
+        if "```" in content
+        else []
+    )
+    fence_set = set(fence_lines)
+
+    links = []
+    spans_by_line: dict[int, list[tuple[int, int]]] = {}
+
+    for match in LINK_PATTERN.finditer(content):
+        line_idx = bisect_right(newlines, match.start())
+        line_num = line_idx + 1
+
+        # Skip fence lines and lines in fenced code blocks
+        if fence_lines and (
+            line_num in fence_set or bisect_right(fence_lines, line_num) % 2 == 1
+        ):
+            continue
+
+        # Skip if within inline code backticks
+        line_start = newlines[line_idx - 1] + 1 if line_idx else 0
+        if line_num not in spans_by_line:
+            line_end = newlines[line_idx] if line_idx < len(newlines) else None
+            line = content[line_start:line_end]
+            spans_by_line[line_num] = _backtick_spans(line) if "`" in line else []
+        if _is_in_code_context(spans_by_line[line_num], match.start() - line_start):
+            continue
+
+        links.append((line_num, match))
+
+    return links
+
+
+def check_links(map_dir: Path) -> list[ValidationError]:
+    """Validate all file, code and source links in map documents.
+
+    Each map document is read and scanned once; file links produce
+    "broken_link" errors and code/source links produce "broken_symbol" errors.
+
+    Code links have format: [`symbol`](path/to/file.py#L42)
+    Source links have format: [Source](path/to/file.py#L42)
 
     Args:
         map_dir: Path to the map directory.
@@ -141,191 +251,198 @@ def check_file_links(map_dir: Path) -> list[ValidationError]:
     Returns:
         List of broken link errors.
     """
-    errors = []
+    errors, _, _ = check_links_with_counts(map_dir)
+    return errors
 
-    for md_file in map_dir.rglob("*.md"):
-        content = md_file.read_text()
-        lines = content.split("\n")
-        in_code_block = False
-
-        for line_num, line in enumerate(lines, start=1):
-            # Track fenced code blocks
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-
-            # Skip lines in fenced code blocks
-            if in_code_block:
-                continue
-
-            # Find all standard links
-            for match in FILE_LINK_PATTERN.finditer(line):
-                # Skip if within inline code backticks
-                if _is_in_code_context(line, match.start()):
-                    continue
 
-                link_text = match.group(1)
-                link_path = match.group(2)
+def check_links_with_counts(
+    map_dir: Path,
+) -> tuple[list[ValidationError], int, int]:
+    """Validate links like check_links(), also counting the links scanned.
+
+    Args:
+        map_dir: Path to the map directory.
+
+    Returns:
+        (broken link errors, links found, code and source links found).
+        Links in code blocks and inline code are not counted.
+    """
+    # Map documents link the same targets many times; look each one up once.
+    # Scans share these across threads: a race only costs a duplicate lookup.
+    exists_cache: dict[Path, bool] = {}
+    symbols_cache: dict[Path, dict[str, list[int]]] = {}
+    line_count_cache: dict[Path, int | None] = {}
+
+    def exists(target: Path) -> bool:
+        if target not in exists_cache:
+            exists_cache[target] = target.exists()
+        return exists_cache[target]
+
+    def symbol_lines(target: Path) -> dict[str, list[int]]:
+        """Map each symbol name in target to the lines it is defined on."""
+        if target not in symbols_cache:
+            symbols_cache[target] = get_all_symbols(target)
+        return symbols_cache[target]
+
+    def line_count(target: Path) -> int | None:
+        """Number of lines in target, or None if it cannot be read."""
+        if target not in line_count_cache:
+            try:
+                line_count_cache[target] = _count_lines(target)
+            except OSError:
+                line_count_cache[target] = None
+        return line_count_cache[target]
+
+    def scan(md_file: Path) -> tuple[list[ValidationError], int, int]:
+        """Check every link in one map document, returning errors and counts."""
+        errors = []
+
+        # One read(), skipping the text layer's newline translation
+        content = md_file.read_bytes().decode("utf-8")
+        rel_file = str(md_file.relative_to(map_dir))
+
+        links = _scan_file_for_links(content)
+        code_link_count = 0
+
+        for line_num, match in links:
+            kind = match.lastgroup
+            if kind != "file":
+                code_link_count += 1
+            if kind == "file":
+                link_text = match.group("file_text")
+                link_path = match.group("file_path")
 
                 # Skip external URLs
                 if link_path.startswith(("http://", "https://", "mailto:")):
                     continue
 
-                # Skip code links (handled separately)
-                if link_text.startswith("`") and "#L" in match.group(0):
-                    continue
-
-                # Skip python file links (handled by code link checker)
+                # Skip python file links (only checked as code links)
                 if link_path.endswith(".py"):
                     continue
 
                 # Resolve relative path
-                target = (md_file.parent / link_path).resolve()
+                target = _link_target(md_file, link_path)
 
-                if not target.exists():
+                if not exists(target):
                     errors.append(
                         ValidationError(
-                            file=str(md_file.relative_to(map_dir)),
+                            file=rel_file,
                             line=line_num,
                             message=f"[{link_text}]({link_path}) -> file not found",
                             error_type="broken_link",
                         )
                     )
 
-    return errors
-
-
-def check_code_links(map_dir: Path) -> list[ValidationError]:
-    """Validate all code links in map documents.
-
-    Code links have format: [`symbol`](path/to/file.py#L42)
-    Source links have format: [Source](path/to/file.py#L42)
-
-    Args:
-        map_dir: Path to the map directory.
+            elif kind == "code":
+                symbol_name = match.group("code_sym")
+                file_path = match.group("code_path")
+                line_number = int(match.group("code_line"))
+                link = f"[`{symbol_name}`]({file_path}#L{line_number})"
 
-    Returns:
-        List of broken code link errors.
-    """
-    errors = []
+                # Resolve relative path from the markdown file's location
+                target = _link_target(md_file, file_path)
 
-    for md_file in map_dir.rglob("*.md"):
-        content = md_file.read_text()
-        lines = content.split("\n")
-        in_code_block = False
-
-        for line_num, line in enumerate(lines, start=1):
-            # Track fenced code blocks
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-
-            # Skip lines in fenced code blocks
-            if in_code_block:
-                continue
-
-            # Check symbol code links: [`symbol`](path.py#L42)
-            for match in CODE_LINK_PATTERN.finditer(line):
-                # Skip if within inline code backticks
-                if _is_in_code_context(line, match.start()):
+                if not exists(target):
+                    msg = f"{link} -> file not found"
+                # Check if symbol exists anywhere in file
+                elif symbol_name not in symbol_lines(target):
+                    msg = f"{link} -> symbol not found"
+                # Check if symbol is at the right line (with tolerance)
+                elif not any(
+                    abs(found - line_number) <= 5
+                    for found in symbol_lines(target)[symbol_name]
+                ):
+                    msg = f"{link} -> symbol not at line {line_number}"
+                else:
                     continue
 
-                symbol_name = match.group(1)
-                file_path = match.group(2)
-                line_number = int(match.group(3))
+                errors.append(
+                    ValidationError(
+                        file=rel_file,
+                        line=line_num,
+                        message=msg,
+                        error_type="broken_symbol",
+                    )
+                )
 
-                # Resolve relative path from the markdown file's location
-                target = (md_file.parent / file_path).resolve()
+            else:
+                file_path = match.group("src_path")
+                line_number = int(match.group("src_line"))
+                link = f"[Source]({file_path}#L{line_number})"
 
-                if not target.exists():
-                    msg = (
-                        f"[`{symbol_name}`]({file_path}#L{line_number}) "
-                        f"-> file not found"
-                    )
-                    errors.append(
-                        ValidationError(
-                            file=str(md_file.relative_to(map_dir)),
-                            line=line_num,
-                            message=msg,
-                            error_type="broken_symbol",
-                        )
-                    )
-                    continue
+                target = _link_target(md_file, file_path)
 
-                # Check if symbol exists anywhere in file
-                if not symbol_exists(target, symbol_name):
+                if not exists(target):
+                    msg = f"{link} -> file not found"
+                else:
+                    # Check line number is within file bounds
+                    total = line_count(target)
+                    if total is None or line_number <= total:
+                        continue  # Read error; existence already checked
                     msg = (
-                        f"[`{symbol_name}`]({file_path}#L{line_number}) "
-                        f"-> symbol not found"
-                    )
-                    errors.append(
-                        ValidationError(
-                            file=str(md_file.relative_to(map_dir)),
-                            line=line_num,
-                            message=msg,
-                            error_type="broken_symbol",
-                        )
+                        f"{link} -> line {line_number} exceeds file length "
+                        f"({total} lines)"
                     )
-                    continue
 
-                # Check if symbol is at the right line (with tolerance)
-                if not symbol_at_line(target, symbol_name, line_number, tolerance=5):
-                    msg = (
-                        f"[`{symbol_name}`]({file_path}#L{line_number}) "
-                        f"-> symbol not at line {line_number}"
-                    )
-                    errors.append(
-                        ValidationError(
-                            file=str(md_file.relative_to(map_dir)),
-                            line=line_num,
-                            message=msg,
-                            error_type="broken_symbol",
-                        )
+                errors.append(
+                    ValidationError(
+                        file=rel_file,
+                        line=line_num,
+                        message=msg,
+                        error_type="broken_symbol",
                     )
+                )
 
-            # Check source links: [Source](path.py#L42)
-            for match in SOURCE_LINK_PATTERN.finditer(line):
-                if _is_in_code_context(line, match.start()):
-                    continue
+        return errors, len(links), code_link_count
 
-                file_path = match.group(1)
-                line_number = int(match.group(2))
+    # Documents are independent and checking them is mostly file I/O and
+    # parsing, so overlap them; map() keeps results in rglob order
+    md_files = list(map_dir.rglob("*.md"))
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(scan, md_files))
+    return (
+        [error for errors, _, _ in results for error in errors],
+        sum(count for _, count, _ in results),
+        sum(count for _, _, count in results),
+    )
 
-                target = (md_file.parent / file_path).resolve()
 
-                if not target.exists():
-                    msg = f"[Source]({file_path}#L{line_number}) -> file not found"
-                    errors.append(
-                        ValidationError(
-                            file=str(md_file.relative_to(map_dir)),
-                            line=line_num,
-                            message=msg,
-                            error_type="broken_symbol",
-                        )
-                    )
-                    continue
+def check_file_links(map_dir: Path) -> list[ValidationError]:
+    """Validate file links only; prefer check_links() to check everything.
 
-                # Check line number is within file bounds
-                try:
-                    file_lines = target.read_text().split("\n")
-                    if line_number > len(file_lines):
-                        msg = (
-                            f"[Source]({file_path}#L{line_number}) "
-                            f"-> line {line_number} exceeds file length "
-                            f"({len(file_lines)} lines)"
-                        )
-                        errors.append(
-                            ValidationError(
-                                file=str(md_file.relative_to(map_dir)),
-                                line=line_num,
-                                message=msg,
-                                error_type="broken_symbol",
-                            )
-                        )
-                except (OSError, UnicodeDecodeError):
-                    pass  # File read error, already caught by file exists check
+    Args:
+        map_dir: Path to the map directory.
 
-    return errors
+    Returns:
+        List of broken link errors.
+    """
+    return [e for e in check_links(map_dir) if e.error_type == "broken_link"]
+
+
+def check_code_links(map_dir: Path) -> list[ValidationError]:
+    """Validate code and source links only; prefer check_links() to check everything.
+
+    Args:
+        map_dir: Path to the map directory.
+
+    Returns:
+        List of broken code link errors.
+    """
+    return [e for e in check_links(map_dir) if e.error_type == "broken_symbol"]
+
+
+def _count_lines(path: Path) -> int:
+    """Count lines the way len(text.split("\\n")) would, without decoding.
+
+    Args:
+        path: File to count.
+
+    Returns:
+        Number of newline characters plus one.
+    """
+    with path.open("rb") as f:
+        return 1 + sum(buf.count(b"\n") for buf in iter(lambda: f.read(65536), b""))
 
 
 def check_size_limits(map_dir: Path) -> list[ValidationError]:
@@ -342,7 +459,7 @@ def check_size_limits(map_dir: Path) -> list[ValidationError]:
     # Check L0 (ARCHITECTURE.md)
     arch_md = map_dir / "ARCHITECTURE.md"
     if arch_md.exists():
-        line_count = len(arch_md.read_text().split("\n"))
+        line_count = _count_lines(arch_md)
         limit = SIZE_LIMITS["L0"]
         if line_count > limit:
             errors.append(
@@ -359,7 +476,7 @@ def check_size_limits(map_dir: Path) -> list[ValidationError]:
     if domains_dir.exists():
         limit = SIZE_LIMITS["L1"]
         for domain_file in domains_dir.glob("*.md"):
-            line_count = len(domain_file.read_text().split("\n"))
+            line_count = _count_lines(domain_file)
             if line_count > limit:
                 errors.append(
                     ValidationError(
@@ -375,7 +492,7 @@ def check_size_limits(map_dir: Path) -> list[ValidationError]:
     if modules_dir.exists():
         limit = SIZE_LIMITS["L2"]
         for module_file in modules_dir.rglob("*.md"):
-            line_count = len(module_file.read_text().split("\n"))
+            line_count = _count_lines(module_file)
             if line_count > limit:
                 relative_path = module_file.relative_to(map_dir)
                 errors.append(
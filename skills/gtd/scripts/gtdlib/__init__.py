@@ -1,5 +1,5 @@
 """GTD task management package."""
 
-from .storage import GTDItem, GTDStorage, StorageNotSetupError
+from .storage import GTDItem, GTDStorage, PartialCreateError, StorageNotSetupError
 
-__all__ = ["GTDStorage", "GTDItem", "StorageNotSetupError"]
+__all__ = ["GTDStorage", "GTDItem", "PartialCreateError", "StorageNotSetupError"]
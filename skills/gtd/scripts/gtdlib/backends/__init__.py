@@ -15,12 +15,24 @@ __all__ = ["GitHubStorage", "TaskwarriorStorage", "BeadsStorage"]
 def __getattr__(name: str):
     """Lazy-load BeadsStorage on demand (avoids failure when bd not installed)."""
     if name == "BeadsStorage":
-        from .beads import BeadsStorage
-
-        return BeadsStorage
+        return _load_beads()
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+def _load_beads():
+    from .beads import BeadsStorage
+
+    return BeadsStorage
+
+
+# Backend name -> loader returning the class; beads is imported lazily
+_BACKENDS = {
+    "github": lambda: GitHubStorage,
+    "taskwarrior": lambda: TaskwarriorStorage,
+    "beads": _load_beads,
+}
+
+
 def get_backend_class(name: str):
     """Get backend class by name. Supports lazy loading.
 
@@ -33,13 +45,8 @@ def get_backend_class(name: str):
     Raises:
         ValueError: If name is not a valid backend.
     """
-    if name == "github":
-        return GitHubStorage
-    elif name == "taskwarrior":
-        return TaskwarriorStorage
-    elif name == "beads":
-        from .beads import BeadsStorage
-
-        return BeadsStorage
-    else:
-        raise ValueError(f"Unknown backend: {name!r}")
+    try:
+        loader = _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown backend: {name!r}") from None
+    return loader()
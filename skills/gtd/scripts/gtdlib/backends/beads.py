@@ -18,13 +18,129 @@ Architecture:
 from __future__ import annotations
 
 import json
+import re
 import subprocess
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from typing import IO, Any
 
-from ..storage import GTDItem, GTDStorage, StorageNotSetupError
+from ..config import BeadsBackendConfig
+from ..storage import GTDItem, GTDStorage, PartialCreateError, StorageNotSetupError
 
-if TYPE_CHECKING:
-    from ..config import BeadsBackendConfig
+# Maximum item IDs passed to a single multi-ID bd command
+_BD_BATCH_SIZE = 500
+
+# Maximum raw beads kept by BeadsStorage's `bd show` cache
+_BEAD_CACHE_SIZE = 256
+
+# gtd:<category>:<value> -> (category, value); the value may contain colons
+_GTD_LABEL_RE = re.compile(r"gtd:([^:]+):(.+)", re.DOTALL)
+
+_PROJECT_PREFIX = "project:"
+
+# Shared stand-in for a bead without labels; only ever iterated
+_EMPTY: tuple[str, ...] = ()
+
+# Beads status -> GTD state; anything not listed is treated as open
+_STATE_MAP = {"closed": "closed"}
+
+# Shared decoder for bd output; calling it directly skips json.loads'
+# per-call type and keyword dispatch
+_JSON_DECODER = json.JSONDecoder()
+_decode_json = _JSON_DECODER.decode
+_STREAM_CHUNK_SIZE = 65536
+
+
+def _iter_json_array(stream: IO[str]) -> Iterator[Any]:
+    """Yield the elements of a JSON array as they are read from a stream.
+
+    Only the current element is held in memory, not the whole document.
+    Empty output yields nothing; a non-array document is decoded in full and
+    yields its elements if it is a list.
+
+    Raises:
+        json.JSONDecodeError: If the output is not valid JSON.
+    """
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        """Read another chunk into buf; False once the stream is exhausted."""
+        nonlocal buf, pos, eof
+        chunk = stream.read(_STREAM_CHUNK_SIZE)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip(chars: str) -> str:
+        """Skip chars and return the next character ("" at end of output)."""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf) or not fill():
+                return buf[pos : pos + 1]
+
+    first = skip(" \t\r\n")
+    if not first:
+        return
+    if first != "[":
+        while fill():
+            pass
+        data = _decode_json(buf[pos:])
+        if isinstance(data, list):
+            yield from data
+        return
+    pos += 1
+
+    while True:
+        if skip(" \t\r\n,") == "]":
+            return
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof or not fill():
+                    raise
+                continue
+            # A value ending exactly at the buffer edge may be truncated
+            if end < len(buf) or eof or not fill():
+                break
+        yield value
+        pos = end
+
+
+@cache
+def _label_to_beads(label: str) -> str:
+    """Convert a GTD label to Beads format (context/focus -> gtd:context:focus)."""
+    category, value = label.split("/", 1)
+    return f"gtd:{category}:{value}"
+
+
+# Bounded: unlike GTD labels, Beads labels include arbitrary project/user names
+@lru_cache(maxsize=1024)
+def _beads_to_label(beads_label: str) -> str | None:
+    """Convert a Beads label to GTD format, or None if not a GTD label."""
+    m = _GTD_LABEL_RE.fullmatch(beads_label)
+    return f"{m[1]}/{m[2]}" if m else None
+
+
+def _bead_from_show(output: str) -> dict | None:
+    """Decode `bd show --json` output into a single bead, or None."""
+    try:
+        data = _decode_json(output)
+    except json.JSONDecodeError:
+        return None
+    # bd show returns an array even for single items
+    if isinstance(data, list):
+        data = data[0] if data else None
+    return data
 
 
 class BeadsStorage(GTDStorage):
@@ -34,11 +150,17 @@ class BeadsStorage(GTDStorage):
         """Initialize Beads storage.
 
         Args:
-            config: Beads backend configuration. Currently empty as bd
-                auto-discovers its .beads/ directory. Kept for interface
-                consistency with other backends.
+            config: Beads backend configuration (bd auto-discovers its
+                .beads/ directory; only tuning options live here).
         """
         self.config = config
+        self.max_workers = (config or BeadsBackendConfig()).max_workers
+        # Set once `bd status` succeeds; bd cannot become unavailable for the
+        # lifetime of this instance in practice, so the probe is not repeated
+        self._bd_ready = False
+        # Raw `bd show` results by ID, least recently used first. Entries are
+        # dropped whenever this instance mutates the item.
+        self._bead_cache: OrderedDict[str, dict] = OrderedDict()
 
     def _run_bd(
         self, args: list[str], check: bool = True, verbose: bool = False
@@ -60,13 +182,119 @@ class BeadsStorage(GTDStorage):
         cmd = ["bd"] + args
         if verbose:
             print(f"  [DEBUG] Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # bd has no batch/REPL mode to keep alive between calls; at least make
+        # sure it never blocks waiting on (or inherits) our stdin. bd emits
+        # UTF-8, so decode it as such rather than via the locale codec
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            encoding="utf-8",
+            errors="replace",
+            stdin=subprocess.DEVNULL,
+        )
         if result.returncode != 0:
             if check:
                 raise RuntimeError(f"bd command failed: {result.stderr}")
             return ""
         return result.stdout
 
+    def _iter_bd_json(self, args: list[str], verbose: bool = False) -> Iterator[Any]:
+        """Run a bd command printing a JSON array and yield elements as they arrive.
+
+        Unlike _run_bd(), the output is never buffered in full, so large
+        result sets (e.g. `bd list --limit 0`) use constant memory.
+
+        Args:
+            args: Command arguments to pass to bd.
+            verbose: If True, print the command being run.
+
+        Yields:
+            Decoded array elements.
+
+        Raises:
+            RuntimeError: If the command fails.
+            FileNotFoundError: If bd binary is not installed.
+            json.JSONDecodeError: If the output is not valid JSON.
+        """
+        cmd = ["bd"] + args
+        if verbose:
+            print(f"  [DEBUG] Running: {' '.join(cmd)}")
+        # stderr is discarded: reading it only after stdout could deadlock
+        with subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+            errors="replace",
+        ) as proc:
+            yield from _iter_json_array(proc.stdout)
+        if proc.returncode != 0:
+            raise RuntimeError(f"bd command failed with exit code {proc.returncode}")
+
+    def _mutate(self, item_id: str, args: list[str], check: bool = True) -> str:
+        """Run a bd command that changes item_id and drop its cached state.
+
+        Args:
+            item_id: Beads issue ID being changed.
+            args: Command arguments to pass to bd.
+            check: If True, raise RuntimeError on non-zero exit code.
+
+        Returns:
+            stdout from the command.
+        """
+        try:
+            return self._run_bd(args, check=check)
+        finally:
+            self._bead_cache.pop(item_id, None)
+
+    def _show_bead(self, item_id: str) -> dict | None:
+        """Get the raw bd JSON for an item, or None if not found.
+
+        Results are cached until this instance mutates the item.
+        """
+        bead = self._bead_cache.get(item_id)
+        if bead is not None:
+            self._bead_cache.move_to_end(item_id)
+            return bead
+        try:
+            data = _bead_from_show(self._run_bd(["show", item_id, "--json"]))
+        except RuntimeError:
+            return None
+        if data is not None:
+            self._remember_bead(item_id, data)
+        return data
+
+    def _remember_bead(self, item_id: str, bead: dict) -> None:
+        """Store raw bd JSON for an item in the bounded show cache."""
+        self._bead_cache[item_id] = bead
+        self._bead_cache.move_to_end(item_id)
+        if len(self._bead_cache) > _BEAD_CACHE_SIZE:
+            self._bead_cache.popitem(last=False)
+
+    def _run_bd_many(self, commands: list[list[str]], check: bool = False) -> list[str]:
+        """Run independent bd commands concurrently.
+
+        Each bd process spends most of its time starting up and waiting on
+        its database, so up to max_workers of them are overlapped.
+
+        Args:
+            commands: Argument lists, one per bd invocation.
+            check: If True, raise RuntimeError if any command fails;
+                otherwise failed commands yield "".
+
+        Returns:
+            stdout of each command, in the order of commands.
+        """
+        if len(commands) == 1:
+            return [self._run_bd(commands[0], check=check)]
+        workers = max(1, min(self.max_workers, len(commands)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Consume results so errors such as a missing bd binary propagate
+            return list(
+                pool.map(lambda args: self._run_bd(args, check=check), commands)
+            )
+
     # --- Label Conversion ---
 
     def _label_to_beads(self, label: str) -> str:
@@ -74,8 +302,7 @@ class BeadsStorage(GTDStorage):
 
         Example: context/focus -> gtd:context:focus
         """
-        category, value = label.split("/", 1)
-        return f"gtd:{category}:{value}"
+        return _label_to_beads(label)
 
     def _beads_to_label(self, beads_label: str) -> str | None:
         """Convert Beads label to GTD label format.
@@ -83,39 +310,18 @@ class BeadsStorage(GTDStorage):
         Example: gtd:context:focus -> context/focus
         Returns None if not a GTD label.
         """
-        if not beads_label.startswith("gtd:"):
-            return None
-        parts = beads_label.split(":", 2)
-        if len(parts) != 3 or not parts[1] or not parts[2]:
-            return None
-        return f"{parts[1]}/{parts[2]}"
+        return _beads_to_label(beads_label)
 
     def _labels_to_beads(self, labels: list[str]) -> list[str]:
         """Convert a list of GTD labels to Beads format."""
-        return [self._label_to_beads(label) for label in labels]
+        return [_label_to_beads(label) for label in labels]
 
     def _parse_beads_labels(self, beads_labels: list[str]) -> list[str]:
         """Extract GTD labels from a list of Beads labels.
 
         Filters out non-GTD labels (e.g., project:X, custom labels).
         """
-        gtd_labels = []
-        for beads_label in beads_labels:
-            label = self._beads_to_label(beads_label)
-            if label is not None:
-                gtd_labels.append(label)
-        return gtd_labels
-
-    def _extract_project(self, beads_labels: list[str]) -> str | None:
-        """Extract project name from Beads labels.
-
-        Looks for labels matching 'project:<name>'.
-        Returns the first project found, or None.
-        """
-        for label in beads_labels:
-            if label.startswith("project:"):
-                return label.split(":", 1)[1]
-        return None
+        return [label for bl in beads_labels if (label := _beads_to_label(bl))]
 
     # --- Parsing ---
 
@@ -132,19 +338,23 @@ class BeadsStorage(GTDStorage):
         - created_at -> created_at
         - closed_at -> closed_at
         """
-        beads_labels = data.get("labels", []) or []
-        gtd_labels = self._parse_beads_labels(beads_labels)
-        project = self._extract_project(beads_labels)
+        beads_labels = data.get("labels") or _EMPTY
 
-        # Map beads status to GTD state
-        status = data.get("status", "open")
-        state = "closed" if status == "closed" else "open"
+        # One pass over the labels: GTD labels are converted, and the first
+        # project:<name> label becomes the project
+        gtd_labels: list[str] = []
+        project: str | None = None
+        for beads_label in beads_labels:
+            if label := _beads_to_label(beads_label):
+                gtd_labels.append(label)
+            elif project is None and beads_label.startswith(_PROJECT_PREFIX):
+                project = beads_label[len(_PROJECT_PREFIX) :]
 
         return GTDItem(
             id=data["id"],
             title=data.get("title", ""),
             body=data.get("description") or None,
-            state=state,
+            state=_STATE_MAP.get(data.get("status"), "open"),
             labels=gtd_labels,
             project=project,
             url=None,  # Beads has no URL concept
@@ -163,11 +373,14 @@ class BeadsStorage(GTDStorage):
 
     def is_setup(self) -> bool:
         """Check if bd CLI is available and a Beads database exists."""
+        if self._bd_ready:
+            return True
         try:
             self._run_bd(["status", "--json"], check=True)
-            return True
         except (RuntimeError, FileNotFoundError):
             return False
+        self._bd_ready = True
+        return True
 
     def setup(self, verbose: bool = False, fix_drift: bool = False) -> None:  # noqa: ARG002
         """Verify Beads is set up. Raises if bd is not available.
@@ -182,8 +395,12 @@ class BeadsStorage(GTDStorage):
         Raises:
             StorageNotSetupError: If bd is not installed or not initialized.
         """
+        self._bead_cache.clear()
         try:
-            self._run_bd(["status", "--json"], check=True)
+            # Reuse a successful is_setup() probe instead of running bd again
+            if not self._bd_ready:
+                self._run_bd(["status", "--json"], check=True)
+                self._bd_ready = True
             if verbose:
                 print("Beads backend is ready.")
         except FileNotFoundError:
@@ -214,20 +431,86 @@ class BeadsStorage(GTDStorage):
         Returns:
             Created GTDItem.
         """
-        beads_labels = self._labels_to_beads(labels)
-        if project:
-            beads_labels.append(f"project:{project}")
-
-        args = ["create", title, "--labels", ",".join(beads_labels), "--silent"]
-        if body:
-            args.extend(["--description", body])
-
         # bd create --silent returns just the ID
-        output = self._run_bd(args)
+        output = self._run_bd(self._create_args(title, labels, body, project))
         item_id = output.strip()
 
         return self._get_item_or_raise(item_id)
 
+    def create_items(self, specs: list[dict]) -> list[GTDItem]:
+        """Create several items, then fetch them all with one `bd list`.
+
+        The bd create processes run one after another: they all write to the
+        same database, and a failure must not leave created items unreported.
+
+        Args:
+            specs: create_item() keyword arguments, one dict per item.
+
+        Returns:
+            Created GTDItems, in the order of specs.
+
+        Raises:
+            PartialCreateError: If a create fails; carries the items created
+                before it. Later specs are not attempted.
+        """
+        item_ids: list[str] = []
+        error = None
+        for spec in specs:
+            try:
+                item_ids.append(self._run_bd(self._create_args(**spec)).strip())
+            except RuntimeError as e:
+                error = e
+                break
+        if not item_ids:
+            if error is not None:
+                raise PartialCreateError(str(error), created=[]) from error
+            return []
+
+        try:
+            beads = {
+                bead["id"]: bead
+                for bead in self._iter_bd_json(
+                    ["list", "--json", "--id", ",".join(item_ids), "--limit", "0"]
+                )
+            }
+        except (RuntimeError, json.JSONDecodeError, KeyError, TypeError):
+            beads = {}
+
+        items = []
+        for item_id in item_ids:
+            bead = beads.get(item_id)
+            if bead is None:
+                items.append(self._get_item_or_raise(item_id))
+            else:
+                self._remember_bead(item_id, bead)
+                items.append(self._parse_bead(bead))
+        if error is not None:
+            raise PartialCreateError(
+                f"{error} (created before the failure: {', '.join(item_ids)})",
+                created=items,
+            ) from error
+        return items
+
+    def _create_args(
+        self,
+        title: str,
+        labels: list[str],
+        body: str | None = None,
+        project: str | None = None,
+    ) -> list[str]:
+        """Build the `bd create --silent` arguments for one item."""
+        labels_csv = ",".join(_label_to_beads(label) for label in labels)
+        if project:
+            project_label = f"project:{project}"
+            labels_csv = (
+                f"{labels_csv},{project_label}" if labels_csv else project_label
+            )
+
+        args = ["create", title, "--labels", labels_csv, "--silent"]
+        if body:
+            args.extend(["--description", body])
+        return args
+
     def get_item(self, item_id: str) -> GTDItem | None:
         """Get a single item by ID.
 
@@ -237,17 +520,32 @@ class BeadsStorage(GTDStorage):
         Returns:
             GTDItem or None if not found.
         """
-        try:
-            output = self._run_bd(["show", item_id, "--json"])
-            data = json.loads(output)
-            # bd show returns an array even for single items
-            if isinstance(data, list):
-                if not data:
-                    return None
-                return self._parse_bead(data[0])
-            return self._parse_bead(data)
-        except (RuntimeError, json.JSONDecodeError):
-            return None
+        bead = self._show_bead(item_id)
+        return self._parse_bead(bead) if bead is not None else None
+
+    def get_items(self, item_ids: list[str]) -> list[GTDItem | None]:
+        """Get several items by ID, overlapping the bd show processes.
+
+        Args:
+            item_ids: Beads issue IDs.
+
+        Returns:
+            GTDItem (or None if not found) for each ID, in the same order.
+        """
+        missing = [i for i in dict.fromkeys(item_ids) if i not in self._bead_cache]
+        fetched: dict[str, dict | None] = {}
+        if missing:
+            commands = [["show", item_id, "--json"] for item_id in missing]
+            for item_id, output in zip(missing, self._run_bd_many(commands)):
+                bead = fetched[item_id] = _bead_from_show(output)
+                if bead is not None:
+                    self._remember_bead(item_id, bead)
+
+        items: list[GTDItem | None] = []
+        for item_id in item_ids:
+            bead = fetched[item_id] if item_id in fetched else self._show_bead(item_id)
+            items.append(self._parse_bead(bead) if bead is not None else None)
+        return items
 
     def list_items(
         self,
@@ -277,25 +575,24 @@ class BeadsStorage(GTDStorage):
         # Build label filters
         all_labels: list[str] = []
         if labels:
-            all_labels.extend(self._labels_to_beads(labels))
+            all_labels.extend(_label_to_beads(label) for label in labels)
         if project:
             all_labels.append(f"project:{project}")
 
         for label in all_labels:
             args.extend(["--label", label])
 
-        output = self._run_bd(args, check=False, verbose=verbose)
-        if not output.strip():
-            return []
-
+        # Parse beads as they stream in rather than buffering the whole listing
         try:
-            data = json.loads(output)
-            items = [self._parse_bead(bead) for bead in data]
-            if verbose:
-                print(f"  [DEBUG] Got {len(items)} items from Beads")
-            return items
-        except json.JSONDecodeError:
+            items = [
+                self._parse_bead(bead)
+                for bead in self._iter_bd_json(args, verbose=verbose)
+            ]
+        except (RuntimeError, json.JSONDecodeError):
             return []
+        if verbose:
+            print(f"  [DEBUG] Got {len(items)} items from Beads")
+        return items
 
     def update_item(
         self,
@@ -324,48 +621,78 @@ class BeadsStorage(GTDStorage):
         if body is not None:
             args.extend(["--description", body])
 
-        if labels is not None:
-            beads_labels = self._labels_to_beads(labels)
-            # When setting labels, preserve non-GTD labels and replace GTD ones
-            current_beads_labels = self._get_current_beads_labels(item_id)
-            # Keep only non-GTD, non-project labels from current state
-            other_labels = [
-                bl
-                for bl in current_beads_labels
-                if not bl.startswith("gtd:") and not bl.startswith("project:")
-            ]
-            all_beads_labels = other_labels + beads_labels
-            # Add project label: new value, existing value, or nothing
-            if project is not None:
-                all_beads_labels.append(f"project:{project}")
-            else:
-                existing_project = self._extract_project(current_beads_labels)
-                if existing_project:
-                    all_beads_labels.append(f"project:{existing_project}")
-            args.extend(["--set-labels", ",".join(all_beads_labels)])
-        elif project is not None:
-            # Only updating project, not labels
-            current_beads_labels = self._get_current_beads_labels(item_id)
-            updated_labels = [
-                bl for bl in current_beads_labels if not bl.startswith("project:")
-            ]
-            if project:
-                updated_labels.append(f"project:{project}")
-            args.extend(["--set-labels", ",".join(updated_labels)])
+        if labels is not None or project is not None:
+            # Send only the label changes; non-GTD labels are left untouched
+            current = self._get_current_beads_labels(item_id)
+            to_add, to_remove = self._label_delta(current, labels, project)
+            for beads_label in to_add:
+                args.extend(["--add-label", beads_label])
+            for beads_label in to_remove:
+                args.extend(["--remove-label", beads_label])
 
-        self._run_bd(args)
-        return self._get_item_or_raise(item_id)
+        output = self._mutate(item_id, args)
+        return self._item_from_update(item_id, output)
+
+    def _label_delta(
+        self, current: Sequence[str], labels: list[str] | None, project: str | None
+    ) -> tuple[list[str], list[str]]:
+        """Compute Beads labels to add and remove for update_item.
+
+        Args:
+            current: Current raw Beads labels of the item.
+            labels: New complete GTD label set, or None to keep GTD labels.
+            project: New project name ("" clears it), or None to keep it.
 
-    def _get_current_beads_labels(self, item_id: str) -> list[str]:
-        """Get current raw Beads labels for an item."""
+        Returns:
+            Tuple of (labels to add, labels to remove).
+        """
+        current_set = set(current)
+        to_add: dict[str, None] = {}
+        to_remove: dict[str, None] = {}
+
+        if labels is not None:
+            desired = self._labels_to_beads(labels)
+            wanted = set(desired)
+            for beads_label in desired:
+                if beads_label not in current_set:
+                    to_add[beads_label] = None
+            for beads_label in current:
+                if beads_label.startswith("gtd:") and beads_label not in wanted:
+                    to_remove[beads_label] = None
+
+        if project is not None:
+            project_label = f"project:{project}" if project else None
+            for beads_label in current:
+                if beads_label.startswith("project:") and beads_label != project_label:
+                    to_remove[beads_label] = None
+            if project_label and project_label not in current_set:
+                to_add[project_label] = None
+
+        return list(to_add), list(to_remove)
+
+    def _item_from_update(self, item_id: str, output: str) -> GTDItem:
+        """Build the updated item from `bd update --json` output.
+
+        Falls back to `bd show` when the output does not carry the full bead
+        (e.g. the command failed or bd omitted the labels).
+        """
         try:
-            output = self._run_bd(["show", item_id, "--json"], check=False)
-            data = json.loads(output)
-            if isinstance(data, list) and data:
-                return data[0].get("labels", []) or []
-            return []
-        except (json.JSONDecodeError, RuntimeError):
-            return []
+            data = _decode_json(output)
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, list):
+            data = data[0] if data else None
+        if isinstance(data, dict) and data.get("id") == item_id and "labels" in data:
+            self._remember_bead(item_id, data)
+            return self._parse_bead(data)
+        return self._get_item_or_raise(item_id)
+
+    def _get_current_beads_labels(self, item_id: str) -> Sequence[str]:
+        """Get current raw Beads labels for an item (do not mutate)."""
+        bead = self._show_bead(item_id)
+        if bead is None:
+            return _EMPTY
+        return bead.get("labels") or _EMPTY
 
     def add_labels(self, item_id: str, labels: list[str]) -> GTDItem:
         """Add labels to an item.
@@ -379,9 +706,9 @@ class BeadsStorage(GTDStorage):
         """
         args = ["update", item_id, "--json"]
         for label in labels:
-            args.extend(["--add-label", self._label_to_beads(label)])
-        self._run_bd(args)
-        return self._get_item_or_raise(item_id)
+            args.extend(["--add-label", _label_to_beads(label)])
+        output = self._mutate(item_id, args)
+        return self._item_from_update(item_id, output)
 
     def remove_labels(self, item_id: str, labels: list[str]) -> GTDItem:
         """Remove labels from an item.
@@ -395,9 +722,9 @@ class BeadsStorage(GTDStorage):
         """
         args = ["update", item_id, "--json"]
         for label in labels:
-            args.extend(["--remove-label", self._label_to_beads(label)])
-        self._run_bd(args, check=False)
-        return self._get_item_or_raise(item_id)
+            args.extend(["--remove-label", _label_to_beads(label)])
+        output = self._mutate(item_id, args, check=False)
+        return self._item_from_update(item_id, output)
 
     def close_item(self, item_id: str) -> GTDItem:
         """Close/complete an item.
@@ -408,7 +735,7 @@ class BeadsStorage(GTDStorage):
         Returns:
             Updated GTDItem with state="closed".
         """
-        self._run_bd(["close", item_id, "--json"])
+        self._mutate(item_id, ["close", item_id, "--json"])
         return self._get_item_or_raise(item_id)
 
     def reopen_item(self, item_id: str) -> GTDItem:
@@ -420,7 +747,7 @@ class BeadsStorage(GTDStorage):
         Returns:
             Updated GTDItem with state="open".
         """
-        self._run_bd(["reopen", item_id, "--json"])
+        self._mutate(item_id, ["reopen", item_id, "--json"])
         return self._get_item_or_raise(item_id)
 
     def add_comment(self, item_id: str, body: str) -> None:
@@ -430,7 +757,7 @@ class BeadsStorage(GTDStorage):
             item_id: Beads issue ID.
             body: Comment text.
         """
-        self._run_bd(["comments", "add", item_id, body])
+        self._mutate(item_id, ["comments", "add", item_id, body])
 
     # --- Beads-specific methods (not in base class) ---
 
@@ -445,7 +772,7 @@ class BeadsStorage(GTDStorage):
         """
         try:
             output = self._run_bd(["comments", item_id, "--json"])
-            data = json.loads(output)
+            data = _decode_json(output)
             return data if isinstance(data, list) else []
         except (RuntimeError, json.JSONDecodeError):
             return []
@@ -458,7 +785,7 @@ class BeadsStorage(GTDStorage):
             output = self._run_bd(["label", "list-all", "--json"], check=False)
             if not output.strip():
                 return set()
-            data = json.loads(output)
+            data = _decode_json(output)
             labels: set[str] = set()
             all_beads_labels = data if isinstance(data, list) else []
             for beads_label in all_beads_labels:
@@ -468,7 +795,7 @@ class BeadsStorage(GTDStorage):
                     if isinstance(beads_label, str)
                     else beads_label.get("name", "")
                 )
-                gtd_label = self._beads_to_label(label_str)
+                gtd_label = _beads_to_label(label_str)
                 if gtd_label:
                     labels.add(gtd_label)
             return labels
@@ -478,15 +805,15 @@ class BeadsStorage(GTDStorage):
     def get_stale_labels(self) -> list[str]:
         """Find GTD-prefixed labels not in the canonical taxonomy."""
         existing = self.get_existing_labels()
-        required = self.get_required_labels()
-        prefixes = self.get_label_prefixes()
-
-        stale = []
-        for label in existing:
-            if any(label.startswith(prefix) for prefix in prefixes):
-                if label not in required:
-                    stale.append(label)
-        return sorted(stale)
+        required = frozenset(self.get_required_labels())
+        # A tuple lets str.startswith test every prefix in a single call
+        prefixes = tuple(self.get_label_prefixes())
+
+        return sorted(
+            label
+            for label in existing
+            if label.startswith(prefixes) and label not in required
+        )
 
     def get_label_drift(self) -> list[dict]:
         """Beads labels have no color/description, so drift is N/A."""
@@ -501,23 +828,26 @@ class BeadsStorage(GTDStorage):
         Returns:
             True if the label was found and removed, False otherwise.
         """
-        beads_label = self._label_to_beads(name)
+        beads_label = _label_to_beads(name)
         try:
-            # Find items with this label
-            output = self._run_bd(
-                ["list", "--json", "--label", beads_label, "--limit", "0"],
-                check=False,
-            )
-            if not output.strip():
-                return False
-            items = json.loads(output)
-            if not items:
-                return False
-            for item in items:
-                self._run_bd(
-                    ["update", item["id"], "--remove-label", beads_label],
-                    check=False,
+            # Find items with this label; only the IDs are kept
+            item_ids = [
+                item["id"]
+                for item in self._iter_bd_json(
+                    ["list", "--json", "--label", beads_label, "--limit", "0"]
                 )
-            return True
-        except (RuntimeError, json.JSONDecodeError):
+            ]
+        except (RuntimeError, json.JSONDecodeError, KeyError, TypeError):
+            return False
+        if not item_ids:
             return False
+        # bd update accepts several IDs; batch them so one process handles
+        # many items while the command line stays well under ARG_MAX
+        self._bead_cache.clear()
+        commands = [
+            ["update", *item_ids[start : start + _BD_BATCH_SIZE]]
+            + ["--remove-label", beads_label]
+            for start in range(0, len(item_ids), _BD_BATCH_SIZE)
+        ]
+        self._run_bd_many(commands)
+        return True
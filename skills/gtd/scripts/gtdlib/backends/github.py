@@ -3,11 +3,123 @@
 from __future__ import annotations
 
 import json
+import re
 import subprocess
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any
+from urllib.parse import quote
 
 from ..metadata import GTDMetadata, update_body_metadata
 from ..storage import GTDItem, GTDStorage
 
+# Concurrent gh processes for independent label changes; kept low to stay
+# clear of GitHub's secondary rate limits
+_GH_MAX_WORKERS = 8
+
+
+# Shared decoder for gh output; calling it directly skips json.loads'
+# per-call type and keyword dispatch
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_json(output: bytes) -> Any:
+    """Decode gh's UTF-8 JSON output."""
+    return _JSON_DECODER.decode(output.decode())
+
+
+# GraphQL issue listing requesting only the fields _parse_issue() reads. It
+# reads the repository's issues directly rather than the search index, so
+# just-created issues are listed and there is no 1000-result cap.
+_ISSUE_LIST_QUERY_TEMPLATE = """
+query(
+  $owner: String!, $name: String!, $states: [IssueState!], $labels: [String!],
+  $first: Int!, $after: String%(milestone_var)s
+) {
+  repository(owner: $owner, name: $name) {
+    issues(
+      states: $states, labels: $labels,%(milestone_filter)s
+      orderBy: {field: CREATED_AT, direction: DESC}, first: $first, after: $after
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title body state url createdAt closedAt
+        milestone { title }
+        labels(first: 100) { nodes { name } }
+      }
+    }
+  }
+}
+"""
+# The milestone filter is only sent with a project: a null milestoneNumber
+# means "issues without a milestone" rather than "any milestone"
+_ISSUE_LIST_QUERY = _ISSUE_LIST_QUERY_TEMPLATE % {
+    "milestone_var": "",
+    "milestone_filter": "",
+}
+_ISSUE_LIST_BY_MILESTONE_QUERY = _ISSUE_LIST_QUERY_TEMPLATE % {
+    "milestone_var": ", $milestone: String!",
+    "milestone_filter": " filterBy: {milestoneNumber: $milestone},",
+}
+
+# Blank line ending the headers in `gh api -i` output
+_HEADER_END_RE = re.compile(rb"\r?\n\r?\n")
+
+# Page number of the rel="next" entry in a REST Link header
+_NEXT_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="next"')
+
+# Largest page size the REST API allows
+_PER_PAGE = 100
+
+# Milestone fields returned by list_milestones()
+_MILESTONE_FIELDS = (
+    "number",
+    "title",
+    "description",
+    "due_on",
+    "open_issues",
+    "closed_issues",
+    "state",
+    "url",
+)
+
+
+def _split_http_response(output: bytes) -> tuple[int, dict[str, str], bytes]:
+    """Split `gh api -i` output into (status, lowercased headers, body).
+
+    Returns status 0 if the output does not start with an HTTP status line.
+    """
+    if not output.startswith(b"HTTP/"):
+        return 0, {}, b""
+    # A bodiless response (e.g. 304) may end without the blank line
+    end = _HEADER_END_RE.search(output)
+    head, body = (
+        (output, b"") if end is None else (output[: end.start()], output[end.end() :])
+    )
+    lines = head.decode("latin-1").splitlines()
+    parts = lines[0].split(" ", 2)
+    if len(parts) < 2 or not parts[1].isdigit():
+        return 0, {}, b""
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return int(parts[1]), headers, body
+
+
+def _milestone_fields(milestone: dict) -> dict:
+    """Reduce a REST milestone to the fields list_milestones() reports."""
+    return {key: milestone.get(key) for key in _MILESTONE_FIELDS}
+
+
+def _label_drifted(actual: dict, config: dict) -> bool:
+    """Check if a repo label's color or description differs from its config."""
+    return (
+        actual.get("color", "").lower() != config["color"].lower()
+        or actual.get("description", "") != config["description"]
+    )
+
 
 class GitHubStorage(GTDStorage):
     """GTD storage using GitHub Issues via gh CLI."""
@@ -20,39 +132,239 @@ class GitHubStorage(GTDStorage):
                   uses the current repo from git context.
         """
         self.repo = repo
-        self._repo_args = ["--repo", repo] if repo else []
+        # Immutable argv suffix; gh reads --repo from the subcommand, not "gh"
+        self._repo_args: tuple[str, ...] = ("--repo", repo) if repo else ()
+        self._repo_info: tuple[str, str] | None = None
+        # Repo labels as last listed, kept in step with our own label changes
+        self._labels_cache: list[dict] | None = None
+        self._labels_lock = Lock()
+        # The taxonomy is fixed at runtime, so derive its lookups once
+        self._required_labels = frozenset(self.get_required_labels())
+        self._label_configs = {
+            f"{category}/{name}": config
+            for category, items in self.LABELS.items()
+            for name, config in items.items()
+        }
+        # Milestones (all states) by title, kept in step with our own changes
+        self._milestones_cache: dict[str, dict] | None = None
+        # Last (ETag, decoded body, next page) per REST GET page, for
+        # conditional requests
+        self._etags: dict[str, tuple[str, Any, str | None]] = {}
 
     def _run_gh(
-        self, args: list[str], check: bool = True, verbose: bool = False
+        self,
+        args: list[str],
+        check: bool = True,
+        verbose: bool = False,
+        input: str | None = None,
     ) -> str:
         """Run a gh command and return output."""
-        cmd = ["gh"] + args + self._repo_args
-        if verbose:
-            print(f"  [DEBUG] Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        return self._run_gh_bytes(args, check, verbose, input).decode()
+
+    def _run_gh_bytes(
+        self,
+        args: list[str],
+        check: bool = True,
+        verbose: bool = False,
+        input: str | None = None,
+    ) -> bytes:
+        """Run a gh command and return its raw output.
+
+        JSON callers hand the bytes straight to _decode_json(), skipping the
+        text-mode decode and newline translation passes over the output.
+        """
+        result = self._exec_gh(args, verbose, input)
         if result.returncode != 0:
             if check:
-                raise RuntimeError(f"gh command failed: {result.stderr}")
-            return ""
+                stderr = result.stderr.decode(errors="replace")
+                raise RuntimeError(f"gh command failed: {stderr}")
+            return b""
         return result.stdout
 
+    def _exec_gh(
+        self, args: list[str], verbose: bool = False, input: str | None = None
+    ) -> subprocess.CompletedProcess[bytes]:
+        """Run a gh command, capturing its output as bytes."""
+        # gh api takes the repo in the endpoint path and rejects --repo
+        if args[0] == "api":
+            cmd = ["gh", *args]
+        else:
+            cmd = ["gh", *args, *self._repo_args]
+        if verbose:
+            print(f"  [DEBUG] Running: {' '.join(cmd)}")
+        return subprocess.run(
+            cmd,
+            capture_output=True,
+            input=input.encode() if input is not None else None,
+        )
+
+    def _map_concurrent(self, fn: Callable[[Any], Any], items: list) -> list:
+        """Apply fn to each item on a bounded thread pool, keeping order.
+
+        Each gh call is dominated by process startup and network latency, so
+        independent calls are overlapped.
+        """
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        workers = min(_GH_MAX_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fn, items))
+
+    def _repo_path(self, path: str) -> str:
+        """Get the REST endpoint for a path under the repo (e.g. "labels")."""
+        return f"repos/{self.repo or ':owner/:repo'}/{path}"
+
+    def _api(
+        self,
+        method: str,
+        path: str,
+        payload: dict | None = None,
+        check: bool = True,
+    ) -> Any:
+        """Call a REST endpoint under the repo via gh api.
+
+        gh supplies authentication and host resolution; the payload is sent
+        as the JSON request body.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, PUT, DELETE).
+            path: Endpoint path relative to the repo (e.g. "issues/12").
+            payload: Optional JSON request body.
+            check: If True, raise RuntimeError if the request fails.
+
+        Returns:
+            Decoded JSON response, or None if the response is empty.
+        """
+        args = ["api", "-X", method, self._repo_path(path)]
+        body = None
+        if payload is not None:
+            args.extend(["--input", "-"])
+            body = json.dumps(payload)
+        output = self._run_gh_bytes(args, check=check, input=body)
+        return _decode_json(output) if output.strip() else None
+
+    def _api_get(self, path: str) -> Any:
+        """GET a REST endpoint under the repo, following pagination.
+
+        List endpoints are fetched page by page as the Link header directs,
+        and the pages are concatenated, so nothing is silently truncated.
+
+        Args:
+            path: Endpoint path relative to the repo, including any query
+                (e.g. "milestones?state=open&per_page=100").
+
+        Returns:
+            Decoded JSON response, or None if any request failed.
+        """
+        separator = "&" if "?" in path else "?"
+        data, next_page = self._api_get_page(path)
+        if next_page is None:
+            return data
+        items = list(data)
+        while next_page is not None:
+            page, next_page = self._api_get_page(f"{path}{separator}page={next_page}")
+            if not isinstance(page, list):
+                return None
+            items.extend(page)
+        return items
+
+    def _api_get_page(self, path: str) -> tuple[Any, str | None]:
+        """GET one page of a REST endpoint, revalidating by ETag.
+
+        Repeat requests send If-None-Match; when nothing changed GitHub
+        answers 304 Not Modified with no body (and without charging the rate
+        limit), and the previously decoded page is returned.
+
+        Returns:
+            Tuple of (decoded JSON or None if the request failed, next page
+            number or None if this is the last page).
+        """
+        args = ["api", "-i", self._repo_path(path)]
+        cached = self._etags.get(path)
+        if cached:
+            args.extend(["-H", f"If-None-Match: {cached[0]}"])
+        # gh exits non-zero for a 304, so judge by the status line instead
+        status, headers, body = _split_http_response(self._exec_gh(args).stdout)
+        if status == 304 and cached:
+            return cached[1], cached[2]
+        if status != 200:
+            return None, None
+        data = _decode_json(body)
+        link = _NEXT_PAGE_RE.search(headers.get("link", ""))
+        next_page = link.group(1) if isinstance(data, list) and link else None
+        etag = headers.get("etag")
+        if etag:
+            self._etags[path] = (etag, data, next_page)
+        return data, next_page
+
+    def snapshot(self) -> None:
+        """Prefetch the repo's labels and milestones concurrently.
+
+        Both listings are independent round-trips, so overlapping them halves
+        the wait for commands that need both; the label and milestone queries
+        that follow are served from the caches this fills.
+        """
+        self._map_concurrent(
+            lambda load: load(),
+            [self.get_existing_labels_full, self._milestones_by_title],
+        )
+
+    def _label_path(self, name: str) -> str:
+        """Get the REST path for a label (names contain "/")."""
+        return f"labels/{quote(name, safe='')}"
+
     def get_existing_labels(self) -> set[str]:
         """Get set of existing label names in the repo."""
-        labels = self.get_existing_labels_full()
-        return {label["name"] for label in labels}
+        return set(self._labels_by_name())
+
+    def _labels_by_name(self) -> dict[str, dict]:
+        """Index the (cached) full label listing by label name.
+
+        Every label query is a view over get_existing_labels_full(), so the
+        repo's labels are fetched and decoded once however many are made.
+        """
+        return {label["name"]: label for label in self.get_existing_labels_full()}
 
     def get_existing_labels_full(self) -> list[dict]:
-        """Get full label data (name, color, description) from the repo."""
-        output = self._run_gh(
-            ["label", "list", "--json", "name,color,description", "--limit", "200"],
-            check=False,
-        )
-        if not output:
-            return []
+        """Get full label data (name, color, description) from the repo.
+
+        The listing is fetched once per instance and then kept up to date by
+        this instance's own label changes; failed fetches are not cached.
+        """
+        if self._labels_cache is not None:
+            return self._labels_cache
         try:
-            return json.loads(output)
+            data = self._api_get(f"labels?per_page={_PER_PAGE}")
         except json.JSONDecodeError:
             return []
+        if not isinstance(data, list):
+            return []
+        # REST reports a missing description as null; gh label list used ""
+        labels = [
+            {
+                "name": label["name"],
+                "color": label["color"],
+                "description": label.get("description") or "",
+            }
+            for label in data
+        ]
+        self._labels_cache = labels
+        return labels
+
+    def _cache_label(self, name: str, color: str, description: str) -> None:
+        """Record a created or edited label in the labels cache."""
+        entry = {"name": name, "color": color.lower(), "description": description}
+        with self._labels_lock:
+            if self._labels_cache is None:
+                return
+            self._labels_cache = [
+                label for label in self._labels_cache if label["name"] != name
+            ]
+            self._labels_cache.append(entry)
+
+    def _invalidate_labels_cache(self) -> None:
+        """Forget the labels listing so the next read fetches it again."""
+        self._labels_cache = None
 
     def get_stale_labels(self) -> list[str]:
         """Find labels with GTD prefixes that aren't in the current taxonomy.
@@ -60,55 +372,55 @@ class GitHubStorage(GTDStorage):
         Returns list of label names that should be cleaned up.
         """
         existing = self.get_existing_labels()
-        required = self.get_required_labels()
+        required = self._required_labels
+        # get_label_prefixes() is a tuple, so startswith checks all at once
         prefixes = self.get_label_prefixes()
 
-        stale = []
-        for label in existing:
-            # Only consider labels with GTD prefixes
-            if any(label.startswith(prefix) for prefix in prefixes):
-                if label not in required:
-                    stale.append(label)
-        return sorted(stale)
+        # Only consider labels with GTD prefixes
+        return sorted(
+            label
+            for label in existing
+            if label.startswith(prefixes) and label not in required
+        )
 
     def get_label_drift(self) -> list[dict]:
         """Find GTD labels with incorrect color or description.
 
         Returns list of dicts with: name, field, expected, actual
         """
-        existing_full = self.get_existing_labels_full()
-        existing_by_name = {label["name"]: label for label in existing_full}
+        configs = self._label_configs
 
+        # One pass over the repo's labels; only taxonomy labels have a config
         drift = []
-        for category, items in self.LABELS.items():
-            for name, config in items.items():
-                label_name = f"{category}/{name}"
-                if label_name in existing_by_name:
-                    actual = existing_by_name[label_name]
-                    # Check color (GitHub returns without #, lowercase)
-                    expected_color = config["color"].lower()
-                    actual_color = actual.get("color", "").lower()
-                    if expected_color != actual_color:
-                        drift.append(
-                            {
-                                "name": label_name,
-                                "field": "color",
-                                "expected": expected_color,
-                                "actual": actual_color,
-                            }
-                        )
-                    # Check description
-                    expected_desc = config["description"]
-                    actual_desc = actual.get("description", "")
-                    if expected_desc != actual_desc:
-                        drift.append(
-                            {
-                                "name": label_name,
-                                "field": "description",
-                                "expected": expected_desc,
-                                "actual": actual_desc,
-                            }
-                        )
+        for actual in self.get_existing_labels_full():
+            label_name = actual["name"]
+            config = configs.get(label_name)
+            if config is None:
+                continue
+            # Check color (GitHub returns without #, lowercase)
+            expected_color = config["color"].lower()
+            actual_color = actual.get("color", "").lower()
+            if expected_color != actual_color:
+                drift.append(
+                    {
+                        "name": label_name,
+                        "field": "color",
+                        "expected": expected_color,
+                        "actual": actual_color,
+                    }
+                )
+            # Check description
+            expected_desc = config["description"]
+            actual_desc = actual.get("description", "")
+            if expected_desc != actual_desc:
+                drift.append(
+                    {
+                        "name": label_name,
+                        "field": "description",
+                        "expected": expected_desc,
+                        "actual": actual_desc,
+                    }
+                )
         return drift
 
     def delete_label(self, name: str) -> bool:
@@ -117,10 +429,16 @@ class GitHubStorage(GTDStorage):
         Returns True if deleted, False if failed.
         """
         try:
-            self._run_gh(["label", "delete", name, "--yes"])
-            return True
+            self._api("DELETE", self._label_path(name))
         except RuntimeError:
+            self._invalidate_labels_cache()
             return False
+        with self._labels_lock:
+            if self._labels_cache is not None:
+                self._labels_cache = [
+                    label for label in self._labels_cache if label["name"] != name
+                ]
+        return True
 
     def fix_label(self, name: str, color: str, description: str) -> bool:
         """Fix a label's color and description.
@@ -128,26 +446,22 @@ class GitHubStorage(GTDStorage):
         Returns True if fixed, False if failed.
         """
         try:
-            self._run_gh(
-                [
-                    "label",
-                    "edit",
-                    name,
-                    "--color",
-                    color,
-                    "--description",
-                    description,
-                ]
+            self._api(
+                "PATCH",
+                self._label_path(name),
+                {"color": color, "description": description},
             )
-            return True
         except RuntimeError:
+            self._invalidate_labels_cache()
             return False
+        self._cache_label(name, color, description)
+        return True
 
     def is_setup(self) -> bool:
         """Check if GTD labels exist in the repo."""
-        existing = self.get_existing_labels()
-        required = self.get_required_labels()
-        return required.issubset(existing)
+        # Stop at the first missing label instead of building a set to compare
+        existing = self._labels_by_name()
+        return all(label in existing for label in self._required_labels)
 
     def setup(self, verbose: bool = False, fix_drift: bool = False) -> None:
         """Create all GTD labels in the repo.
@@ -156,63 +470,49 @@ class GitHubStorage(GTDStorage):
             verbose: If True, print progress messages.
             fix_drift: If True, also fix labels with incorrect color/description.
         """
-        existing = self.get_existing_labels()
-        existing_full = {
-            label["name"]: label for label in self.get_existing_labels_full()
-        }
+        existing_full = self._labels_by_name()
 
-        created = 0
+        # Work out what each label needs, then apply the changes concurrently
+        changes: list[tuple[str, str, str, dict]] = []  # category, action, name
         skipped = 0
-        fixed = 0
-
         for category, items in self.LABELS.items():
-            if verbose:
-                print(f"→ {category.capitalize()} labels...")
-
             for name, config in items.items():
                 label_name = f"{category}/{name}"
+                actual = existing_full.get(label_name)
+                if actual is None:
+                    changes.append((category, "create", label_name, config))
+                elif fix_drift and _label_drifted(actual, config):
+                    changes.append((category, "fix", label_name, config))
+                else:
+                    skipped += 1
 
-                if label_name in existing:
-                    # Check if we need to fix drift
-                    if fix_drift and label_name in existing_full:
-                        actual = existing_full[label_name]
-                        expected_color = config["color"].lower()
-                        actual_color = actual.get("color", "").lower()
-                        expected_desc = config["description"]
-                        actual_desc = actual.get("description", "")
-
-                        if (
-                            expected_color != actual_color
-                            or expected_desc != actual_desc
-                        ):
-                            if self.fix_label(
-                                label_name, config["color"], config["description"]
-                            ):
-                                fixed += 1
-                                if verbose:
-                                    print(f"  Fixed: {label_name}")
-                            continue
+        def apply(change: tuple[str, str, str, dict]) -> tuple[str | None, str]:
+            """Apply one change; returns (counter to bump, progress message)."""
+            _, action, label_name, config = change
+            if action == "fix":
+                if self.fix_label(label_name, config["color"], config["description"]):
+                    return "fixed", f"  Fixed: {label_name}"
+                return None, ""
+            try:
+                self._create_label(label_name, config)
+            except RuntimeError as e:
+                self._invalidate_labels_cache()
+                return None, f"  Warning: Could not create {label_name}: {e}"
+            return "created", ""
+
+        outcomes = self._map_concurrent(apply, changes)
+        created = sum(1 for counter, _ in outcomes if counter == "created")
+        fixed = sum(1 for counter, _ in outcomes if counter == "fixed")
 
-                    skipped += 1
-                    continue
-
-                try:
-                    self._run_gh(
-                        [
-                            "label",
-                            "create",
-                            label_name,
-                            "--color",
-                            config["color"],
-                            "--description",
-                            config["description"],
-                            "--force",
-                        ]
-                    )
-                    created += 1
-                except RuntimeError as e:
-                    if verbose:
-                        print(f"  Warning: Could not create {label_name}: {e}")
+        if verbose:
+            messages: dict[str, list[str]] = {}
+            for change, (_, message) in zip(changes, outcomes):
+                if message:
+                    messages.setdefault(change[0], []).append(message)
+            for category in self.LABELS:
+                print(f"→ {category.capitalize()} labels...")
+                for message in messages.get(category, []):
+                    print(message)
 
         if verbose:
             msg = f"✓ Setup complete: {created} created"
@@ -222,12 +522,32 @@ class GitHubStorage(GTDStorage):
             print(msg)
             print(f"  Total GTD labels: {len(self.get_all_labels())}")
 
+    def _create_label(self, name: str, config: dict) -> None:
+        """Create a label, overwriting it if it already exists.
+
+        Raises:
+            RuntimeError: If the label can be neither created nor updated.
+        """
+        fields = {"color": config["color"], "description": config["description"]}
+        try:
+            self._api("POST", "labels", {"name": name, **fields})
+        except RuntimeError:
+            # Already exists (e.g. created concurrently): update it instead
+            self._api("PATCH", self._label_path(name), fields)
+        self._cache_label(name, config["color"], config["description"])
+
     def _parse_issue(self, data: dict) -> GTDItem:
         """Parse gh JSON output into GTDItem.
 
+        Accepts `gh issue --json` output and GraphQL issue nodes, as well as
+        REST issue objects, which use html_url/created_at/closed_at instead
+        of url/createdAt/closedAt.
         Maps GitHub's 'milestone' to GTD's 'project' concept.
         """
-        labels = [label["name"] for label in data.get("labels", [])]
+        labels = data.get("labels") or []
+        if isinstance(labels, dict):  # GraphQL connection
+            labels = labels.get("nodes", [])
+        labels = [label["name"] for label in labels]
         milestone = data.get("milestone", {})
         return GTDItem(
             id=str(data["number"]),
@@ -238,9 +558,9 @@ class GitHubStorage(GTDStorage):
             project=milestone.get("title")
             if milestone
             else None,  # milestone → project
-            url=data.get("url"),
-            created_at=data.get("createdAt"),
-            closed_at=data.get("closedAt"),
+            url=data.get("html_url") or data.get("url"),
+            created_at=data.get("createdAt") or data.get("created_at"),
+            closed_at=data.get("closedAt") or data.get("closed_at"),
         )
 
     def create_item(
@@ -255,23 +575,15 @@ class GitHubStorage(GTDStorage):
         Args:
             project: GTD project name (mapped to GitHub milestone)
         """
-        args = ["issue", "create", "--title", title]
-
+        payload: dict[str, Any] = {"title": title, "body": body or ""}
         if labels:
-            args.extend(["--label", ",".join(labels)])
-        # --body is required for non-interactive mode
-        args.extend(["--body", body or ""])
+            payload["labels"] = labels
         if project:
-            args.extend(["--milestone", project])  # project → milestone
+            payload["milestone"] = self._milestone_number(project)
 
-        # Get the created issue URL
-        output = self._run_gh(args)
-        # Output is the issue URL
-        issue_url = output.strip()
-
-        # Extract issue number from URL and fetch full details
-        issue_number = issue_url.split("/")[-1]
-        return self.get_item(issue_number)
+        # The REST response is the full new issue, so no follow-up fetch
+        data = self._api("POST", "issues", payload)
+        return self._parse_issue(data)
 
     def get_item(self, item_id: str) -> GTDItem | None:
         """Get a single issue by number."""
@@ -283,8 +595,8 @@ class GitHubStorage(GTDStorage):
             "number,title,body,state,labels,milestone,url,createdAt,closedAt",
         ]
         try:
-            output = self._run_gh(args)
-            data = json.loads(output)
+            output = self._run_gh_bytes(args)
+            data = _decode_json(output)
             return self._parse_issue(data)
         except (RuntimeError, json.JSONDecodeError):
             return None
@@ -302,29 +614,51 @@ class GitHubStorage(GTDStorage):
         Args:
             project: Filter by GTD project (mapped to GitHub milestone)
         """
-        args = [
-            "issue",
-            "list",
-            "--state",
-            state,
-            "--limit",
-            str(limit),
-            "--json",
-            "number,title,body,state,labels,milestone,url,createdAt,closedAt",
-        ]
-
-        if labels:
-            args.extend(["--label", ",".join(labels)])
+        variables = []
+        if state in ("open", "closed"):
+            variables.append(f"states[]={state.upper()}")
+        # The labels argument matches any of the labels; all are required below
+        variables.extend(f"labels[]={label}" for label in labels or [])
         if project:
-            args.extend(["--milestone", project])  # project → milestone
-
-        output = self._run_gh(args, verbose=verbose)
-        data = json.loads(output)
+            milestone = self.get_milestone(project)  # project → milestone
+            if not milestone:
+                return []
+            variables.append(f"milestone={milestone['number']}")
+        owner, repo = self._get_repo_info()
+        variables.extend([f"owner={owner}", f"name={repo}"])
+
+        query = _ISSUE_LIST_BY_MILESTONE_QUERY if project else _ISSUE_LIST_QUERY
+
+        # Page through the issues, asking only for the fields _parse_issue reads
+        required = set(labels or [])
+        nodes: list[dict] = []
+        cursor = None
+        while len(nodes) < limit:
+            args = ["api", "graphql", "-f", f"query={query}"]
+            for variable in variables:
+                args.extend(["-f", variable])
+            # With several labels some nodes are dropped, so fetch full pages
+            first = _PER_PAGE if len(required) > 1 else limit - len(nodes)
+            args.extend(["-F", f"first={min(_PER_PAGE, first)}"])
+            if cursor:
+                args.extend(["-f", f"after={cursor}"])
+            result = _decode_json(self._run_gh_bytes(args, verbose=verbose))
+            if result.get("errors"):
+                raise RuntimeError(f"gh command failed: {result['errors']}")
+            issues = result["data"]["repository"]["issues"]
+            for node in issues["nodes"]:
+                names = {label["name"] for label in node["labels"]["nodes"]}
+                if required <= names:
+                    nodes.append(node)
+            if not issues["pageInfo"]["hasNextPage"]:
+                break
+            cursor = issues["pageInfo"]["endCursor"]
+        del nodes[limit:]
 
         if verbose:
-            print(f"  [DEBUG] Got {len(data)} items from GitHub")
+            print(f"  [DEBUG] Got {len(nodes)} items from GitHub")
 
-        return [self._parse_issue(item) for item in data]
+        return [self._parse_issue(item) for item in nodes]
 
     def update_item(
         self,
@@ -339,60 +673,67 @@ class GitHubStorage(GTDStorage):
         Args:
             project: GTD project name (mapped to GitHub milestone)
         """
-        args = ["issue", "edit", item_id]
-
+        payload: dict[str, Any] = {}
         if title:
-            args.extend(["--title", title])
+            payload["title"] = title
         if body:
-            args.extend(["--body", body])
+            payload["body"] = body
         if project:
-            args.extend(["--milestone", project])  # project → milestone
-
-        # For labels, we need to get current labels first if doing partial update
+            payload["milestone"] = self._milestone_number(project)
         if labels is not None:
-            # Clear existing labels and set new ones
-            # gh issue edit doesn't have --label-clear, so we remove then add
-            current = self.get_item(item_id)
-            if current:
-                for label in current.labels:
-                    self._run_gh(
-                        ["issue", "edit", item_id, "--remove-label", label], check=False
-                    )
-            for label in labels:
-                self._run_gh(["issue", "edit", item_id, "--add-label", label])
+            # Replaces the issue's whole label set
+            payload["labels"] = labels
 
-        if title or body or project:
-            self._run_gh(args)
+        if not payload:
+            return self.get_item(item_id)
+        # One PATCH applies every change and returns the updated issue
+        return self._issue_from_patch(item_id, payload)
 
-        return self.get_item(item_id)
+    def _milestone_number(self, project: str) -> int:
+        """Map a GTD project to its milestone number (REST's milestone key).
+
+        Raises:
+            RuntimeError: If there is no milestone with that title.
+        """
+        milestone = self.get_milestone(project)
+        if not milestone:
+            raise RuntimeError(f"Milestone '{project}' not found")
+        return milestone["number"]
+
+    def _issue_from_patch(self, item_id: str, payload: dict) -> GTDItem:
+        """PATCH an issue and parse the updated issue from the response."""
+        data = self._api("PATCH", f"issues/{item_id}", payload)
+        if not isinstance(data, dict) or "number" not in data:
+            return self.get_item(item_id)
+        return self._parse_issue(data)
 
     def add_labels(self, item_id: str, labels: list[str]) -> GTDItem:
         """Add labels to an issue."""
-        for label in labels:
-            self._run_gh(["issue", "edit", item_id, "--add-label", label])
+        if labels:
+            self._api("POST", f"issues/{item_id}/labels", {"labels": labels})
         return self.get_item(item_id)
 
     def remove_labels(self, item_id: str, labels: list[str]) -> GTDItem:
         """Remove labels from an issue."""
-        for label in labels:
+        # REST only removes one label per request; gh issue edit takes a list
+        if labels:
             self._run_gh(
-                ["issue", "edit", item_id, "--remove-label", label], check=False
+                ["issue", "edit", item_id, "--remove-label", ",".join(labels)],
+                check=False,
             )
         return self.get_item(item_id)
 
     def close_item(self, item_id: str) -> GTDItem:
         """Close an issue."""
-        self._run_gh(["issue", "close", item_id])
-        return self.get_item(item_id)
+        return self._issue_from_patch(item_id, {"state": "closed"})
 
     def reopen_item(self, item_id: str) -> GTDItem:
         """Reopen a closed issue."""
-        self._run_gh(["issue", "reopen", item_id])
-        return self.get_item(item_id)
+        return self._issue_from_patch(item_id, {"state": "open"})
 
     def add_comment(self, item_id: str, body: str) -> None:
         """Add a comment to an issue."""
-        self._run_gh(["issue", "comment", item_id, "--body", body])
+        self._api("POST", f"issues/{item_id}/comments", {"body": body})
 
     # GTD metadata management
 
@@ -405,10 +746,12 @@ class GitHubStorage(GTDStorage):
         if self.repo:
             parts = self.repo.split("/")
             return parts[0], parts[1]
-        # Get from git remote if not specified
-        output = self._run_gh(["repo", "view", "--json", "owner,name"])
-        data = json.loads(output)
-        return data["owner"]["login"], data["name"]
+        # Get from git remote if not specified (once per instance)
+        if self._repo_info is None:
+            output = self._run_gh_bytes(["repo", "view", "--json", "owner,name"])
+            data = _decode_json(output)
+            self._repo_info = (data["owner"]["login"], data["name"])
+        return self._repo_info
 
     def _run_graphql(self, query: str, variables: dict | None = None) -> dict:
         """Run a GraphQL query via gh api graphql.
@@ -425,10 +768,10 @@ class GitHubStorage(GTDStorage):
             for key, value in variables.items():
                 args.extend(["-F", f"{key}={value}"])
 
-        output = self._run_gh(args, check=False)
+        output = self._run_gh_bytes(args, check=False)
         if not output:
             return {}
-        return json.loads(output)
+        return _decode_json(output)
 
     def update_metadata(self, item_id: str, metadata: GTDMetadata) -> GTDItem:
         """Update an item's body with new metadata.
@@ -566,36 +909,47 @@ class GitHubStorage(GTDStorage):
         Returns list of dicts with: title, description, due_on, open_issues,
         closed_issues, state, url
         """
-        output = self._run_gh(
-            [
-                "api",
-                f"repos/:owner/:repo/milestones?state={state}",
-                "--jq",
-                ".[] | {number, title, description, due_on, "
-                "open_issues, closed_issues, state, url}",
-            ],
-            check=False,
-        )
+        return self._fetch_milestones(state) or []
 
-        if not output:
-            return []
-
-        milestones = []
-        for line in output.strip().split("\n"):
-            if line:
-                try:
-                    milestones.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-        return milestones
+    def _fetch_milestones(self, state: str) -> list[dict] | None:
+        """Fetch milestones in a state, or None if they could not be listed."""
+        try:
+            data = self._api_get(f"milestones?state={state}&per_page={_PER_PAGE}")
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, list):
+            return None
+        return [_milestone_fields(m) for m in data]
 
     def get_milestone(self, title: str) -> dict | None:
-        """Get a milestone by title."""
-        milestones = self.list_milestones(state="all")
-        for m in milestones:
-            if m.get("title") == title:
-                return m
-        return None
+        """Get a milestone by title.
+
+        All milestones are listed once per instance; later lookups (e.g. from
+        ensure_project for every new item) are served from that listing.
+        """
+        milestones = self._milestones_by_title()
+        return milestones.get(title) if milestones is not None else None
+
+    def _milestones_by_title(self) -> dict[str, dict] | None:
+        """Get the (cached) milestones of all states, or None if unlistable."""
+        if self._milestones_cache is None:
+            milestones = self._fetch_milestones("all")
+            if milestones is None:
+                return None
+            # First milestone wins for duplicate titles, as in a linear scan
+            by_title: dict[str, dict] = {}
+            for m in milestones:
+                by_title.setdefault(m.get("title"), m)
+            self._milestones_cache = by_title
+        return self._milestones_cache
+
+    def _cache_milestone(self, milestone: dict | None) -> dict | None:
+        """Record a created or updated milestone in the milestones cache."""
+        if milestone is not None and self._milestones_cache is not None:
+            self._milestones_cache[milestone.get("title")] = _milestone_fields(
+                milestone
+            )
+        return milestone
 
     def create_milestone(
         self,
@@ -618,22 +972,12 @@ class GitHubStorage(GTDStorage):
         if existing:
             return existing
 
-        # Build the API request
-        args = [
-            "api",
-            "repos/:owner/:repo/milestones",
-            "-X",
-            "POST",
-            "-f",
-            f"title={title}",
-        ]
+        payload = {"title": title}
         if description:
-            args.extend(["-f", f"description={description}"])
+            payload["description"] = description
         if due_on:
-            args.extend(["-f", f"due_on={due_on}"])
-
-        output = self._run_gh(args)
-        return json.loads(output)
+            payload["due_on"] = due_on
+        return self._cache_milestone(self._api("POST", "milestones", payload))
 
     def ensure_project(self, name: str) -> dict:
         """Ensure a project exists, creating it if needed.
@@ -645,6 +989,37 @@ class GitHubStorage(GTDStorage):
             return existing
         return self.create_milestone(name)
 
+    def ensure_projects(self, names: list[str]) -> dict[str, dict]:
+        """Ensure several projects exist, creating the missing ones at once.
+
+        Milestones are listed once and the missing ones are created
+        concurrently, rather than one lookup and create per name.
+
+        Args:
+            names: Project (milestone) titles; duplicates are ignored.
+
+        Returns:
+            Dict mapping each name to its milestone data.
+
+        Raises:
+            RuntimeError: If the milestones cannot be listed.
+        """
+        have = self._milestones_by_title()
+        if have is None:
+            raise RuntimeError("gh command failed: could not list milestones")
+        wanted = list(dict.fromkeys(names))
+        missing = [name for name in wanted if name not in have]
+        # The listing already ruled these out, so the workers only POST; the
+        # cache is updated here rather than from the worker threads
+        responses = self._map_concurrent(
+            lambda title: self._api("POST", "milestones", {"title": title}), missing
+        )
+        created = {
+            name: self._cache_milestone(milestone)
+            for name, milestone in zip(missing, responses)
+        }
+        return {name: have.get(name) or created[name] for name in wanted}
+
     def update_milestone(
         self,
         title: str,
@@ -672,16 +1047,16 @@ class GitHubStorage(GTDStorage):
         if not number:
             return None
 
-        args = ["api", f"repos/:owner/:repo/milestones/{number}", "-X", "PATCH"]
+        payload = {}
         if description is not None:
-            args.extend(["-f", f"description={description}"])
+            payload["description"] = description
         if due_on is not None:
-            args.extend(["-f", f"due_on={due_on}"])
+            payload["due_on"] = due_on
         if state is not None:
-            args.extend(["-f", f"state={state}"])
-
-        output = self._run_gh(args)
-        return json.loads(output)
+            payload["state"] = state
+        return self._cache_milestone(
+            self._api("PATCH", f"milestones/{number}", payload)
+        )
 
     def delete_milestone(self, title: str) -> bool:
         """Delete a milestone by title.
@@ -700,5 +1075,7 @@ class GitHubStorage(GTDStorage):
         if not number:
             return False
 
-        self._run_gh(["api", f"repos/:owner/:repo/milestones/{number}", "-X", "DELETE"])
+        self._api("DELETE", f"milestones/{number}")
+        if self._milestones_cache is not None:
+            self._milestones_cache.pop(title, None)
         return True
@@ -9,11 +9,122 @@ import json
 import os
 import re
 import subprocess
+import uuid as uuid_lib
+from collections import Counter, defaultdict
+from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from ..metadata import GTDMetadata
 from ..storage import GTDItem, GTDStorage
 
+# Files Taskwarrior writes task data to (2.x text files, 3.x SQLite database)
+_DATA_FILES = (
+    "pending.data",
+    "completed.data",
+    "taskchampion.sqlite3",
+    "taskchampion.sqlite3-wal",
+)
+
+# Confirmation printed by `task add` under rc.verbose=new
+_CREATED_TASK_RE = re.compile(rb"Created task (\d+)")
+
+# Shared decoder for task output; calling it directly skips json.loads'
+# per-call type and keyword dispatch
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_json(output: bytes) -> Any:
+    """Decode task's UTF-8 JSON output."""
+    return _JSON_DECODER.decode(output.decode())
+
+
+# Whitespace and commas between JSON array elements
+_ARRAY_SEP_RE = re.compile(r"[\s,]*")
+
+
+def _decode_json_head(output: bytes, limit: int) -> list:
+    """Decode at most the first `limit` elements of a JSON array.
+
+    Elements past the limit are never decoded, so a short listing of a large
+    export skips building dicts it would throw away. A non-array document is
+    decoded in full.
+
+    Raises:
+        json.JSONDecodeError: If the decoded part is not valid JSON.
+    """
+    text = output.decode()
+    pos = len(text) - len(text.lstrip())
+    if not text.startswith("[", pos):
+        data = _JSON_DECODER.decode(text)
+        return data[:limit] if isinstance(data, list) else []
+    items = []
+    pos += 1
+    while len(items) < limit:
+        pos = _ARRAY_SEP_RE.match(text, pos).end()
+        if text.startswith("]", pos):
+            break
+        value, pos = _JSON_DECODER.raw_decode(text, pos)
+        items.append(value)
+    return items
+
+
+# Disable confirmation prompts (bulk=0 also for multi-task modify); use
+# minimal verbosity but keep 'new' for add
+# 'new' shows "Created task N." which we need to parse
+_TASK_PREFIX = ("task", "rc.confirmation=off", "rc.bulk=0", "rc.verbose=new")
+
+# Helper commands that only read tasks
+_READ_COMMANDS = frozenset({"export", "_get", "_tags"})
+
+# Arguments that come before the command word: rc overrides, IDs and ID
+# ranges, UUIDs, attribute filters (status:pending, limit:5) and +/-tags
+_FILTER_ARG_RE = re.compile(
+    r"rc\.|[+-]\w|[\w.]+:|[\d,-]+$"
+    r"|[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}$"
+)
+
+# GTD tag: gtd_<category>_<name>, split at the first "_" after the prefix
+_TAG_RE = re.compile(r"gtd_([^_]*)_(.*)", re.DOTALL)
+
+
+# Bounded: tags and labels include user-supplied names, not just the taxonomy
+@lru_cache(maxsize=512)
+def _label_to_tag(label: str) -> str:
+    """Convert a GTD label to a Taskwarrior tag (context/focus -> gtd_context_focus)."""
+    return "gtd_" + label.replace("/", "_")
+
+
+@lru_cache(maxsize=512)
+def _tag_to_label(tag: str) -> str | None:
+    """Convert a Taskwarrior tag to a GTD label, or None if not a GTD tag."""
+    match = _TAG_RE.fullmatch(tag)
+    return f"{match[1]}/{match[2]}" if match else None
+
+
+def _command_word(args: list[str]) -> str | None:
+    """Get the command of a task command line: the first non-filter argument.
+
+    Later arguments (descriptions, annotations) are user text and may look
+    like command names.
+    """
+    return next((arg for arg in args if not _FILTER_ARG_RE.match(arg)), None)
+
+
+@lru_cache(maxsize=16)
+def _task_env(data_dir: Path) -> dict[str, str]:
+    """Get the (shared, read-only) environment for task on a data directory."""
+    return os.environ | {
+        "TASKDATA": str(data_dir),
+        "TASKRC": str(data_dir / ".taskrc"),
+    }
+
+
+def _tw_now() -> str:
+    """Get the current time in Taskwarrior's export date format."""
+    return datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+
 
 class TaskwarriorStorage(GTDStorage):
     """GTD storage using Taskwarrior via task CLI."""
@@ -26,17 +137,26 @@ class TaskwarriorStorage(GTDStorage):
                 or absolute path).
         """
         self.data_dir = Path(data_dir).resolve()
-        self._env = self._build_env()
+        # Last full export, keyed by the data files' stat when it was taken,
+        # with its tasks indexed by UUID and numeric ID
+        self._export_cache: tuple[tuple, list[dict], dict[str, dict]] | None = None
 
-    def _build_env(self) -> dict[str, str]:
-        """Build environment with TASKDATA and TASKRC pointing to local dir."""
-        env = os.environ.copy()
-        env["TASKDATA"] = str(self.data_dir)
-        env["TASKRC"] = str(self.data_dir / ".taskrc")
-        return env
+    @property
+    def _env(self) -> dict[str, str]:
+        """Environment with TASKDATA and TASKRC pointing to local dir.
+
+        Built on the first task command, so storages that never run one
+        (e.g. is_setup checks) skip copying the environment, and shared by
+        all storages on the same directory.
+        """
+        return _task_env(self.data_dir)
 
     def _run_task(
-        self, args: list[str], check: bool = True, verbose: bool = False
+        self,
+        args: list[str],
+        check: bool = True,
+        verbose: bool = False,
+        input: str | None = None,
     ) -> str:
         """Run a task command and return output.
 
@@ -44,6 +164,7 @@ class TaskwarriorStorage(GTDStorage):
             args: Command arguments to pass to task.
             check: If True, raise on non-zero exit code.
             verbose: If True, print debug output.
+            input: Optional text to send on stdin (e.g. for import).
 
         Returns:
             stdout from the command.
@@ -51,16 +172,44 @@ class TaskwarriorStorage(GTDStorage):
         Raises:
             RuntimeError: If check=True and command fails.
         """
-        # Disable confirmation prompts; use minimal verbosity but keep 'new' for add
-        # 'new' shows "Created task N." which we need to parse
-        cmd = ["task", "rc.confirmation=off", "rc.verbose=new"] + args
+        return self._run_task_bytes(args, check, verbose, input).decode(
+            "utf-8", "replace"
+        )
+
+    def _run_task_bytes(
+        self,
+        args: list[str],
+        check: bool = True,
+        verbose: bool = False,
+        input: str | None = None,
+    ) -> bytes:
+        """Run a task command and return its raw output.
+
+        Export callers hand the bytes straight to _decode_json(), skipping the
+        text-mode decode and newline translation passes over the output.
+        """
+        cmd = [*_TASK_PREFIX, *args]
         if verbose:
             print(f"  [DEBUG] Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, env=self._env)
+        if _command_word(args) not in _READ_COMMANDS:
+            # Anything but a read may change tasks
+            self._export_cache = None
+        # communicate() already reads the pipes in large chunks straight from
+        # the file descriptors; without input, stdin is closed so a prompt
+        # can never wait on the terminal
+        if input is None:
+            result = subprocess.run(
+                cmd, capture_output=True, env=self._env, stdin=subprocess.DEVNULL
+            )
+        else:
+            result = subprocess.run(
+                cmd, capture_output=True, env=self._env, input=input.encode()
+            )
         if result.returncode != 0:
             if check:
-                raise RuntimeError(f"task command failed: {result.stderr}")
-            return ""
+                stderr = result.stderr.decode(errors="replace")
+                raise RuntimeError(f"task command failed: {stderr}")
+            return b""
         return result.stdout
 
     # --- Label/Tag Conversion ---
@@ -70,7 +219,7 @@ class TaskwarriorStorage(GTDStorage):
 
         Example: context/focus -> gtd_context_focus
         """
-        return "gtd_" + label.replace("/", "_")
+        return _label_to_tag(label)
 
     def _tag_to_label(self, tag: str) -> str | None:
         """Convert Taskwarrior tag to GTD label.
@@ -78,14 +227,7 @@ class TaskwarriorStorage(GTDStorage):
         Example: gtd_context_focus -> context/focus
         Returns None if tag is not a GTD tag.
         """
-        if not tag.startswith("gtd_"):
-            return None
-        # gtd_context_focus -> context_focus -> context/focus
-        rest = tag[4:]  # Remove 'gtd_' prefix
-        parts = rest.split("_", 1)
-        if len(parts) == 2:
-            return f"{parts[0]}/{parts[1]}"
-        return None
+        return _tag_to_label(tag)
 
     # --- GTDStorage Implementation ---
 
@@ -135,19 +277,15 @@ class TaskwarriorStorage(GTDStorage):
 
     def _parse_task(self, data: dict) -> GTDItem:
         """Parse task export JSON into GTDItem."""
+        get = data.get
         # Extract GTD labels from tags
-        labels = []
-        for tag in data.get("tags", []):
-            label = self._tag_to_label(tag)
-            if label:
-                labels.append(label)
+        labels = [label for tag in get("tags", ()) if (label := _tag_to_label(tag))]
 
         # Map Taskwarrior status to GTD state
-        tw_status = data.get("status", "pending")
-        state = "closed" if tw_status in ("completed", "deleted") else "open"
+        state = "closed" if get("status") in ("completed", "deleted") else "open"
 
         # Get first annotation as body (if any)
-        annotations = data.get("annotations", [])
+        annotations = get("annotations")
         first_annotation = annotations[0] if annotations else None
         body = (
             first_annotation.get("description")
@@ -161,19 +299,19 @@ class TaskwarriorStorage(GTDStorage):
         # TW-native fields directly
 
         # Completed tasks have id=0, so use UUID for stable identification
-        task_id = data.get("id", 0)
-        item_id = str(task_id) if task_id else data.get("uuid", "")
+        task_id = get("id", 0)
+        item_id = str(task_id) if task_id else get("uuid", "")
 
         return GTDItem(
             id=item_id,
-            title=data.get("description", ""),
+            title=get("description", ""),
             body=body,
             state=state,
             labels=labels,
-            project=data.get("project"),
+            project=get("project"),
             url=None,  # Taskwarrior has no URL concept
-            created_at=data.get("entry"),
-            closed_at=data.get("end"),
+            created_at=get("entry"),
+            closed_at=get("end"),
         )
 
     def create_item(
@@ -188,38 +326,111 @@ class TaskwarriorStorage(GTDStorage):
 
         # Add tags for labels
         for label in labels:
-            args.append(f"+{self._label_to_tag(label)}")
+            args.append(f"+{_label_to_tag(label)}")
 
         # Add project if specified
         if project:
             args.append(f"project:{project}")
 
-        output = self._run_task(args)
+        output = self._run_task_bytes(args)
 
         # Extract task ID from output: "Created task 42."
-        match = re.search(r"Created task (\d+)", output)
+        match = _CREATED_TASK_RE.search(output)
         if not match:
-            raise RuntimeError(f"Failed to parse task ID from: {output}")
+            text = output.decode(errors="replace")
+            raise RuntimeError(f"Failed to parse task ID from: {text}")
 
-        task_id = match.group(1)
+        task_id = match.group(1).decode()
 
         # Add body as annotation if provided
         if body:
             self._run_task([task_id, "annotate", body])
 
-        item = self.get_item(task_id)
-        if item is None:
-            raise RuntimeError(f"Task {task_id} not found after creation")
-        return item
+        # Everything on the item is known, so skip reading it back
+        return GTDItem(
+            id=task_id,
+            title=title,
+            body=body or None,
+            state="open",
+            # As they read back from the tags
+            labels=[
+                label
+                for tag in dict.fromkeys(map(_label_to_tag, labels))
+                if (label := _tag_to_label(tag))
+            ],
+            project=project or None,
+            url=None,
+            created_at=_tw_now(),
+            closed_at=None,
+        )
+
+    def create_items(self, specs: list[dict]) -> list[GTDItem]:
+        """Create several tasks with a single `task import`.
+
+        Taskwarrior has no long-running mode, so each command costs a process
+        start; importing the batch as JSON creates every task in one process
+        and one export reads them back.
+        """
+        if len(specs) <= 1:
+            return [self.create_item(**spec) for spec in specs]
+
+        entry = _tw_now()
+        tasks = []
+        for spec in specs:
+            task = {
+                "uuid": str(uuid_lib.uuid4()),
+                "description": spec["title"],
+                "status": "pending",
+                "entry": entry,
+                "tags": [_label_to_tag(label) for label in spec["labels"]],
+            }
+            if spec.get("project"):
+                task["project"] = spec["project"]
+            if spec.get("body"):
+                task["annotations"] = [{"entry": entry, "description": spec["body"]}]
+            tasks.append(task)
+
+        self._run_task(["import", "-"], input=json.dumps(tasks))
+        items = self.get_items([task["uuid"] for task in tasks])
+        if any(item is None for item in items):
+            raise RuntimeError("Imported tasks not found after creation")
+        return items
+
+    def get_items(self, item_ids: list[str]) -> list[GTDItem | None]:
+        """Get several tasks (by ID or UUID) with one export."""
+        if len(item_ids) <= 1:
+            return [self.get_item(item_id) for item_id in item_ids]
+        try:
+            output = self._run_task_bytes([*item_ids, "export"])
+            data = _decode_json(output) if output.strip() else []
+        except (RuntimeError, json.JSONDecodeError):
+            return [None] * len(item_ids)
+
+        by_key: dict[str, dict] = {}
+        for task in data:
+            by_key[task.get("uuid", "")] = task
+            if task.get("id"):
+                by_key[str(task["id"])] = task
+        return [
+            self._parse_task(by_key[item_id]) if item_id in by_key else None
+            for item_id in item_ids
+        ]
 
     def get_item(self, item_id: str) -> GTDItem | None:
-        """Get a single task by ID."""
+        """Get a single task by ID.
+
+        Served from the full export when one is current, skipping the
+        `task <id> export` lookup.
+        """
+        cached = self._cached_task(item_id)
+        if cached is not None:
+            return self._parse_task(cached)
         try:
             # Export specific task by ID (syntax: task <id> export)
-            output = self._run_task([item_id, "export"])
+            output = self._run_task_bytes([item_id, "export"])
             if not output.strip():
                 return None
-            data = json.loads(output)
+            data = _decode_json(output)
             if isinstance(data, list):
                 if not data:
                     return None
@@ -249,22 +460,26 @@ class TaskwarriorStorage(GTDStorage):
         # Label/tag filters
         if labels:
             for label in labels:
-                args.append(f"+{self._label_to_tag(label)}")
+                args.append(f"+{_label_to_tag(label)}")
 
         # Project filter
         if project:
             args.append(f"project:{project}")
 
+        # Let Taskwarrior stop after `limit` tasks; versions that ignore
+        # limit: with export are still cut short by _decode_json_head
+        if limit > 0:
+            args.append(f"limit:{limit}")
+
         # Add export command at end
         args.append("export")
 
-        output = self._run_task(args, verbose=verbose, check=False)
+        output = self._run_task_bytes(args, verbose=verbose, check=False)
         if not output.strip():
             return []
 
         try:
-            data = json.loads(output)
-            items = [self._parse_task(task) for task in data[:limit]]
+            items = list(map(self._parse_task, _decode_json_head(output, limit)))
             if verbose:
                 print(f"  [DEBUG] Got {len(items)} items from Taskwarrior")
             return items
@@ -279,27 +494,40 @@ class TaskwarriorStorage(GTDStorage):
         labels: list[str] | None = None,
         project: str | None = None,
     ) -> GTDItem:
-        """Update an existing task."""
+        """Update an existing task.
+
+        The task is exported once up front (its current tags are needed to
+        replace labels) and the result is derived from that snapshot plus the
+        changes, rather than exported again afterwards.
+        """
+        tasks = self._export_tasks([item_id])
+        task = dict(tasks[0]) if tasks else {}
         args = [item_id, "modify"]
 
         if title:
             args.append(f"description:{title}")
+            task["description"] = title
 
         if project is not None:
             if project:
                 args.append(f"project:{project}")
+                task["project"] = project
             else:
                 args.append("project:")  # Clear project
+                task.pop("project", None)
 
         if labels is not None:
             # Remove all existing GTD tags first (batched in a single modify command)
-            current = self.get_item(item_id)
-            if current:
-                for label in current.labels:
-                    args.append(f"-{self._label_to_tag(label)}")
+            other_tags = []
+            for tag in task.get("tags", ()):
+                if _tag_to_label(tag):
+                    args.append(f"-{tag}")
+                else:
+                    other_tags.append(tag)
             # Add new tags
-            for label in labels:
-                args.append(f"+{self._label_to_tag(label)}")
+            new_tags = [_label_to_tag(label) for label in labels]
+            args.extend(f"+{tag}" for tag in new_tags)
+            task["tags"] = list(dict.fromkeys([*other_tags, *new_tags]))
 
         # Run modify if there are changes beyond just [item_id, "modify"]
         # This handles labels=[] case where we only remove tags
@@ -311,18 +539,23 @@ class TaskwarriorStorage(GTDStorage):
             # Taskwarrior annotations are append-only
             # Add new annotation with the body content
             self._run_task([item_id, "annotate", body])
+            task["annotations"] = [
+                *task.get("annotations", ()),
+                {"entry": _tw_now(), "description": body},
+            ]
 
-        item = self.get_item(item_id)
-        if item is None:
+        if not tasks:
             raise ValueError(f"Task {item_id!r} not found after update")
-        return item
+        return self._parse_task(task)
 
     def add_labels(self, item_id: str, labels: list[str]) -> GTDItem:
         """Add tags to a task."""
-        args = [item_id, "modify"]
-        for label in labels:
-            args.append(f"+{self._label_to_tag(label)}")
-        self._run_task(args)
+        tags = [_label_to_tag(label) for label in labels]
+        before = self._cached_task(item_id)
+        self._run_task([item_id, "modify", *(f"+{tag}" for tag in tags)])
+        if before is not None:
+            merged = list(dict.fromkeys([*before.get("tags", ()), *tags]))
+            return self._parse_task({**before, "tags": merged})
         item = self.get_item(item_id)
         if item is None:
             raise ValueError(f"Task {item_id!r} not found after adding labels")
@@ -330,26 +563,35 @@ class TaskwarriorStorage(GTDStorage):
 
     def remove_labels(self, item_id: str, labels: list[str]) -> GTDItem:
         """Remove tags from a task."""
-        args = [item_id, "modify"]
-        for label in labels:
-            args.append(f"-{self._label_to_tag(label)}")
-        self._run_task(args, check=False)  # May fail if tag doesn't exist
+        tags = {_label_to_tag(label) for label in labels}
+        before = self._cached_task(item_id)
+        try:
+            self._run_task([item_id, "modify", *(f"-{tag}" for tag in tags)])
+        except RuntimeError:
+            # May fail if tag doesn't exist; re-read what the task now has
+            before = None
+        if before is not None:
+            kept = [tag for tag in before.get("tags", ()) if tag not in tags]
+            return self._parse_task({**before, "tags": kept})
         item = self.get_item(item_id)
         if item is None:
             raise ValueError(f"Task {item_id!r} not found after removing labels")
         return item
 
     def close_item(self, item_id: str) -> GTDItem:
-        """Mark task as done."""
-        # Capture UUID before closing - completed tasks lose their numeric ID
-        uuid = self._get_uuid(item_id)
+        """Mark task as done.
+
+        The task is exported once before closing and the result is derived
+        from that snapshot, rather than exporting it again afterwards.
+        """
+        tasks = self._export_tasks([item_id])
         self._run_task([item_id, "done"])
-        # Use UUID to fetch the completed task (numeric ID is now 0)
-        lookup_id = uuid if uuid else item_id
-        item = self.get_item(lookup_id)
-        if item is None:
+        if not tasks:
             raise ValueError(f"Task {item_id!r} not found after closing")
-        return item
+        # Completed tasks lose their numeric ID, so the item is keyed by UUID
+        return self._parse_task(
+            {**tasks[0], "id": 0, "status": "completed", "end": _tw_now()}
+        )
 
     def reopen_item(self, item_id: str) -> GTDItem:
         """Reopen a completed task."""
@@ -403,79 +645,145 @@ class TaskwarriorStorage(GTDStorage):
         else:
             args.append("depends:")
 
+        before = self._cached_task(item_id)
         self._run_task(args)
+        if before is not None:
+            # None of the metadata fields appear on GTDItem
+            return self._parse_task(before)
         item = self.get_item(item_id)
         if item is None:
             raise ValueError(f"Task {item_id!r} not found after metadata update")
         return item
 
-    def _get_uuid(self, item_id: str) -> str | None:
-        """Get UUID for a task by its numeric ID."""
+    def _export_tasks(self, filters: list[str]) -> list[dict]:
+        """Export the tasks matching any of several IDs/UUIDs in one call.
+
+        Lookups are folded into one filter rather than run as concurrent
+        processes: each task process repeats the same startup and data load
+        (under Taskwarrior's file locking), so parallel calls still multiply
+        the work.
+
+        Returns an empty list if the export fails.
+        """
+        if not filters:
+            return []
+        cached = [self._cached_task(f) for f in filters]
+        if all(task is not None for task in cached):
+            return list({id(task): task for task in cached}.values())
         try:
-            output = self._run_task([item_id, "export"])
-            data = json.loads(output)
-            if isinstance(data, list) and data:
-                return data[0].get("uuid")
+            output = self._run_task_bytes([*filters, "export"])
+            data = _decode_json(output) if output.strip() else []
         except (RuntimeError, json.JSONDecodeError):
-            pass
-        return None
+            return []
+        return data if isinstance(data, list) else []
 
     def _ids_to_uuids(self, ids: list[int]) -> list[str]:
-        """Convert task IDs to UUIDs for depends attribute."""
-        uuids = []
-        for task_id in ids:
-            try:
-                output = self._run_task([str(task_id), "export"])
-                data = json.loads(output)
-                if isinstance(data, list) and data:
-                    uuid = data[0].get("uuid", "")
-                    if uuid:
-                        uuids.append(uuid)
-            except (RuntimeError, json.JSONDecodeError):
-                # Skip invalid or non-existent task IDs silently
-                pass
-        return uuids
-
-    def _resolve_depends(self, depends: str) -> list[int]:
-        """Convert depends UUIDs to task IDs."""
+        """Convert task IDs to UUIDs for depends attribute.
+
+        Uses the `_get <id>.uuid` DOM accessor, which prints bare values in
+        argument order, so no task records are exported or decoded.
+        """
+        if not ids:
+            return []
+        cached = [self._cached_task(str(task_id)) for task_id in ids]
+        if all(task is not None for task in cached):
+            values = [task.get("uuid", "") for task in cached]
+        else:
+            output = self._run_task(
+                ["_get", *(f"{task_id}.uuid" for task_id in ids)], check=False
+            )
+            values = output.rstrip("\n").split(" ")
+            if len(values) != len(ids):
+                # _get may fail outright on an unknown ID; fall back to export
+                tasks = self._export_tasks([str(task_id) for task_id in ids])
+                uuid_by_id = {t.get("id"): t.get("uuid", "") for t in tasks}
+                values = [uuid_by_id.get(task_id, "") for task_id in ids]
+        # Keep input order; skip invalid or non-existent task IDs silently
+        return [uuid for uuid in values if uuid]
+
+    def _resolve_depends(self, depends: str | list[str]) -> list[int]:
+        """Convert depends UUIDs to task IDs.
+
+        Accepts the comma-separated string older Taskwarrior exports and the
+        JSON array 2.6+ exports; all UUIDs are resolved with one export.
+        """
         if not depends:
             return []
-        uuids = depends.split(",")
+        if isinstance(depends, str):
+            depends = depends.split(",")
+        uuids = list(dict.fromkeys(uuid.strip() for uuid in depends))
+        id_by_uuid = {
+            task.get("uuid"): task.get("id") for task in self._export_tasks(uuids)
+        }
+        # Keep input order; skip invalid, non-existent, or completed (id 0) tasks
         ids = []
         for uuid in uuids:
             try:
-                output = self._run_task([uuid.strip(), "export"])
-                data = json.loads(output)
-                if isinstance(data, list) and data:
-                    task_id = data[0].get("id")
-                    if task_id:
-                        ids.append(int(task_id))
-            except (RuntimeError, json.JSONDecodeError, ValueError):
-                # Skip invalid or non-existent UUIDs silently
-                pass
+                task_id = int(id_by_uuid.get(uuid) or 0)
+            except (TypeError, ValueError):
+                continue
+            if task_id:
+                ids.append(task_id)
         return ids
 
     # --- Label Introspection ---
 
+    def _data_stamp(self) -> tuple:
+        """Get (mtime, size) of each task data file, None where missing."""
+        stamp = []
+        for name in _DATA_FILES:
+            try:
+                st = (self.data_dir / name).stat()
+            except OSError:
+                stamp.append(None)
+            else:
+                stamp.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamp)
+
     def _export_all_tasks(self) -> list[dict]:
-        """Export all tasks (pending + completed) as raw dicts."""
-        output = self._run_task(["export"], check=False)
+        """Export all tasks (pending + completed) as raw dicts.
+
+        The export is reused while the data files are unchanged, so the
+        label and milestone queries share one `task export`. Callers must
+        not modify the returned dicts.
+        """
+        stamp = self._data_stamp()
+        if self._export_cache is not None and self._export_cache[0] == stamp:
+            return self._export_cache[1]
+        output = self._run_task_bytes(["export"], check=False)
         if not output.strip():
             return []
         try:
-            return json.loads(output)
+            tasks = _decode_json(output)
         except json.JSONDecodeError:
             return []
+        index: dict[str, dict] = {}
+        for task in tasks:
+            index[task.get("uuid", "")] = task
+            if task.get("id"):
+                index[str(task["id"])] = task
+        self._export_cache = (stamp, tasks, index)
+        return tasks
+
+    def _cached_task(self, item_id: str) -> dict | None:
+        """Look a task up by ID or UUID in a still-current full export.
+
+        Returns None if there is no current export or it lacks the task.
+        """
+        cache = self._export_cache
+        if cache is None or cache[0] != self._data_stamp():
+            return None
+        return cache[2].get(item_id)
 
     def get_existing_labels(self) -> set[str]:
-        """Get set of GTD labels actually used across all tasks."""
-        labels: set[str] = set()
-        for task in self._export_all_tasks():
-            for tag in task.get("tags", []):
-                label = self._tag_to_label(tag)
-                if label:
-                    labels.add(label)
-        return labels
+        """Get set of GTD labels actually used across all tasks.
+
+        `task _tags` lists the distinct tags as plain text, so no task
+        records are exported or decoded; list.all.tags includes completed
+        and deleted tasks, as the full export did.
+        """
+        output = self._run_task(["rc.list.all.tags=yes", "_tags"], check=False)
+        return {label for tag in output.split() if (label := _tag_to_label(tag))}
 
     def get_stale_labels(self) -> list[str]:
         """Find GTD-prefixed tags not in the canonical taxonomy."""
@@ -499,34 +807,42 @@ class TaskwarriorStorage(GTDStorage):
 
         Returns True if the tag was found and removed, False otherwise.
         """
-        tag = self._label_to_tag(name)
+        tag = _label_to_tag(name)
         # Find tasks with this tag
-        output = self._run_task([f"+{tag}", "export"], check=False)
+        output = self._run_task_bytes([f"+{tag}", "export"], check=False)
         if not output.strip():
             return False
 
         try:
-            tasks = json.loads(output)
+            tasks = _decode_json(output)
         except json.JSONDecodeError:
             return False
 
         if not tasks:
             return False
 
-        for task in tasks:
-            task_id = task.get("id") or task.get("uuid", "")
-            if task_id:
-                self._run_task([str(task_id), "modify", f"-{tag}"], check=False)
+        self._run_on_tasks(tasks, ["modify", f"-{tag}"], check=False)
         return True
 
+    def _run_on_tasks(
+        self, tasks: list[dict], command: list[str], check: bool = True
+    ) -> None:
+        """Run one task command (e.g. modify, done) on exported tasks at once.
+
+        Tasks are addressed by ID, or by UUID once completed (id 0), so the
+        command touches exactly these tasks.
+        """
+        task_ids = [str(t.get("id") or t.get("uuid", "")) for t in tasks]
+        task_ids = [task_id for task_id in task_ids if task_id]
+        if task_ids:
+            self._run_task([*task_ids, *command], check=check)
+
     # --- Project / Milestone Management ---
 
-    def _build_milestone(self, project: str, tasks: list[dict]) -> dict:
-        """Build a milestone dict from a project name and its tasks."""
-        open_count = sum(1 for t in tasks if t.get("status") == "pending")
-        closed_count = sum(
-            1 for t in tasks if t.get("status") in ("completed", "deleted")
-        )
+    def _build_milestone(self, project: str, statuses: Counter[str]) -> dict:
+        """Build a milestone dict from a project name and its task status counts."""
+        open_count = statuses["pending"]
+        closed_count = statuses["completed"] + statuses["deleted"]
         state = "open" if open_count > 0 else "closed"
         return {
             "title": project,
@@ -544,29 +860,30 @@ class TaskwarriorStorage(GTDStorage):
         Args:
             state: Filter by "open", "closed", or "all".
         """
-        all_tasks = self._export_all_tasks()
-
-        # Group tasks by project
-        projects: dict[str, list[dict]] = {}
-        for task in all_tasks:
+        # Count task statuses per project in a single pass
+        projects: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        for task in self._export_all_tasks():
             proj = task.get("project")
             if proj:
-                projects.setdefault(proj, []).append(task)
+                projects[proj][task.get("status")] += 1
 
         milestones = []
-        for proj, tasks in sorted(projects.items()):
-            m = self._build_milestone(proj, tasks)
+        for proj, statuses in sorted(projects.items()):
+            m = self._build_milestone(proj, statuses)
             if state == "all" or m["state"] == state:
                 milestones.append(m)
         return milestones
 
     def get_milestone(self, title: str) -> dict | None:
         """Get a single project as milestone by name."""
-        all_tasks = self._export_all_tasks()
-        tasks = [t for t in all_tasks if t.get("project") == title]
-        if not tasks:
+        statuses = Counter(
+            t.get("status")
+            for t in self._export_all_tasks()
+            if t.get("project") == title
+        )
+        if not statuses:
             return None
-        return self._build_milestone(title, tasks)
+        return self._build_milestone(title, statuses)
 
     def create_milestone(
         self,
@@ -602,6 +919,14 @@ class TaskwarriorStorage(GTDStorage):
             return existing
         return self.create_milestone(name)
 
+    def _project_tasks(self, title: str, status: str) -> list[dict]:
+        """Get the exported tasks of exactly this project with a status."""
+        return [
+            t
+            for t in self._export_all_tasks()
+            if t.get("project") == title and t.get("status") == status
+        ]
+
     def update_milestone(
         self,
         title: str,
@@ -625,16 +950,16 @@ class TaskwarriorStorage(GTDStorage):
             milestone["description"] = description
 
         if state is not None and state != milestone["state"]:
+            # Change all tasks in this project with one command
             if state == "closed":
                 # Close all open tasks in this project
-                items = self.list_items(project=title, state="open")
-                for item in items:
-                    self.close_item(item.id)
+                self._run_on_tasks(self._project_tasks(title, "pending"), ["done"])
             elif state == "open":
                 # Reopen all closed tasks in this project
-                items = self.list_items(project=title, state="closed")
-                for item in items:
-                    self.reopen_item(item.id)
+                self._run_on_tasks(
+                    self._project_tasks(title, "completed"),
+                    ["modify", "status:pending"],
+                )
             milestone["state"] = state
 
         # Re-fetch counts after state changes
@@ -652,14 +977,7 @@ class TaskwarriorStorage(GTDStorage):
         if not milestone:
             return False
 
-        # Remove project from all tasks (both open and closed)
-        all_tasks = self._export_all_tasks()
-        for task in all_tasks:
-            if task.get("project") == title:
-                task_id = task.get("id") or task.get("uuid", "")
-                if task_id:
-                    self._run_task(
-                        [str(task_id), "modify", "project:"],
-                        check=False,
-                    )
+        # Remove project from all tasks (both open and closed) in one modify
+        tasks = [t for t in self._export_all_tasks() if t.get("project") == title]
+        self._run_on_tasks(tasks, ["modify", "project:"], check=False)
         return True
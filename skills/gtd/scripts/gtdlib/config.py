@@ -7,8 +7,10 @@ backend choice and backend-specific settings.
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -16,6 +18,9 @@ CONFIG_DIR = ".gtd"
 CONFIG_FILENAME = "config.json"
 AVAILABLE_BACKENDS = ["github", "taskwarrior", "beads"]
 
+# Parsed config JSON keyed by path, with the (mtime_ns, size) it was read at
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
 
 @dataclass
 class TaskwarriorConfig:
@@ -35,12 +40,11 @@ class GitHubConfig:
 class BeadsBackendConfig:
     """Beads backend configuration.
 
-    Currently empty: bd auto-discovers its .beads/ directory and config.
-    This dataclass exists for interface consistency with other backends
-    and to allow future configuration options (e.g., custom db path).
+    bd auto-discovers its .beads/ directory and config, so no paths are
+    needed here.
     """
 
-    pass
+    max_workers: int = 4  # Concurrent bd processes for bulk label changes
 
 
 @dataclass
@@ -54,19 +58,66 @@ class GTDConfig:
 
 
 def get_git_root() -> Path | None:
-    """Get the root of the current git repository."""
+    """Get the root of the current git repository.
+
+    Cached per working directory and git discovery environment, since
+    config, history and review lookups all need it.
+    """
+    try:
+        cwd = Path.cwd()
+    except OSError:
+        return None
+    return _git_root_for(
+        cwd, os.environ.get("GIT_DIR"), os.environ.get("GIT_WORK_TREE")
+    )
+
+
+@lru_cache(maxsize=8)
+def _git_root_for(
+    cwd: Path, git_dir: str | None, git_work_tree: str | None
+) -> Path | None:
+    """Get the root of the git repository containing cwd.
+
+    Walks up to the nearest directory with a .git entry instead of spawning
+    git; only asks git itself when GIT_DIR/GIT_WORK_TREE override discovery
+    or a .git file is not a plain gitdir pointer.
+    """
+    if git_dir is None and git_work_tree is None:
+        for directory in (cwd, *cwd.parents):
+            git = directory / ".git"
+            if git.is_dir():
+                if (git / "HEAD").is_file():
+                    return directory
+            elif git.is_file():
+                # Worktrees and submodules: the checkout root holds the file
+                if _is_gitdir_file(git):
+                    return directory
+                break
+        else:
+            return None
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
             capture_output=True,
             text=True,
             check=True,
+            cwd=cwd,
         )
         return Path(result.stdout.strip())
     except (subprocess.CalledProcessError, FileNotFoundError):
         return None
 
 
+def _is_gitdir_file(path: Path) -> bool:
+    """Check whether a .git file points at a git directory."""
+    try:
+        with path.open() as f:
+            return f.readline().startswith("gitdir:")
+    except OSError:
+        return False
+
+
 def find_config_file(start_dir: Path | None = None) -> Path | None:
     """Find .gtd/config.json in git root or cwd (repo-local only).
 
@@ -108,19 +159,36 @@ def load_config(config_path: Path | None = None) -> GTDConfig:
             repository root (if any) or the current working directory.
 
     Returns:
-        GTDConfig with loaded or default values.
+        GTDConfig with loaded or default values. A file that has not changed
+        since it was last loaded is not read or decoded again.
     """
     if config_path is None:
         config_path = find_config_file()
 
-    if config_path is None or not config_path.exists():
+    if config_path is None:
+        return GTDConfig()
+
+    try:
+        st = config_path.stat()
+    except OSError:
         return GTDConfig()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == stamp:
+        return _parse_config(cached[1])
 
     try:
         data = json.loads(config_path.read_text())
     except json.JSONDecodeError:
         return GTDConfig()
 
+    _CONFIG_CACHE[config_path] = (stamp, data)
+    # Each call builds its own GTDConfig, so callers may change it freely
+    return _parse_config(data)
+
+
+def _parse_config(data: dict) -> GTDConfig:
+    """Build a GTDConfig from parsed JSON, falling back to defaults."""
     # Build config from parsed data
     backend = data.get("backend", "github")
     if backend not in AVAILABLE_BACKENDS:
@@ -212,6 +280,9 @@ def save_config(config: GTDConfig, path: Path | None = None) -> Path:
     elif config.backend == "github":
         if config.github.repo:
             data["github"] = {"repo": config.github.repo}
+    elif config.backend == "beads":
+        if config.beads.max_workers != BeadsBackendConfig.max_workers:
+            data["beads"] = {"max_workers": config.beads.max_workers}
 
     path.write_text(json.dumps(data, indent=2) + "\n")
     return path
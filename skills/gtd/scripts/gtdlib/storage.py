@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from .metadata import GTDMetadata
 
 
-@dataclass
+@dataclass(slots=True)
 class GTDItem:
     """A GTD item (action, project, or goal)."""
 
@@ -123,6 +123,18 @@ class StorageNotSetupError(Exception):
     pass
 
 
+class PartialCreateError(RuntimeError):
+    """Raised when a batch create fails after creating some of its items.
+
+    Attributes:
+        created: Items that were created before the failure, in spec order.
+    """
+
+    def __init__(self, message: str, created: list[GTDItem]):
+        super().__init__(message)
+        self.created = created
+
+
 class GTDStorage(ABC):
     """Abstract interface for GTD storage backends."""
 
@@ -207,6 +219,13 @@ class GTDStorage(ABC):
         """
         ...
 
+    def snapshot(self) -> None:
+        """Prefetch state that setup and label checks read together.
+
+        Backends that can fetch it in fewer or overlapping round-trips should
+        override this; the default fetches lazily, query by query.
+        """
+
     def ensure_setup(self) -> None:
         """Ensure storage is set up, running setup if needed.
 
@@ -287,6 +306,20 @@ class GTDStorage(ABC):
         # Inbox items get status/someday only - no context, energy, or horizon
         return self.create_item(title=title, labels=["status/someday"], body=body)
 
+    def create_items(self, specs: list[dict]) -> list[GTDItem]:
+        """Create several items; specs are create_item() keyword arguments.
+
+        Backends that can batch creation should override this.
+        """
+        return [self.create_item(**spec) for spec in specs]
+
+    def get_items(self, item_ids: list[str]) -> list[GTDItem | None]:
+        """Get several items by ID (None for IDs not found), in order.
+
+        Backends that can fetch concurrently should override this.
+        """
+        return [self.get_item(item_id) for item_id in item_ids]
+
     def list_inbox(self) -> list[GTDItem]:
         """List all inbox items (unclarified)."""
         # Get items with status/someday that lack horizon/context/energy
@@ -137,6 +137,33 @@ class TestGenerateIdempotent:
         assert normalized_stdout == snapshot
 
 
+class TestGenerateCache:
+    """Tests for the persistent parse cache."""
+
+    def test_cache_entries_follow_source(self, tmp_path):
+        """Unchanged files reuse their entry; stale entries are pruned."""
+        src_dir = tmp_path / "src" / "calculator"
+        map_dir = tmp_path / "docs" / "map"
+        shutil.copytree(CALCULATOR_SRC, src_dir)
+        cache_dir = map_dir / ".cache" / "symbols"
+
+        run_code_map("generate", str(src_dir), str(map_dir))
+        first = {p.name for p in cache_dir.glob("*.json")}
+        assert len(first) == 3
+        assert (map_dir / ".cache" / ".gitignore").exists()
+
+        ops_file = src_dir / "operations.py"
+        ops_file.write_text(ops_file.read_text() + "\n\ndef noop():\n    pass\n")
+        _stdout, stderr, code = run_code_map("generate", str(src_dir), str(map_dir))
+
+        assert code == 0, f"CLI failed: {stderr}"
+        second = {p.name for p in cache_dir.glob("*.json")}
+        assert len(second) == 3
+        assert len(first & second) == 2
+        content = (map_dir / "modules" / "calculator" / "operations.md").read_text()
+        assert "noop" in content
+
+
 class TestGenerateDetectsChanges:
     """Snapshot tests for change detection."""
 
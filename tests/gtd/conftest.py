@@ -1,5 +1,7 @@
 """Shared fixtures for GTD tests."""
 
+import importlib.machinery
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -15,3 +17,14 @@ def gtd_dir(tmp_path):
     d = tmp_path / ".gtd"
     d.mkdir()
     return d
+
+
+@pytest.fixture
+def gtd_cli():
+    """Import the gtd CLI script (no .py extension) as a testable module."""
+    script = Path(__file__).parent.parent.parent / "skills/gtd/scripts/gtd"
+    loader = importlib.machinery.SourceFileLoader("gtd_cli", str(script))
+    spec = importlib.util.spec_from_file_location("gtd_cli", script, loader=loader)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
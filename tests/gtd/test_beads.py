@@ -5,13 +5,14 @@ Unit tests using mocked subprocess calls. Does not require bd CLI installed.
 
 from __future__ import annotations
 
+import io
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 from gtdlib.backends.beads import BeadsStorage
 from gtdlib.config import BeadsBackendConfig
-from gtdlib.storage import GTDStorage, StorageNotSetupError
+from gtdlib.storage import GTDStorage, PartialCreateError, StorageNotSetupError
 
 # --- Helpers ---
 
@@ -27,6 +28,16 @@ def _mock_bd_result(
     return result
 
 
+def _mock_bd_popen(stdout: str = "", returncode: int = 0) -> MagicMock:
+    """Create a mock subprocess.Popen whose process streams stdout."""
+    proc = MagicMock()
+    proc.stdout = io.StringIO(stdout)
+    proc.returncode = returncode
+    popen = MagicMock()
+    popen.return_value.__enter__.return_value = proc
+    return popen
+
+
 def _bd_json(data: list | dict) -> str:
     """Serialize data to JSON string as bd CLI would output."""
     return json.dumps(data)
@@ -144,6 +155,22 @@ class TestIsSetup:
             mock_run.return_value = _mock_bd_result(returncode=1, stderr="no database")
             assert storage.is_setup() is False
 
+    def test_is_setup_probes_bd_once_when_available(self, storage: BeadsStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_bd_result(stdout='{"total": 5}')
+            assert storage.is_setup() is True
+            assert storage.is_setup() is True
+            assert mock_run.call_count == 1
+
+    def test_is_setup_retries_after_failure(self, storage: BeadsStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _mock_bd_result(returncode=1, stderr="no database"),
+                _mock_bd_result(stdout='{"total": 0}'),
+            ]
+            assert storage.is_setup() is False
+            assert storage.is_setup() is True
+
 
 class TestSetup:
     """Test setup() behavior."""
@@ -167,6 +194,14 @@ class TestSetup:
             with pytest.raises(StorageNotSetupError, match="not initialized"):
                 storage.setup()
 
+    def test_setup_reuses_is_setup_probe(self, storage: BeadsStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_bd_result(stdout='{"total": 5}')
+            assert storage.is_setup() is True
+            storage.setup()
+            storage.setup()
+            assert mock_run.call_count == 1
+
 
 # --- CRUD Operations ---
 
@@ -255,6 +290,65 @@ class TestCreateItem:
             assert "status/active" in item.labels
             assert "horizon/action" in item.labels
 
+    def test_create_items_fetches_created_items_once(self, storage: BeadsStorage):
+        ids = {"Buy milk": "GTD-abc", "Review PR": "GTD-def"}
+        with (
+            patch(
+                "subprocess.Popen",
+                _mock_bd_popen(_bd_json([SAMPLE_BEAD_WITH_LABELS, SAMPLE_BEAD])),
+            ) as mock_popen,
+            patch("subprocess.run") as mock_run,
+        ):
+            mock_run.side_effect = lambda cmd, **kwargs: _mock_bd_result(
+                stdout=ids[cmd[2]] + "\n"
+            )
+            items = storage.create_items(
+                [
+                    {"title": "Buy milk", "labels": ["status/someday"]},
+                    {"title": "Review PR", "labels": ["status/active"]},
+                ]
+            )
+            assert [item.id for item in items] == ["GTD-abc", "GTD-def"]
+            assert mock_run.call_count == 2
+            cmd = mock_popen.call_args[0][0]
+            assert cmd[cmd.index("--id") + 1] == "GTD-abc,GTD-def"
+
+    def test_create_items_falls_back_to_show(self, storage: BeadsStorage):
+        with (
+            patch("subprocess.Popen", _mock_bd_popen("[]")),
+            patch("subprocess.run") as mock_run,
+        ):
+            mock_run.side_effect = [
+                _mock_bd_result(stdout="GTD-abc\n"),
+                _mock_bd_result(stdout=_bd_json([SAMPLE_BEAD])),
+            ]
+            items = storage.create_items(
+                [{"title": "Buy milk", "labels": ["status/someday"]}]
+            )
+            assert [item.id for item in items] == ["GTD-abc"]
+            assert mock_run.call_args[0][0][:3] == ["bd", "show", "GTD-abc"]
+
+    def test_create_items_failure_reports_created_items(self, storage: BeadsStorage):
+        with (
+            patch("subprocess.Popen", _mock_bd_popen(_bd_json([SAMPLE_BEAD]))),
+            patch("subprocess.run") as mock_run,
+        ):
+            mock_run.side_effect = [
+                _mock_bd_result(stdout="GTD-abc\n"),
+                _mock_bd_result(returncode=1, stderr="database is locked"),
+            ]
+            with pytest.raises(PartialCreateError) as excinfo:
+                storage.create_items(
+                    [
+                        {"title": "Buy milk", "labels": ["status/someday"]},
+                        {"title": "Review PR", "labels": ["status/active"]},
+                        {"title": "Never tried", "labels": ["status/active"]},
+                    ]
+                )
+            assert [item.id for item in excinfo.value.created] == ["GTD-abc"]
+            assert "GTD-abc" in str(excinfo.value)
+            assert mock_run.call_count == 2  # Stops at the failed create
+
 
 class TestGetItem:
     """Test retrieving items by ID."""
@@ -303,59 +397,85 @@ class TestGetItem:
             assert item.state == "closed"
             assert item.closed_at == "2026-02-26T12:00:00Z"
 
+    def test_get_items_preserves_order_and_missing(self, storage: BeadsStorage):
+        beads = {"GTD-abc": SAMPLE_BEAD, "GTD-def": SAMPLE_BEAD_WITH_LABELS}
+
+        def show(cmd, **kwargs):
+            bead = beads.get(cmd[2])
+            if bead is None:
+                return _mock_bd_result(returncode=1, stderr="not found")
+            return _mock_bd_result(stdout=_bd_json([bead]))
+
+        with patch("subprocess.run", side_effect=show) as mock_run:
+            items = storage.get_items(["GTD-def", "GTD-zzz", "GTD-abc", "GTD-def"])
+            assert [i.id if i else None for i in items] == [
+                "GTD-def",
+                None,
+                "GTD-abc",
+                "GTD-def",
+            ]
+            # One bd show per distinct ID
+            assert mock_run.call_count == 3
+
+    def test_get_items_uses_cache(self, storage: BeadsStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_bd_result(stdout=_bd_json([SAMPLE_BEAD]))
+            storage.get_item("GTD-abc")
+            assert [i.id for i in storage.get_items(["GTD-abc"])] == ["GTD-abc"]
+            assert mock_run.call_count == 1
+
 
 class TestListItems:
     """Test listing/querying items."""
 
     def test_list_empty_returns_empty(self, storage: BeadsStorage):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _mock_bd_result(stdout="[]")
+        with patch("subprocess.Popen", _mock_bd_popen("[]")):
             items = storage.list_items()
             assert items == []
 
+    def test_list_failure_returns_empty(self, storage: BeadsStorage):
+        with patch("subprocess.Popen", _mock_bd_popen("", returncode=1)):
+            assert storage.list_items() == []
+
     def test_list_returns_items(self, storage: BeadsStorage):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _mock_bd_result(
-                stdout=_bd_json([SAMPLE_BEAD, SAMPLE_BEAD_WITH_LABELS])
-            )
+        with patch(
+            "subprocess.Popen",
+            _mock_bd_popen(_bd_json([SAMPLE_BEAD, SAMPLE_BEAD_WITH_LABELS])),
+        ):
             items = storage.list_items()
             assert len(items) == 2
 
     def test_list_filters_by_label(self, storage: BeadsStorage):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _mock_bd_result(
-                stdout=_bd_json([SAMPLE_BEAD_WITH_LABELS])
-            )
+        with patch(
+            "subprocess.Popen", _mock_bd_popen(_bd_json([SAMPLE_BEAD_WITH_LABELS]))
+        ) as mock_popen:
             storage.list_items(labels=["status/active"])
             # Verify bd list was called with correct label filter
-            cmd = mock_run.call_args[0][0]
+            cmd = mock_popen.call_args[0][0]
             assert "--label" in cmd
             label_idx = cmd.index("--label")
             assert "gtd:status:active" in cmd[label_idx + 1]
 
     def test_list_filters_by_state_open(self, storage: BeadsStorage):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _mock_bd_result(stdout="[]")
+        with patch("subprocess.Popen", _mock_bd_popen("[]")) as mock_popen:
             storage.list_items(state="open")
-            cmd = mock_run.call_args[0][0]
+            cmd = mock_popen.call_args[0][0]
             assert "--status" in cmd
             status_idx = cmd.index("--status")
             assert cmd[status_idx + 1] == "open"
 
     def test_list_filters_by_state_closed(self, storage: BeadsStorage):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _mock_bd_result(stdout="[]")
+        with patch("subprocess.Popen", _mock_bd_popen("[]")) as mock_popen:
             storage.list_items(state="closed")
-            cmd = mock_run.call_args[0][0]
+            cmd = mock_popen.call_args[0][0]
             assert "--status" in cmd
             status_idx = cmd.index("--status")
             assert cmd[status_idx + 1] == "closed"
 
     def test_list_filters_by_project(self, storage: BeadsStorage):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _mock_bd_result(stdout="[]")
+        with patch("subprocess.Popen", _mock_bd_popen("[]")) as mock_popen:
             storage.list_items(project="website")
-            cmd = mock_run.call_args[0][0]
+            cmd = mock_popen.call_args[0][0]
             assert "--label" in cmd
             # Should include project:website in labels
             label_indices = [i for i, x in enumerate(cmd) if x == "--label"]
@@ -363,10 +483,9 @@ class TestListItems:
             assert any("project:website" in v for v in label_values)
 
     def test_list_respects_limit(self, storage: BeadsStorage):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _mock_bd_result(stdout="[]")
+        with patch("subprocess.Popen", _mock_bd_popen("[]")) as mock_popen:
             storage.list_items(limit=25)
-            cmd = mock_run.call_args[0][0]
+            cmd = mock_popen.call_args[0][0]
             assert "--limit" in cmd
             limit_idx = cmd.index("--limit")
             assert cmd[limit_idx + 1] == "25"
@@ -389,7 +508,7 @@ class TestUpdateItem:
             title_idx = cmd.index("--title")
             assert cmd[title_idx + 1] == "New title"
 
-    def test_update_labels_replaces_all(self, storage: BeadsStorage):
+    def test_update_labels_replaces_gtd_labels(self, storage: BeadsStorage):
         with patch("subprocess.run") as mock_run:
             updated_bead = {
                 **SAMPLE_BEAD,
@@ -407,7 +526,11 @@ class TestUpdateItem:
             )
             update_call = mock_run.call_args_list[1]
             cmd = update_call[0][0]
-            assert "--set-labels" in cmd
+            assert cmd[cmd.index("--remove-label") + 1] == "gtd:status:someday"
+            added = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "--add-label"]
+            assert added == ["gtd:status:waiting", "gtd:context:meetings"]
+            # The updated item comes from the update output, not another show
+            assert mock_run.call_count == 2
 
     def test_update_body(self, storage: BeadsStorage):
         with patch("subprocess.run") as mock_run:
@@ -439,6 +562,50 @@ class TestUpdateItem:
             assert item.project == "newproj"
 
 
+class TestItemCache:
+    """Test that bd show results are reused until the item is mutated."""
+
+    def test_get_item_is_cached(self, storage: BeadsStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_bd_result(stdout=_bd_json([SAMPLE_BEAD]))
+            assert storage.get_item("GTD-abc") == storage.get_item("GTD-abc")
+            assert mock_run.call_count == 1
+
+    def test_missing_item_is_not_cached(self, storage: BeadsStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _mock_bd_result(returncode=1, stderr="not found"),
+                _mock_bd_result(stdout=_bd_json([SAMPLE_BEAD])),
+            ]
+            assert storage.get_item("GTD-abc") is None
+            assert storage.get_item("GTD-abc") is not None
+
+    def test_update_reuses_fetched_labels(self, storage: BeadsStorage):
+        with patch("subprocess.run") as mock_run:
+            updated_bead = {**SAMPLE_BEAD, "labels": ["gtd:status:active"]}
+            mock_run.side_effect = [
+                _mock_bd_result(stdout=_bd_json([SAMPLE_BEAD])),  # get_item
+                _mock_bd_result(stdout=_bd_json([updated_bead])),  # update
+            ]
+            storage.get_item("GTD-abc")
+            item = storage.update_item("GTD-abc", labels=["status/active"])
+            assert item.labels == ["status/active"]
+            assert mock_run.call_args_list[1][0][0][:2] == ["bd", "update"]
+            assert storage.get_item("GTD-abc") == item
+            assert mock_run.call_count == 2
+
+    def test_update_refetches_when_output_lacks_labels(self, storage: BeadsStorage):
+        with patch("subprocess.run") as mock_run:
+            partial = {"id": "GTD-abc", "title": "New title"}
+            mock_run.side_effect = [
+                _mock_bd_result(stdout=_bd_json([partial])),  # update
+                _mock_bd_result(stdout=_bd_json([SAMPLE_BEAD])),  # get_item
+            ]
+            item = storage.update_item("GTD-abc", title="New title")
+            assert item.labels == ["status/someday"]
+            assert mock_run.call_count == 2
+
+
 class TestAddRemoveLabels:
     """Test incremental label management."""
 
@@ -560,6 +727,48 @@ class TestGetComments:
             assert comments == []
 
 
+class TestDeleteLabel:
+    """Test removing a GTD label from every item that has it."""
+
+    def test_delete_label_updates_each_item(self, storage: BeadsStorage):
+        listing = _bd_json([SAMPLE_BEAD, {**SAMPLE_BEAD, "id": "GTD-def"}])
+        with (
+            patch("subprocess.Popen", _mock_bd_popen(listing)),
+            patch("subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = _mock_bd_result()
+            assert storage.delete_label("status/someday") is True
+            mock_run.assert_called_once()
+            cmd = mock_run.call_args[0][0]
+            assert cmd[:4] == ["bd", "update", "GTD-abc", "GTD-def"]
+            assert cmd[4:] == ["--remove-label", "gtd:status:someday"]
+
+    def test_delete_label_streams_large_listing(self, storage: BeadsStorage):
+        beads = [{**SAMPLE_BEAD, "id": f"GTD-{i}"} for i in range(2000)]
+        with (
+            patch("subprocess.Popen", _mock_bd_popen(_bd_json(beads))),
+            patch("subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = _mock_bd_result()
+            assert storage.delete_label("status/someday") is True
+            # IDs are batched into a few multi-ID updates, not one per item
+            assert mock_run.call_count == 4
+            updated = [i for c in mock_run.call_args_list for i in c[0][0][2:-2]]
+            assert sorted(updated) == sorted(bead["id"] for bead in beads)
+
+    def test_delete_label_without_items(self, storage: BeadsStorage):
+        with (
+            patch("subprocess.Popen", _mock_bd_popen("[]")),
+            patch("subprocess.run") as mock_run,
+        ):
+            assert storage.delete_label("status/someday") is False
+            mock_run.assert_not_called()
+
+    def test_delete_label_when_list_fails(self, storage: BeadsStorage):
+        with patch("subprocess.Popen", _mock_bd_popen("", returncode=1)):
+            assert storage.delete_label("status/someday") is False
+
+
 # --- Convenience Methods (from GTDStorage base class) ---
 
 
@@ -585,14 +794,13 @@ class TestListByContext:
     """Test context-based filtering via base class convenience method."""
 
     def test_list_by_context(self, storage: BeadsStorage):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _mock_bd_result(
-                stdout=_bd_json([SAMPLE_BEAD_WITH_LABELS])
-            )
+        with patch(
+            "subprocess.Popen", _mock_bd_popen(_bd_json([SAMPLE_BEAD_WITH_LABELS]))
+        ) as mock_popen:
             items = storage.list_by_context("focus")
             assert len(items) == 1
             # Verify labels filter included context/focus and status/active
-            cmd = mock_run.call_args[0][0]
+            cmd = mock_popen.call_args[0][0]
             label_indices = [i for i, x in enumerate(cmd) if x == "--label"]
             label_values = [cmd[i + 1] for i in label_indices]
             all_labels = ",".join(label_values)
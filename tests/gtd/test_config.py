@@ -9,6 +9,7 @@ from gtdlib.config import (
     GTDConfig,
     TaskwarriorConfig,
     detect_skill_directory,
+    get_git_root,
     load_config,
     save_config,
 )
@@ -45,6 +46,37 @@ class TestWrongDirectoryDetection:
         assert detect_skill_directory(tmp_path) is False
 
 
+class TestGitRoot:
+    """Test get_git_root() discovery without spawning git."""
+
+    def test_finds_repository_root_from_subdirectory(self, tmp_path, monkeypatch):
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        subdir = tmp_path / "a" / "b"
+        subdir.mkdir(parents=True)
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+        monkeypatch.chdir(subdir)
+        assert get_git_root() == tmp_path.resolve()
+
+    def test_git_environment_is_part_of_the_cache_key(self, tmp_path, monkeypatch):
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+        monkeypatch.chdir(tmp_path)
+        assert get_git_root() == tmp_path.resolve()
+        monkeypatch.setenv("GIT_DIR", str(tmp_path / "missing"))
+        assert get_git_root() is None
+
+    def test_worktree_gitdir_file_marks_root(self, tmp_path, monkeypatch):
+        (tmp_path / ".git").write_text("gitdir: /elsewhere/.git/worktrees/wt\n")
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+        monkeypatch.chdir(tmp_path)
+        assert get_git_root() == tmp_path.resolve()
+
+
 class TestLoadConfig:
     """Test configuration loading from files."""
 
@@ -95,6 +127,18 @@ class TestLoadConfig:
         assert config.backend == "beads"
         assert isinstance(config.beads, BeadsBackendConfig)
 
+    def test_load_reuses_parsed_config_until_file_changes(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"backend": "taskwarrior"}))
+        first = load_config(config_file)
+        assert load_config(config_file) == first
+
+        first.backend = "beads"  # Not shared with later loads
+        assert load_config(config_file).backend == "taskwarrior"
+
+        config_file.write_text(json.dumps({"backend": "beads", "beads": {}}))
+        assert load_config(config_file).backend == "beads"
+
     def test_load_corrupt_backend_section_uses_defaults(self, tmp_path):
         config_file = tmp_path / "config.json"
         config_file.write_text(
@@ -157,6 +201,13 @@ class TestSaveConfig:
         assert loaded.backend == "taskwarrior"
         assert loaded.taskwarrior.data_dir == "/my/data"
 
+    def test_save_beads_with_max_workers_includes_section(self, tmp_path):
+        path = tmp_path / "config.json"
+        config = GTDConfig(backend="beads", beads=BeadsBackendConfig(max_workers=8))
+        save_config(config, path)
+        loaded = load_config(path)
+        assert loaded.beads.max_workers == 8
+
     def test_roundtrip_beads_config(self, tmp_path):
         path = tmp_path / "config.json"
         original = GTDConfig(backend="beads")
@@ -0,0 +1,429 @@
+"""Tests for GitHubStorage backend.
+
+Unit tests using mocked subprocess calls. Does not require gh CLI installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from gtdlib.backends.github import GitHubStorage
+from gtdlib.storage import GTDStorage
+
+# --- Helpers ---
+
+
+def _mock_gh_result(
+    stdout: str = "", stderr: str = "", returncode: int = 0
+) -> MagicMock:
+    """Create a mock subprocess.CompletedProcess (gh runs in bytes mode)."""
+    result = MagicMock()
+    result.stdout = stdout.encode()
+    result.stderr = stderr.encode()
+    result.returncode = returncode
+    return result
+
+
+def _mock_gh_http(
+    body: str = "", status: str = "200 OK", etag: str | None = None
+) -> MagicMock:
+    """Create a mock `gh api -i` result (headers, blank line, body)."""
+    headers = f"HTTP/2.0 {status}\r\nContent-Type: application/json\r\n"
+    if etag:
+        headers += f'Etag: "{etag}"\r\n'
+    returncode = 0 if status.startswith("2") else 1
+    return _mock_gh_result(stdout=f"{headers}\r\n{body}", returncode=returncode)
+
+
+def _all_labels() -> list[dict]:
+    """Label listing as gh returns it for a fully set-up repo."""
+    return [
+        {
+            "name": f"{category}/{name}",
+            "color": config["color"].lower(),
+            "description": config["description"],
+        }
+        for category, items in GTDStorage.LABELS.items()
+        for name, config in items.items()
+    ]
+
+
+SAMPLE_ISSUE = {
+    "number": 12,
+    "title": "Buy milk",
+    "body": "From the store",
+    "state": "OPEN",
+    "labels": [{"name": "status/someday"}],
+    "milestone": None,
+    "url": "https://github.com/owner/repo/issues/12",
+    "createdAt": "2026-02-26T10:00:00Z",
+    "closedAt": None,
+}
+
+
+SAMPLE_REST_ISSUE = {
+    "number": 12,
+    "title": "New title",
+    "body": "From the store",
+    "state": "open",
+    "labels": [{"name": "status/active"}],
+    "milestone": {"number": 3, "title": "Web"},
+    "url": "https://api.github.com/repos/owner/repo/issues/12",
+    "html_url": "https://github.com/owner/repo/issues/12",
+    "created_at": "2026-02-26T10:00:00Z",
+    "closed_at": None,
+}
+
+
+@pytest.fixture
+def storage() -> GitHubStorage:
+    """Create a GitHubStorage instance for testing."""
+    return GitHubStorage(repo="owner/repo")
+
+
+class TestLabelsCache:
+    """Test that the repo label listing is fetched once and kept current."""
+
+    def test_listing_is_fetched_once(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_gh_http(json.dumps(_all_labels()))
+            assert storage.is_setup() is True
+            assert storage.get_stale_labels() == []
+            assert storage.get_label_drift() == []
+            assert mock_run.call_count == 1
+
+    def test_failed_listing_is_not_cached(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _mock_gh_result(returncode=1, stderr="network"),
+                _mock_gh_http(json.dumps(_all_labels())),
+            ]
+            assert storage.is_setup() is False
+            assert storage.is_setup() is True
+
+    def test_setup_records_created_labels(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [_mock_gh_http("[]")] + [
+                _mock_gh_result() for _ in storage.get_all_labels()
+            ]
+            storage.setup()
+            calls = mock_run.call_count
+            assert storage.is_setup() is True
+            assert mock_run.call_count == calls
+
+    def test_delete_label_updates_cache(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _mock_gh_http(json.dumps(_all_labels())),
+                _mock_gh_result(),
+            ]
+            assert "status/someday" in storage.get_existing_labels()
+            assert storage.delete_label("status/someday") is True
+            assert "status/someday" not in storage.get_existing_labels()
+            assert mock_run.call_count == 2
+
+
+class TestRestCalls:
+    """Test that issue and label changes go through gh api REST endpoints."""
+
+    def test_close_patches_issue_state(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_gh_result(stdout=json.dumps(SAMPLE_ISSUE))
+            storage.close_item("12")
+            cmd = mock_run.call_args_list[0][0][0]
+            assert cmd == [
+                "gh",
+                "api",
+                "-X",
+                "PATCH",
+                "repos/owner/repo/issues/12",
+                "--input",
+                "-",
+            ]
+            assert json.loads(mock_run.call_args_list[0][1]["input"].decode()) == {
+                "state": "closed"
+            }
+
+    def test_label_names_are_escaped_in_path(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_gh_result()
+            assert storage.delete_label("status/someday") is True
+            cmd = mock_run.call_args[0][0]
+            assert cmd[-1] == "repos/owner/repo/labels/status%2Fsomeday"
+            assert "--repo" not in cmd
+
+
+class TestCreateItem:
+    """Test issue creation."""
+
+    def test_create_item_parses_rest_response(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_gh_result(
+                stdout=json.dumps(SAMPLE_REST_ISSUE)
+            )
+            item = storage.create_item("New title", ["status/active"])
+            mock_run.assert_called_once()
+            assert mock_run.call_args[0][0][2:5] == [
+                "-X",
+                "POST",
+                "repos/owner/repo/issues",
+            ]
+            assert json.loads(mock_run.call_args[1]["input"].decode()) == {
+                "title": "New title",
+                "body": "",
+                "labels": ["status/active"],
+            }
+            assert item.id == "12"
+            assert item.labels == ["status/active"]
+            assert item.project == "Web"
+
+
+class TestLabelEdits:
+    """Test label changes on issues and in the repo."""
+
+    def test_add_labels_uses_one_request(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_gh_result(stdout=json.dumps(SAMPLE_ISSUE))
+            storage.add_labels("12", ["context/focus", "energy/high"])
+            cmd = mock_run.call_args_list[0][0][0]
+            assert cmd[2:5] == ["-X", "POST", "repos/owner/repo/issues/12/labels"]
+            assert json.loads(mock_run.call_args_list[0][1]["input"].decode()) == {
+                "labels": ["context/focus", "energy/high"]
+            }
+            assert mock_run.call_count == 2  # POST + issue view
+
+    def test_update_item_uses_one_patch(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _mock_gh_http(json.dumps([{"number": 3, "title": "Web"}])),
+                _mock_gh_result(stdout=json.dumps(SAMPLE_REST_ISSUE)),
+            ]
+            item = storage.update_item(
+                "12", title="New title", labels=["status/active"], project="Web"
+            )
+            cmd = mock_run.call_args[0][0]
+            assert cmd[2:5] == ["-X", "PATCH", "repos/owner/repo/issues/12"]
+            assert json.loads(mock_run.call_args[1]["input"].decode()) == {
+                "title": "New title",
+                "milestone": 3,
+                "labels": ["status/active"],
+            }
+            # The PATCH response is parsed; no follow-up issue view
+            assert mock_run.call_count == 2
+            assert item.url == "https://github.com/owner/repo/issues/12"
+            assert item.created_at == "2026-02-26T10:00:00Z"
+
+    def test_setup_fixes_drifted_labels(self, storage: GitHubStorage, capsys):
+        labels = _all_labels()
+        labels[0]["color"] = "000000"
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _mock_gh_http(json.dumps(labels)),
+                _mock_gh_result(stdout="{}"),
+            ]
+            storage.setup(verbose=True, fix_drift=True)
+            assert f"Fixed: {labels[0]['name']}" in capsys.readouterr().out
+            assert storage.get_label_drift() == []
+
+
+class TestMilestones:
+    """Test milestone (GTD project) queries."""
+
+    def test_list_milestones_parses_array_once(self, storage: GitHubStorage):
+        milestone = {
+            "number": 3,
+            "title": "Website",
+            "description": "Relaunch",
+            "due_on": None,
+            "open_issues": 2,
+            "closed_issues": 1,
+            "state": "open",
+            "url": "https://api.github.com/repos/owner/repo/milestones/3",
+            "creator": {"login": "someone"},
+        }
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_gh_http(json.dumps([milestone]))
+            milestones = storage.list_milestones()
+            assert milestones == [
+                {k: v for k, v in milestone.items() if k != "creator"}
+            ]
+            cmd = mock_run.call_args[0][0]
+            assert "--jq" not in cmd
+            assert cmd[-1].endswith("milestones?state=open&per_page=100")
+
+    def test_list_milestones_failure_returns_empty(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_gh_http("{}", status="404 Not Found")
+            assert storage.list_milestones() == []
+
+    def test_get_milestone_lists_once(self, storage: GitHubStorage):
+        milestones = [{"number": 1, "title": "Website"}, {"number": 2, "title": "Ops"}]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_gh_http(json.dumps(milestones))
+            assert storage.get_milestone("Website")["number"] == 1
+            assert storage.get_milestone("Ops")["number"] == 2
+            assert storage.get_milestone("Missing") is None
+            assert mock_run.call_count == 1
+
+    def test_ensure_project_caches_created_milestone(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _mock_gh_http("[]"),
+                _mock_gh_result(stdout=json.dumps({"number": 7, "title": "New"})),
+            ]
+            assert storage.ensure_project("New")["number"] == 7
+            assert storage.ensure_project("New")["number"] == 7
+            assert mock_run.call_count == 2
+
+    def test_ensure_projects_creates_only_missing(self, storage: GitHubStorage):
+        def respond(cmd, **kwargs):
+            if "POST" in cmd:
+                title = json.loads(kwargs["input"].decode())["title"]
+                return _mock_gh_result(stdout=json.dumps({"number": 9, "title": title}))
+            return _mock_gh_http(json.dumps([{"number": 1, "title": "Website"}]))
+
+        with patch("subprocess.run", side_effect=respond) as mock_run:
+            projects = storage.ensure_projects(["Website", "Ops", "Website"])
+            assert list(projects) == ["Website", "Ops"]
+            assert projects["Website"]["number"] == 1
+            assert projects["Ops"]["number"] == 9
+            assert storage.get_milestone("Ops")["number"] == 9  # Cached
+            assert mock_run.call_count == 2
+
+    def test_ensure_projects_unlistable_milestones_raises(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = _mock_gh_http("", status="500 Server Error")
+            with pytest.raises(RuntimeError):
+                storage.ensure_projects(["Website", "Ops"])
+            assert mock_run.call_count == 1  # No per-name listings or creates
+
+    def test_snapshot_fills_both_caches(self, storage: GitHubStorage):
+        def respond(cmd, **kwargs):
+            if "/labels?" in cmd[-1]:
+                return _mock_gh_http(json.dumps(_all_labels()))
+            return _mock_gh_http(json.dumps([{"number": 1, "title": "Website"}]))
+
+        with patch("subprocess.run", side_effect=respond) as mock_run:
+            storage.snapshot()
+            assert mock_run.call_count == 2
+            assert storage.is_setup() is True
+            assert storage.ensure_project("Website")["number"] == 1
+            assert mock_run.call_count == 2
+
+    def test_setup_check_reads_only_the_snapshot(self, storage: GitHubStorage, gtd_cli):
+        def respond(cmd, **kwargs):
+            if "/labels?" in cmd[-1]:
+                return _mock_gh_http(json.dumps(_all_labels()))
+            return _mock_gh_http(json.dumps([{"number": 1, "title": "Website"}]))
+
+        args = argparse.Namespace(
+            repo=None, backend=None, cleanup=False, check=True, force=False
+        )
+        with (
+            patch.object(gtd_cli, "get_storage", return_value=storage),
+            patch("subprocess.run", side_effect=respond) as mock_run,
+        ):
+            assert gtd_cli.cmd_setup(args) == 0
+            # The two snapshot listings; is_setup, drift and stale add none
+            assert mock_run.call_count == 2
+
+    def test_list_milestones_follows_next_page(self, storage: GitHubStorage):
+        first = _mock_gh_http(json.dumps([{"number": 1, "title": "Website"}]))
+        first.stdout = first.stdout.replace(
+            b"\r\n\r\n",
+            b"\r\nLink: <https://api.github.com/repositories/1/milestones"
+            b'?state=open&per_page=100&page=2>; rel="next"\r\n\r\n',
+        )
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                first,
+                _mock_gh_http(json.dumps([{"number": 2, "title": "Ops"}])),
+            ]
+            titles = [m["title"] for m in storage.list_milestones()]
+            assert titles == ["Website", "Ops"]
+            assert mock_run.call_args[0][0][-1].endswith("per_page=100&page=2")
+
+    def test_list_milestones_revalidates_with_etag(self, storage: GitHubStorage):
+        milestones = [{"number": 1, "title": "Website"}]
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _mock_gh_http(json.dumps(milestones), etag="v1"),
+                _mock_gh_http(status="304 Not Modified"),
+            ]
+            first = storage.list_milestones()
+            assert storage.list_milestones() == first
+            cmd = mock_run.call_args[0][0]
+            assert cmd[cmd.index("-H") + 1] == 'If-None-Match: "v1"'
+
+
+class TestListItems:
+    """Test issue listing via the GraphQL repository issues connection."""
+
+    @staticmethod
+    def _page(nodes: list[dict], cursor: str | None = None) -> MagicMock:
+        page_info = {"hasNextPage": cursor is not None, "endCursor": cursor}
+        issues = {"pageInfo": page_info, "nodes": nodes}
+        data = {"data": {"repository": {"issues": issues}}}
+        return _mock_gh_result(stdout=json.dumps(data))
+
+    @staticmethod
+    def _node(*labels: str) -> dict:
+        return {**SAMPLE_ISSUE, "labels": {"nodes": [{"name": n} for n in labels]}}
+
+    def test_list_builds_issues_query(self, storage: GitHubStorage):
+        storage._milestones_cache = {"Web": {"number": 7, "title": "Web"}}
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = self._page([self._node("status/active")])
+            items = storage.list_items(labels=["status/active"], project="Web")
+            assert [item.labels for item in items] == [["status/active"]]
+            cmd = mock_run.call_args[0][0]
+            query = next(a for a in cmd if a.startswith("query="))
+            assert "repository(owner: $owner, name: $name)" in query
+            assert "search(" not in query
+            assert "owner=owner" in cmd
+            assert "name=repo" in cmd
+            assert "states[]=OPEN" in cmd
+            assert "labels[]=status/active" in cmd
+            assert "milestone=7" in cmd
+            assert "filterBy: {milestoneNumber: $milestone}" in query
+
+    def test_list_without_project_sends_no_milestone_filter(
+        self, storage: GitHubStorage
+    ):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = self._page([self._node()])
+            storage.list_items(state="all")
+            cmd = mock_run.call_args[0][0]
+            query = next(a for a in cmd if a.startswith("query="))
+            assert "filterBy" not in query
+            assert "$milestone" not in query
+            assert not any(a.startswith(("milestone=", "states[]=")) for a in cmd)
+
+    def test_list_requires_all_labels(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = self._page(
+                [self._node("a"), self._node("a", "b"), self._node("b")]
+            )
+            items = storage.list_items(labels=["a", "b"])
+            assert [item.labels for item in items] == [["a", "b"]]
+
+    def test_list_unknown_project_is_empty(self, storage: GitHubStorage):
+        storage._milestones_cache = {}
+        with patch("subprocess.run") as mock_run:
+            assert storage.list_items(project="Nope") == []
+            mock_run.assert_not_called()
+
+    def test_list_pages_until_limit(self, storage: GitHubStorage):
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                self._page([self._node()] * 100, cursor="c1"),
+                self._page([self._node()] * 20, cursor="c2"),
+            ]
+            items = storage.list_items(limit=120)
+            assert len(items) == 120
+            second = mock_run.call_args_list[1][0][0]
+            assert "first=20" in second
+            assert "after=c1" in second
@@ -1,5 +1,8 @@
 """Tests for GTDItem dataclass and GTDStorage class methods."""
 
+import argparse
+from unittest.mock import MagicMock, patch
+
 from gtdlib.storage import GTDItem, GTDStorage
 
 
@@ -111,3 +114,24 @@ class TestGTDStorageLabels:
         required = GTDStorage.get_required_labels()
         all_labels = set(GTDStorage.get_all_labels())
         assert required == all_labels
+
+
+class TestBlockerLookups:
+    """Test that the gtd CLI looks blockers up in one get_items() call."""
+
+    def test_blocked_view_fetches_blockers_together(self, gtd_cli, capsys):
+        item = MagicMock(id="1", title="Ship it", blocked_by=[2, 3])
+        storage = MagicMock()
+        storage.get_item.return_value = item
+        storage.get_items.return_value = [
+            GTDItem(id="2", title="Design", state="closed"),
+            GTDItem(id="3", title="Review", state="closed"),
+        ]
+        args = argparse.Namespace(
+            id="1", clear=False, blockers=None, repo=None, backend=None
+        )
+        with patch.object(gtd_cli, "get_storage", return_value=storage):
+            assert gtd_cli.cmd_blocked(args) == 0
+        storage.get_items.assert_called_once_with(["2", "3"])
+        storage.get_item.assert_called_once_with("1")
+        assert "All blockers resolved!" in capsys.readouterr().out
@@ -5,6 +5,8 @@ data directories (tmp_path). Each test gets a fresh Taskwarrior database.
 """
 
 import shutil
+import subprocess
+from unittest.mock import patch
 
 import pytest
 from gtdlib.backends.taskwarrior import TaskwarriorStorage
@@ -136,6 +138,28 @@ class TestCreateItem:
         assert item.body == "Detailed description here"
 
 
+class TestCreateItems:
+    """Test batch creation via task import."""
+
+    def test_create_items_in_order(self, storage):
+        items = storage.create_items(
+            [
+                {"title": "First", "labels": ["status/active"], "project": "web"},
+                {"title": "Second", "labels": ["status/someday"], "body": "Notes"},
+            ]
+        )
+        assert [item.title for item in items] == ["First", "Second"]
+        assert items[0].project == "web"
+        assert items[1].body == "Notes"
+        assert all(item.id.isdigit() for item in items)
+
+    def test_get_items_marks_missing(self, storage):
+        created = storage.create_item(title="Find me", labels=["status/active"])
+        fetched = storage.get_items([created.id, "99999"])
+        assert fetched[0].title == "Find me"
+        assert fetched[1] is None
+
+
 class TestGetItem:
     """Test retrieving items by ID."""
 
@@ -299,6 +323,25 @@ class TestCloseReopen:
             )
 
 
+class TestDependencies:
+    """Test ID <-> UUID resolution for depends."""
+
+    def test_ids_roundtrip_through_uuids(self, storage):
+        first = storage.create_item(title="First", labels=["status/active"])
+        second = storage.create_item(title="Second", labels=["status/active"])
+        ids = [int(second.id), 99999, int(first.id)]
+        uuids = storage._ids_to_uuids(ids)
+        assert len(uuids) == 2
+        assert storage._resolve_depends(",".join(uuids)) == [
+            int(second.id),
+            int(first.id),
+        ]
+        assert storage._resolve_depends([*uuids, uuids[0]]) == [
+            int(second.id),
+            int(first.id),
+        ]
+
+
 class TestAddComment:
     """Test annotations (comments)."""
 
@@ -490,6 +533,17 @@ class TestListMilestones:
         alpha = next(m for m in milestones if m["title"] == "alpha")
         assert alpha["open_issues"] == 2
 
+    def test_export_reused_until_data_changes(self, storage):
+        storage.create_item(title="Task 1", labels=["status/active"], project="alpha")
+        with patch("subprocess.run", wraps=subprocess.run) as mock_run:
+            storage.list_milestones()
+            storage.get_milestone("alpha")
+            assert mock_run.call_count == 1
+            storage.create_item(
+                title="Task 2", labels=["status/active"], project="alpha"
+            )
+            assert storage.get_milestone("alpha")["open_issues"] == 2
+
     def test_filters_by_state(self, storage):
         item = storage.create_item(
             title="Done", labels=["status/active"], project="finished"
@@ -587,6 +641,20 @@ class TestUpdateMilestone:
         assert result is not None
         assert result["state"] == "closed"
 
+    def test_close_and_reopen_many_tasks(self, storage):
+        """Bulk changes past Taskwarrior's confirmation threshold apply to all."""
+        for i in range(5):
+            storage.create_item(title=f"T{i}", labels=["status/active"], project="big")
+        storage.create_item(title="Other", labels=["status/active"], project="big.sub")
+
+        closed = storage.update_milestone("big", state="closed")
+        assert closed["open_issues"] == 0
+        assert closed["closed_issues"] == 5
+        assert storage.get_milestone("big.sub")["open_issues"] == 1
+
+        reopened = storage.update_milestone("big", state="open")
+        assert reopened["open_issues"] == 5
+
 
 class TestDeleteMilestone:
     """Test deleting a project (removing project: from all tasks)."""
@@ -0,0 +1,195 @@
+"""Unit tests for TaskwarriorStorage.
+
+Unit tests using mocked subprocess calls. Does not require Taskwarrior
+installed, unlike the integration tests in test_taskwarrior.py.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+from gtdlib.backends.taskwarrior import (
+    _TASK_PREFIX,
+    TaskwarriorStorage,
+    _decode_json_head,
+)
+
+# --- Helpers ---
+
+
+def _task(task_id: int, uuid: str, title: str, **fields) -> dict:
+    """A task as `task export` prints it."""
+    return {
+        "id": task_id,
+        "uuid": uuid,
+        "description": title,
+        "status": "pending",
+        **fields,
+    }
+
+
+def _result(stdout: bytes = b"", returncode: int = 0) -> subprocess.CompletedProcess:
+    """Create a subprocess.CompletedProcess (task runs in bytes mode)."""
+    return subprocess.CompletedProcess([], returncode, stdout, b"")
+
+
+def _export(*tasks: dict) -> subprocess.CompletedProcess:
+    """Create a `task export` result."""
+    return _result(json.dumps(list(tasks)).encode())
+
+
+def _args(mock_run, call: int = -1) -> list[str]:
+    """Task arguments of a recorded call, without the fixed rc prefix."""
+    return mock_run.call_args_list[call][0][0][len(_TASK_PREFIX) :]
+
+
+TASKS = [
+    _task(1, "u-1", "Buy milk", tags=["gtd_status_active"], project="home"),
+    _task(2, "u-2", "Write report", tags=["gtd_status_active"], project="home"),
+]
+
+
+@pytest.fixture
+def storage(tmp_path) -> TaskwarriorStorage:
+    """TaskwarriorStorage on an empty data dir (every command is mocked)."""
+    return TaskwarriorStorage(data_dir=str(tmp_path / "taskwarrior"))
+
+
+# --- Export decoding ---
+
+
+class TestDecodeJsonHead:
+    """Test partial decoding of task export arrays."""
+
+    def test_stops_at_limit(self):
+        output = b'[\n{"id":1},\n{"id":2},\n{"id":3}\n]\n'
+        assert _decode_json_head(output, 2) == [{"id": 1}, {"id": 2}]
+
+    def test_short_array_and_empty(self):
+        assert _decode_json_head(b'[{"id":1}]', 5) == [{"id": 1}]
+        assert _decode_json_head(b"[]", 5) == []
+
+
+# --- Batched commands ---
+
+
+class TestCreateItems:
+    """Test batch creation via one task import and one export."""
+
+    def test_imports_then_exports_once(self, storage):
+        imported: list[dict] = []
+
+        def run(cmd, **kwargs):
+            if "import" in cmd:
+                imported.extend(json.loads(kwargs["input"]))
+                return _result()
+            return _export(
+                *(
+                    {**task, "id": n}
+                    for n, task in enumerate(reversed(imported), start=1)
+                )
+            )
+
+        with patch("subprocess.run", side_effect=run) as mock_run:
+            items = storage.create_items(
+                [
+                    {"title": "First", "labels": ["status/active"], "project": "web"},
+                    {"title": "Second", "labels": ["status/someday"], "body": "Notes"},
+                ]
+            )
+            assert mock_run.call_count == 2
+            assert _args(mock_run, 0) == ["import", "-"]
+        assert [item.title for item in items] == ["First", "Second"]
+        assert items[0].project == "web"
+        assert items[1].body == "Notes"
+        assert items[1].labels == ["status/someday"]
+
+
+class TestListItems:
+    """Test listing arguments."""
+
+    def test_limit_is_passed_to_taskwarrior(self, storage):
+        with patch("subprocess.run", return_value=_export(*TASKS)) as mock_run:
+            items = storage.list_items(labels=["status/active"], limit=1)
+            assert _args(mock_run) == [
+                "status:pending",
+                "+gtd_status_active",
+                "limit:1",
+                "export",
+            ]
+        # Still capped if Taskwarrior ignores limit: with export
+        assert [item.title for item in items] == ["Buy milk"]
+
+
+class TestDependencies:
+    """Test depends resolution."""
+
+    def test_resolves_deduped_uuid_array_in_one_export(self, storage):
+        completed = _task(0, "u-3", "Done", status="completed")
+        with patch(
+            "subprocess.run", return_value=_export(TASKS[1], TASKS[0], completed)
+        ) as mock_run:
+            ids = storage._resolve_depends(["u-2", "u-1", "u-2", "u-3"])
+            assert mock_run.call_count == 1
+            assert _args(mock_run) == ["u-2", "u-1", "u-3", "export"]
+        # Input order kept; completed (id 0) dependencies are skipped
+        assert ids == [2, 1]
+
+
+class TestGetExistingLabels:
+    """Test label introspection via task _tags."""
+
+    def test_reads_tags_without_exporting(self, storage):
+        output = b"gtd_context_focus\ngtd_status_active\nnext\n"
+        with patch("subprocess.run", return_value=_result(output)) as mock_run:
+            labels = storage.get_existing_labels()
+            assert _args(mock_run) == ["rc.list.all.tags=yes", "_tags"]
+        assert labels == {"context/focus", "status/active"}
+
+
+# --- Export cache ---
+
+
+class TestExportCache:
+    """Test reuse of the full export between reads."""
+
+    def test_reads_share_one_export_until_a_write(self, storage):
+        with patch("subprocess.run", return_value=_export(*TASKS)) as mock_run:
+            assert storage.list_milestones()[0]["open_issues"] == 2
+            assert storage.get_milestone("home")["open_issues"] == 2
+            assert mock_run.call_count == 1
+
+            storage.add_comment("1", "note")
+            storage.get_milestone("home")
+            assert mock_run.call_count == 3
+
+    def test_write_with_command_like_text_clears_export(self, storage):
+        with patch("subprocess.run", return_value=_export(*TASKS)) as mock_run:
+            storage.list_milestones()
+            storage.add_comment("1", "export")  # A write despite the text
+            storage.list_milestones()
+            assert mock_run.call_count == 3
+
+
+class TestDerivedItems:
+    """Test results derived from the export snapshot instead of a read-back."""
+
+    def test_add_labels_skips_read_back(self, storage):
+        with patch("subprocess.run", return_value=_export(*TASKS)) as mock_run:
+            storage.list_milestones()
+            item = storage.add_labels("1", ["context/focus"])
+            assert mock_run.call_count == 2
+            assert _args(mock_run) == ["1", "modify", "+gtd_context_focus"]
+        assert item.labels == ["status/active", "context/focus"]
+
+    def test_failed_remove_rereads_task(self, storage):
+        task = {**TASKS[0], "tags": ["gtd_status_active", "gtd_context_focus"]}
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [_export(task), _result(returncode=1), _export(task)]
+            storage.list_milestones()
+            item = storage.remove_labels("1", ["context/focus"])
+            assert _args(mock_run) == ["1", "export"]
+        assert "context/focus" in item.labels